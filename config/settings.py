@@ -103,6 +103,11 @@ else:
 
 # API Settings
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
+
+# Sentence-embedding keyword matching and near-duplicate caching (needs
+# sentence-transformers). Off by default: it downloads a model on first use
+# and changes scores, so enable it explicitly with SEMANTIC_MATCHING_ENABLED=true
+SEMANTIC_MATCHING_ENABLED = os.getenv('SEMANTIC_MATCHING_ENABLED', '').strip().lower() in ('1', 'true', 'yes')
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 # Export project root for other modules that might need it
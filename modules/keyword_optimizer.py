@@ -5,10 +5,18 @@ Provides sophisticated keyword analysis, density optimization,
 semantic variation detection, and strategic placement recommendations.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Set, Tuple, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, List, Dict, Set, Tuple, Optional
+import copy
+import hashlib
+import importlib.util
+import json
+import os
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from modules.models import ResumeModel, JobModel
 from modules.llm_keyword_extractor import (
     LLMKeywordExtractor,
@@ -16,14 +24,145 @@ from modules.llm_keyword_extractor import (
     extract_resume_keywords,
     COMPREHENSIVE_STOPWORDS
 )
+from config.settings import SEMANTIC_MATCHING_ENABLED
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-@dataclass
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Imported on first use; sentence-transformers is slow to import
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+# Keyword statuses in the order used for vectorized status counting
+KEYWORD_STATUSES = ("missing", "underutilized", "optimal", "overstuffed")
+_STATUS_IDS = {status: i for i, status in enumerate(KEYWORD_STATUSES)}
+
+
+@lru_cache(maxsize=4096)
+def _wb_pattern(term: str) -> re.Pattern:
+    """Get the compiled word-boundary pattern for a lowercased term."""
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+def _count_term(term: str, pattern: re.Pattern, text: str) -> int:
+    """
+    Count word-boundary matches of a lowercased term.
+
+    Every match is the literal term itself, so a plain substring test
+    rules out absent terms before running the regex.
+    """
+    if term not in text:
+        return 0
+    return len(pattern.findall(text))
+
+
+def _has_term(term: str, pattern: re.Pattern, text: str) -> bool:
+    """Check for a word-boundary match of a lowercased term (see _count_term)."""
+    return term in text and pattern.search(text) is not None
+
+
+def _presence(
+    terms: List[Tuple[str, re.Pattern, bool]],
+    text: str,
+    words: frozenset,
+    entries: frozenset = frozenset()
+) -> bool:
+    """
+    Check whether any (term, pattern, is_word) entry matches a section.
+
+    Single-word terms are looked up in the section's word set. Other terms
+    match when they equal a whole section entry (e.g., a listed skill) and
+    begin and end with word characters, so the entry's separators satisfy
+    both \\b anchors; otherwise their text is searched (see _count_term).
+    """
+    return any(
+        term in words if is_word
+        else (term in entries and _is_word_bounded(term)) or _has_term(term, pattern, text)
+        for term, pattern, is_word in terms
+    )
+
+
+def _is_word_bounded(term: str) -> bool:
+    """Check that a non-empty term starts and ends with a word character."""
+    return _WORD_RUN.match(term) is not None and _WORD_RUN.match(term[-1]) is not None
+
+
+# Keyword endings that already name a technology, so no "<kw> programming" forms
+_TECH_SUFFIXES = ('.js', 'js', 'py')
+
+
+@lru_cache(maxsize=4096)
+def _generate_variations(keyword_lower: str) -> Tuple[str, ...]:
+    """Generate plural/singular and technology-suffix variations of a keyword."""
+    variations = []
+
+    # Add plural/singular
+    if keyword_lower.endswith('s'):
+        variations.append(keyword_lower[:-1])
+    else:
+        variations.append(keyword_lower + 's')
+
+    # Add common suffixes for technologies
+    if not keyword_lower.endswith(_TECH_SUFFIXES):
+        variations.append(f"{keyword_lower} programming")
+        variations.append(f"{keyword_lower} development")
+
+    return tuple(variations)
+
+
+# Maximal run of word characters, matching how \b delimits words
+_WORD_RUN = re.compile(r'\w+')
+
+
+def _leading_word(term: str) -> Optional[str]:
+    """
+    Get the word a term's \\b-bounded match must start with.
+
+    A match of r'\\b' + re.escape(term) + r'\\b' that begins with a word
+    character always begins with this exact resume token, so terms whose
+    leading word is absent from the resume can be skipped without a scan.
+    Returns None for terms that start with a non-word character.
+    """
+    match = _WORD_RUN.match(term)
+    return match.group() if match else None
+
+
+def _count_in_resume(term: str, pattern: re.Pattern, leading_word: Optional[str], texts: "ResumeTexts") -> int:
+    """
+    Count word-boundary matches of a lowercased term in the whole resume.
+
+    A term that is a single word matches exactly the resume tokens equal
+    to it, so its count is a Counter lookup; other terms are only scanned
+    when their leading word occurs at all.
+    """
+    if leading_word == term:
+        return texts.words[term]
+    if leading_word is not None and leading_word not in texts.words:
+        return 0
+    return _count_term(term, pattern, texts.full)
+
+
+
+@dataclass(slots=True, frozen=True)
 class KeywordAnalysis:
-    """Analysis of a single keyword."""
+    """
+    Analysis of a single keyword.
+
+    Frozen because status and placement_quality are derived from the other
+    fields once, at construction. Use dataclasses.replace() to get an
+    analysis with changed fields; the derived fields are recomputed for it.
+    """
     keyword: str
     frequency_in_job: int
     frequency_in_resume: int
@@ -44,17 +183,23 @@ class KeywordAnalysis:
     # Weighting
     importance_weight: float = 1.0  # 1.0 = normal, 2.0 = critical, 0.5 = nice-to-have
 
-    @property
-    def status(self) -> str:
+    # Derived once at construction; statistics and insights read these per keyword
+    status: str = field(init=False, default="")
+    placement_quality: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        object.__setattr__(self, "status", self._compute_status())
+        object.__setattr__(self, "placement_quality", self._compute_placement_quality())
+
+    def _compute_status(self) -> str:
         """Get keyword status."""
         if self.current_density == 0:
             return "missing"
-        elif self.current_density < self.target_density[0]:
-            return "underutilized"
-        elif self.current_density > self.target_density[1]:
-            return "overstuffed"
-        else:
-            return "optimal"
+        # Below the minimum is "underutilized"; from there, +1 if past the maximum
+        reached_min = self.current_density >= self.target_density[0]
+        return KEYWORD_STATUSES[
+            1 + reached_min * (1 + (self.current_density > self.target_density[1]))
+        ]
 
     @property
     def recommendation(self) -> str:
@@ -70,8 +215,7 @@ class KeywordAnalysis:
         else:
             return "Optimal usage"
 
-    @property
-    def placement_quality(self) -> float:
+    def _compute_placement_quality(self) -> float:
         """
         Score placement quality (0.0 to 1.0).
 
@@ -94,7 +238,91 @@ class KeywordAnalysis:
         return score
 
 
-@dataclass
+# Bits of KeywordAnalysisArray.flags
+FLAG_REQUIRED = 1
+FLAG_PREFERRED = 2
+FLAG_IN_SUMMARY = 4
+FLAG_IN_EXPERIENCE = 8
+FLAG_IN_SKILLS = 16
+
+
+@dataclass(slots=True)
+class KeywordAnalysisArray:
+    """
+    Numeric fields of many KeywordAnalysis objects as parallel NumPy arrays.
+
+    Used for statistics only; KeywordAnalysis remains the public per-keyword
+    API. Status and placement quality are derived with the same rules as
+    KeywordAnalysis, vectorized over all keywords.
+    """
+    keywords: "np.ndarray"  # object array of keyword strings
+    current: "np.ndarray"  # int64 current density
+    min_target: "np.ndarray"  # int64
+    max_target: "np.ndarray"  # int64
+    weight: "np.ndarray"  # float64 importance weight
+    flags: "np.ndarray"  # uint8 bitfield of FLAG_* values
+
+    @classmethod
+    def from_analyses(cls, analyses: List[KeywordAnalysis]) -> "KeywordAnalysisArray":
+        """Read each analysis once into the parallel arrays."""
+        count = len(analyses)
+        keywords = np.empty(count, dtype=object)
+        keywords[:] = [kw.keyword for kw in analyses]
+        return cls(
+            keywords=keywords,
+            current=np.fromiter((kw.current_density for kw in analyses), dtype=np.int64, count=count),
+            min_target=np.fromiter((kw.target_density[0] for kw in analyses), dtype=np.int64, count=count),
+            max_target=np.fromiter((kw.target_density[1] for kw in analyses), dtype=np.int64, count=count),
+            weight=np.fromiter((kw.importance_weight for kw in analyses), dtype=np.float64, count=count),
+            flags=np.fromiter(
+                (
+                    kw.is_required * FLAG_REQUIRED
+                    | kw.is_preferred * FLAG_PREFERRED
+                    | kw.appears_in_summary * FLAG_IN_SUMMARY
+                    | kw.appears_in_experience * FLAG_IN_EXPERIENCE
+                    | kw.appears_in_skills * FLAG_IN_SKILLS
+                    for kw in analyses
+                ),
+                dtype=np.uint8,
+                count=count
+            )
+        )
+
+    def reshape(self, shape: Tuple[int, ...]) -> "KeywordAnalysisArray":
+        """View every array with a new shape, e.g. (resumes, keywords)."""
+        return KeywordAnalysisArray(
+            keywords=self.keywords.reshape(shape),
+            current=self.current.reshape(shape),
+            min_target=self.min_target.reshape(shape),
+            max_target=self.max_target.reshape(shape),
+            weight=self.weight.reshape(shape),
+            flags=self.flags.reshape(shape)
+        )
+
+    def has_flag(self, flag: int) -> "np.ndarray":
+        """Boolean mask of keywords with the given FLAG_* bit set."""
+        return (self.flags & flag) != 0
+
+    @property
+    def status_ids(self) -> "np.ndarray":
+        """Index into KEYWORD_STATUSES for every keyword."""
+        return np.select(
+            [self.current == 0, self.current < self.min_target, self.current > self.max_target],
+            [_STATUS_IDS["missing"], _STATUS_IDS["underutilized"], _STATUS_IDS["overstuffed"]],
+            default=_STATUS_IDS["optimal"]
+        ).astype(np.int8)
+
+    @property
+    def placement_quality(self) -> "np.ndarray":
+        """Placement quality for every keyword (0.0 to 1.0)."""
+        score = np.zeros(self.flags.shape)
+        score += np.where(self.has_flag(FLAG_IN_SUMMARY), 0.4, 0.0)
+        score += np.where(self.has_flag(FLAG_IN_EXPERIENCE), 0.4, 0.0)
+        score += np.where(self.has_flag(FLAG_IN_SKILLS), 0.2, 0.0)
+        return score
+
+
+@dataclass(slots=True)
 class KeywordOptimizationReport:
     """Complete keyword optimization report."""
 
@@ -137,6 +365,48 @@ class KeywordOptimizationReport:
             return "F"
 
 
+@dataclass(slots=True)
+class CompiledKeyword:
+    """Resume-independent matching data for a single job keyword."""
+    keyword: str
+    job_freq: int
+    pattern: re.Pattern  # Word-boundary pattern for the keyword itself
+    leading_word: Optional[str]  # See _leading_word()
+    variations: List[str]
+    variation_patterns: Tuple[Tuple[str, re.Pattern, Optional[str]], ...]  # (lowercased variation, pattern, leading word)
+    target_density: Tuple[int, int]  # (min, max) occurrences
+    is_required: bool
+    is_preferred: bool
+    importance_weight: float
+
+
+@dataclass(slots=True)
+class CompiledJob:
+    """
+    Job keywords precompiled for analysis.
+
+    Built once by KeywordOptimizer.compile_for_job() and reusable across any
+    number of resumes via KeywordOptimizer.analyze_resume().
+    """
+    job: JobModel
+    target_density_multiplier: float
+    keywords: List[CompiledKeyword] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ResumeTexts:
+    """Lowercased resume text, whole and per section, shared by all keywords."""
+    full: str
+    summary: str
+    experience: str
+    skills: str
+    words: Counter  # Word token counts of the full text
+    summary_words: frozenset  # Distinct word tokens of each section
+    experience_words: frozenset
+    skills_words: frozenset
+    skill_entries: frozenset  # Lowercased resume.skills entries
+
+
 class KeywordOptimizer:
     """
     Advanced keyword optimization engine.
@@ -219,11 +489,78 @@ class KeywordOptimizer:
         'communication': ['communicate', 'communicating'],
     }
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize keyword optimizer with LLM extractor."""
-        self.llm_extractor = LLMKeywordExtractor(api_key=api_key)
+    # Compiled word-boundary patterns for SEMANTIC_VARIATIONS, built on first use
+    _variation_patterns: Optional[Dict[str, Tuple[Tuple[str, re.Pattern, Optional[str]], ...]]] = None
+    _variation_patterns_lock = threading.Lock()
+
+    # Fuzzy matching of misspelled keywords (requires rapidfuzz)
+    FUZZY_MATCH_CUTOFF = 90  # Minimum fuzz.ratio score for a near-match
+    FUZZY_MIN_KEYWORD_LENGTH = 5  # Shorter keywords produce too many false matches
+
+    # Semantic matching of paraphrased keywords (requires sentence-transformers)
+    SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+    SEMANTIC_MATCH_THRESHOLD = 0.87  # Minimum cosine similarity for a paraphrase
+    SEMANTIC_CACHE_SIZE = 4096  # Keyword embeddings kept across analyses
+    JOB_SEMANTIC_CACHE_THRESHOLD = 0.87  # Cosine similarity for reusing a posting's keywords
+    _embedding_model = None
+    _embedding_model_lock = threading.Lock()
+    _term_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+    _term_embeddings_lock = threading.Lock()
+
+    # Keyword count at which summary statistics switch to NumPy arrays;
+    # below this the array setup costs more than the Python loop it replaces
+    VECTORIZE_MIN_KEYWORDS = 500
+
+    # Resumes and jobs whose derived texts are kept per optimizer (see _cached_for)
+    OBJECT_CACHE_SIZE = 64
+
+    def __init__(self, api_key: Optional[str] = None, semantic_matching: Optional[bool] = None):
+        """
+        Initialize keyword optimizer with LLM extractor.
+
+        Args:
+            api_key: Anthropic API key (optional, will use env var if not provided)
+            semantic_matching: Use sentence embeddings to credit paraphrased
+                               keywords and to reuse the keywords of
+                               near-duplicate job postings (default:
+                               SEMANTIC_MATCHING_ENABLED setting, off unless
+                               configured). Needs sentence-transformers.
+        """
+        if semantic_matching is None:
+            semantic_matching = SEMANTIC_MATCHING_ENABLED
+        self.semantic_matching = semantic_matching
+        self.llm_extractor = LLMKeywordExtractor(api_key=api_key, semantic_cache=semantic_matching)
+        # Values derived from resumes and jobs, keyed by (id(obj), kind) and
+        # evicted least recently used first (see _cached_for)
+        self._object_cache: "OrderedDict[Tuple[int, str], Tuple[Any, Any, Any]]" = OrderedDict()
         logger.info("KeywordOptimizer initialized with LLM extraction support")
 
+    @classmethod
+    def _get_variation_patterns(cls) -> Dict[str, Tuple[Tuple[str, re.Pattern, Optional[str]], ...]]:
+        """
+        Get compiled patterns for every predefined semantic variation.
+
+        The table is built once per class and shared by all optimizer
+        instances, so repeated analyses never recompile variation patterns.
+        """
+        if cls._variation_patterns is None:
+            with cls._variation_patterns_lock:
+                if cls._variation_patterns is None:
+                    cls._variation_patterns = {
+                        keyword: tuple(
+                            cls._compile_variation(var)
+                            for var in variations
+                        )
+                        for keyword, variations in cls.SEMANTIC_VARIATIONS.items()
+                    }
+        return cls._variation_patterns
+
+    @staticmethod
+    def _compile_variation(var: str) -> Tuple[str, re.Pattern, Optional[str]]:
+        """Compile a variation's word-boundary pattern alongside its leading word."""
+        var_lower = var.lower()
+        return (var_lower, _wb_pattern(var_lower), _leading_word(var_lower))
+
     def analyze(
         self,
         resume: ResumeModel,
@@ -242,27 +579,180 @@ class KeywordOptimizer:
         Returns:
             KeywordOptimizationReport with detailed analysis
         """
-        report = KeywordOptimizationReport()
+        compiled_job = self.compile_for_job(job, target_density_multiplier)
+        return self.analyze_resume(compiled_job, resume)
 
-        # Get all keywords from job
-        all_job_keywords = self._extract_job_keywords(job)
+    def compile_for_job(
+        self,
+        job: JobModel,
+        target_density_multiplier: float = 1.5
+    ) -> CompiledJob:
+        """
+        Precompute all job-dependent analysis state.
+
+        Extracts the job keywords and resolves their patterns, variations,
+        target densities and importance once. Pass the result to
+        analyze_resume() to score many resumes against the same job.
+
+        Args:
+            job: Job description to optimize for
+            target_density_multiplier: How many times more than job description
+                                      should keyword appear in resume (default: 1.5x)
+
+        Returns:
+            CompiledJob ready for analyze_resume()
+        """
+        compiled_job = CompiledJob(job=job, target_density_multiplier=target_density_multiplier)
+
+        # Get all keywords from job, merging case/whitespace duplicates
+        all_job_keywords = self._merge_duplicate_keywords(self._extract_job_keywords(job))
+        if not all_job_keywords:
+            return compiled_job
+
+        required_skills = frozenset(s.strip().lower() for s in job.required_skills)
+        preferred_skills = frozenset(s.strip().lower() for s in job.preferred_skills)
 
-        # Analyze each keyword
         for keyword, job_freq in all_job_keywords.items():
-            analysis = self._analyze_keyword(
+            compiled_job.keywords.append(self._compile_keyword(
                 keyword=keyword,
                 job_freq=job_freq,
-                resume=resume,
-                job=job,
+                required_skills=required_skills,
+                preferred_skills=preferred_skills,
                 target_multiplier=target_density_multiplier
-            )
-            report.keywords.append(analysis)
+            ))
+
+        return compiled_job
+
+    def analyze_resume(
+        self,
+        compiled_job: CompiledJob,
+        resume: ResumeModel
+    ) -> KeywordOptimizationReport:
+        """
+        Analyze a resume against a precompiled job.
+
+        Args:
+            compiled_job: Result of compile_for_job()
+            resume: Resume to analyze
+
+        Returns:
+            KeywordOptimizationReport with detailed analysis
+        """
+        report = self._analyze_keywords(compiled_job, resume)
+        if not report.keywords:
+            return report
 
         # Calculate summary statistics
         self._calculate_statistics(report)
 
         # Generate strategic insights
-        self._generate_insights(report, job)
+        self._generate_insights(report, compiled_job.job)
+
+        return report
+
+    def analyze_batch(
+        self,
+        resumes: List[ResumeModel],
+        job: JobModel,
+        target_density_multiplier: float = 1.5
+    ) -> List[KeywordOptimizationReport]:
+        """
+        Analyze several candidate resumes against the same job.
+
+        The job is compiled once, so keyword extraction and pattern
+        preparation are shared by every resume in the batch.
+
+        Args:
+            resumes: Resumes to analyze
+            job: Job description to optimize for
+            target_density_multiplier: How many times more than job description
+                                      should keyword appear in resume (default: 1.5x)
+
+        Returns:
+            One KeywordOptimizationReport per resume, in input order
+        """
+        compiled_job = self.compile_for_job(job, target_density_multiplier)
+        reports = [self._analyze_keywords(compiled_job, resume) for resume in resumes]
+        if not compiled_job.keywords:
+            return reports
+
+        # Score the whole batch as resume x keyword matrices when large enough
+        if NUMPY_AVAILABLE and len(reports) * len(compiled_job.keywords) >= self.VECTORIZE_MIN_KEYWORDS:
+            self._calculate_batch_statistics(reports)
+        else:
+            for report in reports:
+                self._calculate_statistics(report)
+
+        for report in reports:
+            self._generate_insights(report, job)
+
+        return reports
+
+    def analyze_many(
+        self,
+        resumes: List[ResumeModel],
+        job: JobModel,
+        target_density_multiplier: float = 1.5,
+        max_workers: Optional[int] = None
+    ) -> List[KeywordOptimizationReport]:
+        """
+        Analyze many resumes against the same job across CPU cores.
+
+        The job is compiled once in this process and handed to each worker
+        when it starts, so only the resumes and reports cross process
+        boundaries per task. Small batches are analyzed in-process.
+
+        Args:
+            resumes: Resumes to analyze
+            job: Job description to optimize for
+            target_density_multiplier: How many times more than job description
+                                      should keyword appear in resume (default: 1.5x)
+            max_workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            One KeywordOptimizationReport per resume, in input order
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(resumes))
+        if workers <= 1:
+            return self.analyze_batch(resumes, job, target_density_multiplier)
+
+        compiled_job = self.compile_for_job(job, target_density_multiplier)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_analysis_worker,
+            initargs=(compiled_job, self.semantic_matching)
+        ) as executor:
+            return list(executor.map(
+                _analyze_in_worker,
+                resumes,
+                chunksize=max(1, min(8, len(resumes) // workers))
+            ))
+
+    def _analyze_keywords(
+        self,
+        compiled_job: CompiledJob,
+        resume: ResumeModel
+    ) -> KeywordOptimizationReport:
+        """Build a report holding one KeywordAnalysis per job keyword, without scores."""
+        report = KeywordOptimizationReport()
+        if not compiled_job.keywords:
+            return report
+
+        # Flatten and lowercase the resume once for all keywords
+        texts = self._get_resume_texts(resume)
+
+        # Analyze each keyword
+        for compiled_keyword in compiled_job.keywords:
+            report.keywords.append(self._analyze_keyword(compiled_keyword, texts))
+
+        # Catch misspellings (e.g., "kubernates") when nothing matched exactly
+        if RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE:
+            self._apply_fuzzy_variations(report, texts)
+
+        # Catch paraphrases (e.g., "container platform" for "docker") last,
+        # for keywords that neither exact nor fuzzy matching found
+        if self.semantic_matching and SENTENCE_TRANSFORMERS_AVAILABLE and NUMPY_AVAILABLE:
+            self._apply_semantic_variations(report, resume)
 
         return report
 
@@ -270,13 +760,68 @@ class KeywordOptimizer:
         """
         Extract keywords from job description with frequency counts using LLM.
 
+        The result is reused for the same, unchanged job object, so analyze()
+        and get_keyword_heatmap() on one job call the LLM only once.
+
         Returns:
             Dictionary mapping keyword to frequency in job description
         """
+        keywords, _is_final = self._get_job_keywords(job)
+        return dict(keywords)
+
+    def _job_keywords_are_final(self, job: JobModel) -> bool:
+        """
+        Check whether the job's keywords are worth keeping beyond this object.
+
+        False when the LLM was called for the job's raw text but the keywords
+        came from the rule-based fallback, so a later call should retry.
+        """
+        _keywords, is_final = self._get_job_keywords(job)
+        return is_final
+
+    def _get_job_keywords(self, job: JobModel) -> Tuple[Dict[str, int], bool]:
+        """Get the job's keywords and whether they are final, reused per job object."""
+        fingerprint = (
+            job.raw_text,
+            tuple(job.required_skills),
+            tuple(job.preferred_skills),
+            job.description
+        )
+        return self._cached_for(
+            job, "keywords", fingerprint,
+            lambda: self._extract_job_keywords_uncached(job)
+        )
+
+    def _extract_job_keywords_uncached(self, job: JobModel) -> Tuple[Dict[str, int], bool]:
+        """Run keyword extraction for _get_job_keywords()."""
         logger.info("Extracting job keywords with LLM")
 
         # Use LLM extractor if we have raw text
         if job.raw_text:
+            cache_key = _job_keywords_cache_key(job)
+            with _job_keywords_cache_lock:
+                cached = _job_keywords_cache.get(cache_key)
+                if cached is not None:
+                    _job_keywords_cache.move_to_end(cache_key)
+                    logger.debug("Job keyword cache hit")
+                    return dict(cached[0]), True
+
+            # Reworded or reformatted copies of a cached posting reuse its
+            # keywords. Without skills to compare, postings sharing company
+            # boilerplate would look alike, so those are never matched.
+            skills = (tuple(sorted(job.required_skills)), tuple(sorted(job.preferred_skills)))
+            job_vector = None
+            if (
+                self.semantic_matching
+                and any(skills)
+                and SENTENCE_TRANSFORMERS_AVAILABLE
+                and NUMPY_AVAILABLE
+            ):
+                job_vector, similar_keywords = self._find_similar_job_keywords(job.raw_text, skills)
+                if similar_keywords is not None:
+                    logger.debug("Job keyword semantic cache hit")
+                    return dict(similar_keywords), True
+
             extraction_result = self.llm_extractor.extract_from_job_description(
                 job_text=job.raw_text,
                 required_skills=job.required_skills,
@@ -286,8 +831,21 @@ class KeywordOptimizer:
             # Get weighted keywords from LLM extraction
             weighted_keywords = extraction_result.get_weighted_keywords()
 
+            # Only LLM results are worth keeping; rule-based ones are cheap to
+            # redo and would otherwise shadow a later successful LLM call
+            if extraction_result.is_llm_extracted:
+                with _job_keywords_cache_lock:
+                    _job_keywords_cache[cache_key] = (dict(weighted_keywords), skills, job_vector)
+                    while len(_job_keywords_cache) > JOB_KEYWORDS_CACHE_SIZE:
+                        _job_keywords_cache.popitem(last=False)
+
             logger.info(f"LLM extracted {len(weighted_keywords)} weighted keywords from job")
-            return weighted_keywords
+            return weighted_keywords, extraction_result.is_llm_extracted
+
+        # Nothing to extract from
+        elif not (job.required_skills or job.preferred_skills or job.description):
+            logger.warning("Job has no raw text, skills, or description; no keywords to analyze")
+            return {}, True
 
         # Fallback: Use structured skills only (old behavior, but improved)
         else:
@@ -310,43 +868,90 @@ class KeywordOptimizer:
                     if word not in COMPREHENSIVE_STOPWORDS:
                         keywords[word] += 1
 
-            return dict(keywords)
+            return dict(keywords), True
 
-    def _analyze_keyword(
+    def _find_similar_job_keywords(
+        self,
+        job_text: str,
+        skills: Tuple[Tuple[str, ...], Tuple[str, ...]]
+    ) -> Tuple["np.ndarray", Optional[Dict[str, int]]]:
+        """
+        Look up cached keywords of a near-duplicate job posting.
+
+        Only postings with the same, non-empty sorted required and preferred
+        skills are compared, so shared company boilerplate alone cannot
+        produce a hit.
+
+        Returns:
+            Tuple of (embedding of job_text, cached keywords or None)
+        """
+        job_vector = self._get_embedding_model().encode(
+            [job_text], normalize_embeddings=True, convert_to_numpy=True
+        )[0]
+
+        with _job_keywords_cache_lock:
+            candidates = [
+                (key, keywords, vector)
+                for key, (keywords, entry_skills, vector) in _job_keywords_cache.items()
+                if vector is not None and entry_skills == skills
+            ]
+        if not candidates:
+            return job_vector, None
+
+        similarities = np.vstack([vector for _key, _keywords, vector in candidates]) @ job_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.JOB_SEMANTIC_CACHE_THRESHOLD:
+            return job_vector, None
+
+        best_key, best_keywords, _vector = candidates[best]
+        with _job_keywords_cache_lock:
+            if best_key in _job_keywords_cache:
+                _job_keywords_cache.move_to_end(best_key)
+        return job_vector, best_keywords
+
+    @staticmethod
+    def _merge_duplicate_keywords(keywords: Dict[str, int]) -> Dict[str, int]:
+        """
+        Merge keywords that differ only by case or surrounding whitespace.
+
+        Frequencies of merged keywords are summed so each distinct keyword
+        is analyzed exactly once. Empty keywords are dropped.
+        """
+        merged: Dict[str, int] = {}
+        for keyword, freq in keywords.items():
+            normalized = keyword.strip().lower()
+            if normalized:
+                merged[normalized] = merged.get(normalized, 0) + freq
+        return merged
+
+    def _compile_keyword(
         self,
         keyword: str,
         job_freq: int,
-        resume: ResumeModel,
-        job: JobModel,
+        required_skills: frozenset,
+        preferred_skills: frozenset,
         target_multiplier: float
-    ) -> KeywordAnalysis:
-        """Analyze a single keyword with intelligent semantic matching."""
-
-        # Count occurrences in resume using word boundaries for accuracy
-        resume_text = self._get_resume_text(resume).lower()
+    ) -> CompiledKeyword:
+        """Resolve patterns, variations and targets for a normalized keyword."""
 
         # Use word boundaries to avoid false matches (e.g., "react" in "create")
-        keyword_pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        current_count = len(re.findall(keyword_pattern, resume_text))
+        pattern = _wb_pattern(keyword)
 
-        # Find semantic variations
+        # Find semantic variations (predefined ones come precompiled)
         variations = self._find_variations(keyword)
-        variations_in_resume = []
-
-        # Count variations using word boundaries
-        for var in variations:
-            var_pattern = r'\b' + re.escape(var.lower()) + r'\b'
-            if re.search(var_pattern, resume_text):
-                variations_in_resume.append(var)
-                # Add variation counts to current count
-                current_count += len(re.findall(var_pattern, resume_text))
+        variation_patterns = self._get_variation_patterns().get(keyword)
+        if variation_patterns is None:
+            variation_patterns = tuple(
+                self._compile_variation(var)
+                for var in variations
+            )
 
         # Calculate target density
         # Rule: Keyword should appear 1.5x more in resume than in job description
         # Minimum: 2 occurrences for required skills, 1 for preferred
         # Maximum: 5x job frequency (to avoid stuffing)
-        is_required = keyword.lower() in [s.lower() for s in job.required_skills]
-        is_preferred = keyword.lower() in [s.lower() for s in job.preferred_skills]
+        is_required = keyword in required_skills
+        is_preferred = keyword in preferred_skills
 
         if is_required:
             min_target = max(2, int(job_freq * target_multiplier))
@@ -360,45 +965,69 @@ class KeywordOptimizer:
 
         max_target = min(min_target + 3, job_freq * 5)  # Cap at 5x or +3
 
-        # Analyze placement with word boundary matching
-        summary_text = (resume.summary or '').lower() + ' ' + (resume.headline or '').lower()
-        appears_in_summary = bool(re.search(keyword_pattern, summary_text))
+        return CompiledKeyword(
+            keyword=keyword,
+            job_freq=job_freq,
+            pattern=pattern,
+            leading_word=_leading_word(keyword),
+            variations=variations,
+            variation_patterns=variation_patterns,
+            target_density=(min_target, max_target),
+            is_required=is_required,
+            is_preferred=is_preferred,
+            importance_weight=importance_weight
+        )
 
-        # Check in experience bullets
-        experience_text = ' '.join([
-            ' '.join(exp.bullets or [])
-            for exp in resume.experiences
-        ]).lower()
-        appears_in_experience = bool(re.search(keyword_pattern, experience_text))
-
-        # Check in skills section
-        skills_text = ' '.join(resume.skills).lower()
-        appears_in_skills = bool(re.search(keyword_pattern, skills_text))
-
-        # Also check for variations in each section
-        for var in variations_in_resume:
-            var_pattern = r'\b' + re.escape(var.lower()) + r'\b'
-            if not appears_in_summary and re.search(var_pattern, summary_text):
-                appears_in_summary = True
-            if not appears_in_experience and re.search(var_pattern, experience_text):
-                appears_in_experience = True
-            if not appears_in_skills and re.search(var_pattern, skills_text):
-                appears_in_skills = True
+    def _analyze_keyword(
+        self,
+        compiled_keyword: CompiledKeyword,
+        texts: ResumeTexts
+    ) -> KeywordAnalysis:
+        """Analyze a single keyword with intelligent semantic matching."""
+        keyword = compiled_keyword.keyword
+        keyword_pattern = compiled_keyword.pattern
+
+        # Count occurrences in resume using word boundaries for accuracy
+        leading_word = compiled_keyword.leading_word
+        current_count = _count_in_resume(keyword, keyword_pattern, leading_word, texts)
+        keyword_present = leading_word is None or leading_word in texts.words
+
+        variations_in_resume = []
+        matched_variation_terms = []
+
+        # Count variations using word boundaries
+        for var, var_pattern, var_leading_word in compiled_keyword.variation_patterns:
+            var_count = _count_in_resume(var, var_pattern, var_leading_word, texts)
+            if var_count:
+                variations_in_resume.append(var)
+                matched_variation_terms.append((var, var_pattern, var_leading_word == var))
+                # Add variation counts to current count
+                current_count += var_count
+
+        # Analyze placement with word boundary matching; the keyword and its
+        # matched variations are checked together, stopping at the first hit
+        placement_terms = matched_variation_terms
+        if keyword_present:
+            placement_terms = [(keyword, keyword_pattern, leading_word == keyword)] + matched_variation_terms
+
+        appears_in_summary = _presence(placement_terms, texts.summary, texts.summary_words)
+        appears_in_experience = _presence(placement_terms, texts.experience, texts.experience_words)
+        appears_in_skills = _presence(placement_terms, texts.skills, texts.skills_words, texts.skill_entries)
 
         return KeywordAnalysis(
             keyword=keyword,
-            frequency_in_job=job_freq,
+            frequency_in_job=compiled_keyword.job_freq,
             frequency_in_resume=current_count,
-            target_density=(min_target, max_target),
+            target_density=compiled_keyword.target_density,
             current_density=current_count,
-            is_required=is_required,
-            is_preferred=is_preferred,
-            variations=variations,
+            is_required=compiled_keyword.is_required,
+            is_preferred=compiled_keyword.is_preferred,
+            variations=compiled_keyword.variations,
             variations_in_resume=variations_in_resume,
             appears_in_summary=appears_in_summary,
             appears_in_experience=appears_in_experience,
             appears_in_skills=appears_in_skills,
-            importance_weight=importance_weight
+            importance_weight=compiled_keyword.importance_weight
         )
 
     def _find_variations(self, keyword: str) -> List[str]:
@@ -409,21 +1038,151 @@ class KeywordOptimizer:
         if keyword_lower in self.SEMANTIC_VARIATIONS:
             return self.SEMANTIC_VARIATIONS[keyword_lower]
 
-        # Generate automatic variations
-        variations = []
+        # Generate automatic variations (memoized per keyword)
+        return list(_generate_variations(keyword_lower))
 
-        # Add plural/singular
-        if keyword_lower.endswith('s'):
-            variations.append(keyword_lower[:-1])
-        else:
-            variations.append(keyword_lower + 's')
+    def _apply_fuzzy_variations(self, report: KeywordOptimizationReport, texts: ResumeTexts):
+        """
+        Credit missing single-word keywords with near-match resume tokens.
 
-        # Add common suffixes for technologies
-        if not any(keyword_lower.endswith(suffix) for suffix in ['.js', 'js', 'py']):
-            variations.append(f"{keyword_lower} programming")
-            variations.append(f"{keyword_lower} development")
+        All eligible keywords are scored against the distinct resume tokens
+        in one rapidfuzz cdist() call. Tokens scoring at least
+        FUZZY_MATCH_CUTOFF count as variations, best match first.
+        """
+        candidates = [
+            i for i, kw in enumerate(report.keywords)
+            if kw.current_density == 0
+            and len(kw.keyword) >= self.FUZZY_MIN_KEYWORD_LENGTH
+            and re.fullmatch(r'\w+', kw.keyword.lower())
+        ]
+        if not candidates or not texts.words:
+            return
 
-        return variations
+        tokens = list(texts.words)
+        scores = fuzz_process.cdist(
+            [report.keywords[i].keyword.lower() for i in candidates],
+            tokens,
+            scorer=fuzz.ratio,
+            score_cutoff=self.FUZZY_MATCH_CUTOFF,
+            dtype=np.float64
+        )
+
+        for row, index in enumerate(candidates):
+            hits = np.flatnonzero(scores[row] >= self.FUZZY_MATCH_CUTOFF)
+            if not hits.size:
+                continue
+
+            kw = report.keywords[index]
+            matched = [tokens[hit] for hit in sorted(hits, key=lambda hit: (-scores[row, hit], hit))]
+            count = sum(texts.words[token] for token in matched)
+            report.keywords[index] = replace(
+                kw,
+                frequency_in_resume=count,
+                current_density=count,
+                variations_in_resume=kw.variations_in_resume + matched,
+                appears_in_summary=kw.appears_in_summary or any(t in texts.summary_words for t in matched),
+                appears_in_experience=kw.appears_in_experience or any(t in texts.experience_words for t in matched),
+                appears_in_skills=kw.appears_in_skills or any(t in texts.skills_words for t in matched)
+            )
+
+    @classmethod
+    def _get_embedding_model(cls):
+        """Load the sentence embedding model once per process."""
+        if cls._embedding_model is None:
+            with cls._embedding_model_lock:
+                if cls._embedding_model is None:
+                    from sentence_transformers import SentenceTransformer
+                    cls._embedding_model = SentenceTransformer(cls.SEMANTIC_MODEL_NAME)
+        return cls._embedding_model
+
+    def _embed_terms(self, terms: List[str]) -> "np.ndarray":
+        """
+        Embed keywords, reusing cached vectors and encoding misses in one batch.
+
+        Returns:
+            Matrix of unit-length embeddings, one row per term
+        """
+        cache = self._term_embeddings
+        unique_terms = list(dict.fromkeys(terms))
+
+        with self._term_embeddings_lock:
+            vectors = {term: cache[term] for term in unique_terms if term in cache}
+            for term in vectors:
+                cache.move_to_end(term)
+
+        missing = [term for term in unique_terms if term not in vectors]
+        if missing:
+            encoded = self._get_embedding_model().encode(
+                missing, normalize_embeddings=True, convert_to_numpy=True
+            )
+            vectors.update(zip(missing, encoded))
+            with self._term_embeddings_lock:
+                for term, vector in zip(missing, encoded):
+                    cache[term] = vector
+                while len(cache) > self.SEMANTIC_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return np.vstack([vectors[term] for term in terms])
+
+    def _get_resume_phrases(self, resume: ResumeModel) -> List[Tuple[str, str]]:
+        """Split the resume into (phrase, section) pairs for semantic matching."""
+        phrases = []
+
+        for text in (resume.summary, resume.headline):
+            for sentence in re.split(r'(?<=[.!?])\s+', text or ''):
+                if sentence.strip():
+                    phrases.append((sentence.strip(), 'summary'))
+
+        for exp in resume.experiences:
+            for bullet in exp.bullets or []:
+                if bullet.strip():
+                    phrases.append((bullet.strip(), 'experience'))
+
+        for skill in resume.skills:
+            if skill.strip():
+                phrases.append((skill.strip(), 'skills'))
+
+        return phrases
+
+    def _apply_semantic_variations(self, report: KeywordOptimizationReport, resume: ResumeModel):
+        """
+        Credit missing keywords with resume phrases that paraphrase them.
+
+        Missing keywords and resume phrases are each embedded once, and all
+        pairs are scored with a single matrix product. Every phrase at or
+        above SEMANTIC_MATCH_THRESHOLD counts as one variation occurrence.
+        """
+        missing = [i for i, kw in enumerate(report.keywords) if kw.current_density == 0]
+        if not missing:
+            return
+        phrases = self._get_resume_phrases(resume)
+        if not phrases:
+            return
+
+        keyword_vectors = self._embed_terms([report.keywords[i].keyword for i in missing])
+        phrase_vectors = self._get_embedding_model().encode(
+            [phrase for phrase, _section in phrases],
+            normalize_embeddings=True,
+            convert_to_numpy=True
+        )
+        similarities = keyword_vectors @ phrase_vectors.T
+
+        for row, index in enumerate(missing):
+            hits = np.flatnonzero(similarities[row] >= self.SEMANTIC_MATCH_THRESHOLD)
+            if not hits.size:
+                continue
+
+            matched = [phrases[hit] for hit in hits]
+            sections = {section for _phrase, section in matched}
+            report.keywords[index] = replace(
+                report.keywords[index],
+                frequency_in_resume=len(matched),
+                current_density=len(matched),
+                variations_in_resume=[phrase.lower() for phrase, _section in matched],
+                appears_in_summary='summary' in sections,
+                appears_in_experience='experience' in sections,
+                appears_in_skills='skills' in sections
+            )
 
     def _calculate_statistics(self, report: KeywordOptimizationReport):
         """Calculate summary statistics for report."""
@@ -432,33 +1191,42 @@ class KeywordOptimizer:
         if report.total_keywords_analyzed == 0:
             return
 
-        # Count by status
-        for kw in report.keywords:
-            if kw.status == "missing":
-                report.missing_keywords += 1
-            elif kw.status == "underutilized":
-                report.underutilized_keywords += 1
-            elif kw.status == "optimal":
-                report.optimal_keywords += 1
-            elif kw.status == "overstuffed":
-                report.overstuffed_keywords += 1
-
-        # Calculate coverage score (what % of keywords are present)
-        present_keywords = [kw for kw in report.keywords if kw.current_density > 0]
-        report.keyword_coverage_score = len(present_keywords) / report.total_keywords_analyzed
-
-        # Calculate density score (what % of keywords have optimal density)
-        optimal_density = [kw for kw in report.keywords if kw.status == "optimal"]
-        report.keyword_density_score = len(optimal_density) / report.total_keywords_analyzed
-
-        # Calculate placement score (average placement quality, weighted by importance)
-        total_weight = sum(kw.importance_weight for kw in report.keywords)
-        weighted_placement = sum(
-            kw.placement_quality * kw.importance_weight
-            for kw in report.keywords
-        )
-        report.keyword_placement_score = weighted_placement / total_weight if total_weight > 0 else 0
-
+        if NUMPY_AVAILABLE and report.total_keywords_analyzed >= self.VECTORIZE_MIN_KEYWORDS:
+            self._calculate_statistics_vectorized(report)
+        else:
+            # Tally statuses, presence and weighted placement in one pass
+            status_counts = [0] * len(KEYWORD_STATUSES)
+            present_keywords = 0
+            total_weight = 0
+            weighted_placement = 0
+            for kw in report.keywords:
+                status_counts[_STATUS_IDS[kw.status]] += 1
+                if kw.current_density > 0:
+                    present_keywords += 1
+                total_weight += kw.importance_weight
+                weighted_placement += kw.placement_quality * kw.importance_weight
+
+            (
+                report.missing_keywords,
+                report.underutilized_keywords,
+                report.optimal_keywords,
+                report.overstuffed_keywords,
+            ) = status_counts
+
+            # Calculate coverage score (what % of keywords are present)
+            report.keyword_coverage_score = present_keywords / report.total_keywords_analyzed
+
+            # Calculate density score (what % of keywords have optimal density)
+            report.keyword_density_score = report.optimal_keywords / report.total_keywords_analyzed
+
+            # Calculate placement score (average placement quality, weighted by importance)
+            report.keyword_placement_score = weighted_placement / total_weight if total_weight > 0 else 0
+
+        self._calculate_overall_score(report)
+
+    @staticmethod
+    def _calculate_overall_score(report: KeywordOptimizationReport):
+        """Combine the component scores into the overall keyword score."""
         # Overall score (weighted average)
         # Coverage: 30%, Density: 40%, Placement: 30%
         report.overall_keyword_score = (
@@ -467,17 +1235,89 @@ class KeywordOptimizer:
             report.keyword_placement_score * 0.3
         )
 
+    def _calculate_statistics_vectorized(self, report: KeywordOptimizationReport):
+        """
+        Calculate status counts and component scores with NumPy.
+
+        Same results as the loop in _calculate_statistics, but reads each
+        keyword once into a KeywordAnalysisArray and reduces it in C.
+        """
+        count = len(report.keywords)
+        arrays = KeywordAnalysisArray.from_analyses(report.keywords)
+
+        statuses = arrays.status_ids
+        densities = arrays.current
+        weights = arrays.weight
+        placements = arrays.placement_quality
+
+        (
+            report.missing_keywords,
+            report.underutilized_keywords,
+            report.optimal_keywords,
+            report.overstuffed_keywords,
+        ) = (int(n) for n in np.bincount(statuses, minlength=len(KEYWORD_STATUSES)))
+
+        report.keyword_coverage_score = int(np.count_nonzero(densities)) / count
+        report.keyword_density_score = report.optimal_keywords / count
+
+        total_weight = float(weights.sum())
+        report.keyword_placement_score = (
+            float(np.dot(placements, weights)) / total_weight if total_weight > 0 else 0
+        )
+
+    def _calculate_batch_statistics(self, reports: List[KeywordOptimizationReport]):
+        """
+        Calculate statistics for reports that analyze the same job keywords.
+
+        Keyword fields of all reports are read into resume x keyword arrays
+        once, and every count and component score is a row-wise reduction.
+        Results match _calculate_statistics() up to floating-point rounding.
+        """
+        keyword_count = len(reports[0].keywords)
+        shape = (len(reports), keyword_count)
+        arrays = KeywordAnalysisArray.from_analyses(
+            [kw for report in reports for kw in report.keywords]
+        ).reshape(shape)
+
+        statuses = arrays.status_ids
+        densities = arrays.current
+        weights = arrays.weight
+        placements = arrays.placement_quality
+
+        # Per-resume status histograms: (N, K, 4) one-hot summed over keywords
+        status_counts = (statuses[:, :, None] == np.arange(len(KEYWORD_STATUSES))).sum(axis=1)
+        coverage = np.count_nonzero(densities, axis=1) / keyword_count
+        total_weights = weights.sum(axis=1)
+        weighted_placements = (placements * weights).sum(axis=1)
+
+        for i, report in enumerate(reports):
+            report.total_keywords_analyzed = keyword_count
+            (
+                report.missing_keywords,
+                report.underutilized_keywords,
+                report.optimal_keywords,
+                report.overstuffed_keywords,
+            ) = (int(n) for n in status_counts[i])
+            report.keyword_coverage_score = float(coverage[i])
+            report.keyword_density_score = report.optimal_keywords / keyword_count
+            report.keyword_placement_score = (
+                float(weighted_placements[i]) / float(total_weights[i]) if total_weights[i] > 0 else 0
+            )
+            self._calculate_overall_score(report)
+
     def _generate_insights(self, report: KeywordOptimizationReport, job: JobModel):
         """Generate strategic optimization insights."""
 
-        # Critical missing keywords (required skills not present)
+        # One pass over the keywords; each insight list keeps keyword order
         for kw in report.keywords:
+            status = kw.status
+
+            # Critical missing keywords (required skills not present)
             if kw.is_required and kw.current_density == 0:
                 report.critical_missing_keywords.append(kw.keyword)
 
-        # Recommended additions (missing or underutilized keywords)
-        for kw in report.keywords:
-            if kw.status == "missing":
+            # Recommended additions (missing or underutilized keywords)
+            if status == "missing":
                 # Suggest where to add
                 if kw.is_required:
                     location = "summary, experience, and skills sections"
@@ -488,25 +1328,93 @@ class KeywordOptimizer:
 
                 report.recommended_additions.append((kw.keyword, location))
 
-            elif kw.status == "underutilized":
+            elif status == "underutilized":
                 # Suggest where to add more
                 if not kw.appears_in_summary and kw.is_required:
                     report.recommended_additions.append((kw.keyword, "professional summary"))
                 elif not kw.appears_in_experience:
                     report.recommended_additions.append((kw.keyword, "relevant experience bullets"))
 
-        # Recommended removals (overstuffed keywords)
-        for kw in report.keywords:
-            if kw.status == "overstuffed":
+            # Recommended removals (overstuffed keywords)
+            elif status == "overstuffed":
                 report.recommended_removals.append(kw.keyword)
 
-        # Variation suggestions
-        for kw in report.keywords:
+            # Variation suggestions
             if kw.variations and not kw.variations_in_resume:
                 report.variation_suggestions[kw.keyword] = kw.variations[:3]
 
-    def _get_resume_text(self, resume: ResumeModel) -> str:
-        """Get all text from resume."""
+    def _cached_for(self, obj: Any, kind: str, fingerprint: Any, build: Callable[[], Any]) -> Any:
+        """
+        Get a value derived from a resume or job, building it on first use.
+
+        Models are edited in place, so a cached value is only reused while
+        the fingerprint of the fields it was built from still compares
+        equal. That comparison is cheap: unchanged strings are the same
+        objects. Each entry holds a reference to its object, so the id in
+        its key cannot be reused by another object while the entry exists;
+        only the OBJECT_CACHE_SIZE most recently used entries are kept.
+        """
+        key = (id(obj), kind)
+        cached = self._object_cache.get(key)
+        if cached is not None and cached[1] == fingerprint:
+            self._object_cache.move_to_end(key)
+            return cached[2]
+
+        value = build()
+        self._object_cache[key] = (obj, fingerprint, value)
+        self._object_cache.move_to_end(key)
+        while len(self._object_cache) > self.OBJECT_CACHE_SIZE:
+            self._object_cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _resume_fingerprint(resume: ResumeModel) -> Tuple:
+        """Snapshot the resume fields that section texts are built from."""
+        return (
+            resume.summary,
+            resume.headline,
+            tuple((exp.title, exp.company, tuple(exp.bullets or ())) for exp in resume.experiences),
+            tuple(resume.skills),
+            tuple((edu.degree, edu.institution) for edu in resume.education)
+        )
+
+    def _get_resume_texts(self, resume: ResumeModel) -> ResumeTexts:
+        """Get the lowercased whole-resume and section texts used for matching."""
+        return self._cached_for(
+            resume, "texts", self._resume_fingerprint(resume),
+            lambda: self._build_resume_texts(resume)
+        )
+
+    def _build_resume_texts(self, resume: ResumeModel) -> ResumeTexts:
+        """Build the ResumeTexts bundle for _get_resume_texts()."""
+        full = self._get_resume_text(resume, lower=True)
+        summary = (resume.summary or '').lower() + ' ' + (resume.headline or '').lower()
+        experience = ' '.join([
+            ' '.join(exp.bullets or [])
+            for exp in resume.experiences
+        ]).lower()
+        skills = ' '.join(resume.skills).lower()
+        return ResumeTexts(
+            full=full,
+            summary=summary,
+            experience=experience,
+            skills=skills,
+            words=Counter(_WORD_RUN.findall(full)),
+            summary_words=frozenset(_WORD_RUN.findall(summary)),
+            experience_words=frozenset(_WORD_RUN.findall(experience)),
+            skills_words=frozenset(_WORD_RUN.findall(skills)),
+            skill_entries=frozenset(skill.lower() for skill in resume.skills)
+        )
+
+    def _get_resume_text(self, resume: ResumeModel, lower: bool = False) -> str:
+        """
+        Get all text from resume.
+
+        Args:
+            resume: Resume to flatten
+            lower: Lowercase each part as it is collected, so callers that
+                   match case-insensitively avoid a second full-text copy
+        """
         parts = []
 
         if resume.summary:
@@ -531,7 +1439,41 @@ class KeywordOptimizer:
             if edu.institution:
                 parts.append(edu.institution)
 
-        return " ".join(parts)
+        # Reuse the joined text while the resume still holds the same parts
+        parts = tuple(parts)
+        if lower:
+            return self._cached_for(
+                resume, "text_lower", parts,
+                lambda: " ".join(part.lower() for part in parts)
+            )
+        return self._cached_for(resume, "text", parts, lambda: " ".join(parts))
+
+    def _build_heatmap_sections(self, resume: ResumeModel) -> List[Tuple[str, str, Optional[bytes]]]:
+        """
+        Flatten each section for get_keyword_heatmap().
+
+        ASCII sections are also kept as bytes, which keeps the per-keyword
+        count on CPython's single-byte search.
+
+        Returns:
+            (section name, lowercased text, ASCII bytes or None) per section
+        """
+        section_texts = {
+            'summary': (resume.summary or '').lower() + (resume.headline or '').lower(),
+            'experience': ' '.join([
+                ' '.join(exp.bullets or [])
+                for exp in resume.experiences
+            ]).lower(),
+            'skills': ' '.join(resume.skills).lower(),
+            'education': ' '.join([
+                f"{edu.degree} {edu.institution}"
+                for edu in resume.education
+            ]).lower()
+        }
+        return [
+            (name, text, text.encode('ascii') if text.isascii() else None)
+            for name, text in section_texts.items()
+        ]
 
     def get_keyword_heatmap(
         self,
@@ -544,12 +1486,18 @@ class KeywordOptimizer:
         Returns:
             Dictionary mapping section name to keyword counts
         """
-        heatmap = {
-            'summary': {},
-            'experience': {},
-            'skills': {},
-            'education': {}
-        }
+        sections = self._cached_for(
+            resume, "heatmap_sections", self._resume_fingerprint(resume),
+            lambda: self._build_heatmap_sections(resume)
+        )
+        section_texts = {name: text for name, text, _text_bytes in sections}
+        heatmap = {name: {} for name in section_texts}
+
+        # Every section is a substring of this, so one membership test
+        # rules out keywords that appear nowhere before any counting
+        all_sections_text = '\n'.join(section_texts.values())
+        zero_counts = (0,) * len(sections)
+        counts_by_term: Dict[str, Tuple[int, ...]] = {}
 
         # Get all job keywords
         all_keywords = self._extract_job_keywords(job)
@@ -558,29 +1506,85 @@ class KeywordOptimizer:
         for keyword in all_keywords.keys():
             keyword_lower = keyword.lower()
 
-            # Summary
-            summary_text = (resume.summary or '').lower() + (resume.headline or '').lower()
-            heatmap['summary'][keyword] = summary_text.count(keyword_lower)
+            # Keywords differing only in case share their counts
+            counts = counts_by_term.get(keyword_lower)
+            if counts is None:
+                if keyword_lower not in all_sections_text:
+                    counts = zero_counts
+                else:
+                    keyword_bytes = keyword_lower.encode('ascii') if keyword_lower.isascii() else None
+                    counts = tuple(
+                        text_bytes.count(keyword_bytes)
+                        if text_bytes is not None and keyword_bytes is not None
+                        else text.count(keyword_lower)
+                        for _name, text, text_bytes in sections
+                    )
+                counts_by_term[keyword_lower] = counts
+
+            for (name, _text, _text_bytes), count in zip(sections, counts):
+                heatmap[name][keyword] = count
 
-            # Experience
-            exp_text = ' '.join([
-                ' '.join(exp.bullets or [])
-                for exp in resume.experiences
-            ]).lower()
-            heatmap['experience'][keyword] = exp_text.count(keyword_lower)
+        return heatmap
 
-            # Skills
-            skills_text = ' '.join(resume.skills).lower()
-            heatmap['skills'][keyword] = skills_text.count(keyword_lower)
 
-            # Education
-            edu_text = ' '.join([
-                f"{edu.degree} {edu.institution}"
-                for edu in resume.education
-            ]).lower()
-            heatmap['education'][keyword] = edu_text.count(keyword_lower)
+# Per-process state for analyze_many() workers, set by _init_analysis_worker
+_worker_optimizer: Optional[KeywordOptimizer] = None
+_worker_compiled_job: Optional[CompiledJob] = None
+
+
+def _init_analysis_worker(compiled_job: CompiledJob, semantic_matching: bool):
+    """Receive the shared compiled job once when a worker process starts."""
+    global _worker_optimizer, _worker_compiled_job
+    _worker_optimizer = KeywordOptimizer(semantic_matching=semantic_matching)
+    _worker_compiled_job = compiled_job
 
-        return heatmap
+
+def _analyze_in_worker(resume: ResumeModel) -> KeywordOptimizationReport:
+    """Analyze one resume against the worker's compiled job."""
+    return _worker_optimizer.analyze_resume(_worker_compiled_job, resume)
+
+
+# LLM-extracted job keywords, keyed by a content hash of the job posting.
+# Entries are (keywords, sorted skill lists, posting embedding or None).
+JOB_KEYWORDS_CACHE_SIZE = 256
+_job_keywords_cache: "OrderedDict[str, Tuple[Dict[str, int], Tuple, Optional[np.ndarray]]]" = OrderedDict()
+_job_keywords_cache_lock = threading.Lock()
+
+
+def _job_keywords_cache_key(job: JobModel) -> str:
+    """Hash the job text and skill lists that keyword extraction reads."""
+    payload = json.dumps(
+        [job.raw_text, sorted(job.required_skills), sorted(job.preferred_skills)]
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def clear_job_keywords_cache():
+    """Discard all memoized LLM job keyword extractions."""
+    with _job_keywords_cache_lock:
+        _job_keywords_cache.clear()
+
+
+# Reports from analyze_keywords(), keyed by a content hash of its inputs
+ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: "OrderedDict[str, KeywordOptimizationReport]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_cache_key(resume: ResumeModel, job: JobModel, target_density: float) -> str:
+    """Hash the canonical JSON form of the analysis inputs."""
+    payload = json.dumps(
+        [resume.to_dict(), job.to_dict(), target_density],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def clear_analysis_cache():
+    """Discard all memoized keyword analysis reports."""
+    with _analysis_cache_lock:
+        _analysis_cache.clear()
 
 
 def analyze_keywords(
@@ -591,16 +1595,42 @@ def analyze_keywords(
     """
     Analyze keyword optimization.
 
+    Results are memoized by resume, job and target density content, so
+    repeated calls with unchanged inputs skip keyword extraction entirely.
+    Reports built on rule-based fallback keywords are not memoized.
+
     Args:
         resume: Resume to analyze
         job: Job to optimize for
         target_density: Target density multiplier (default: 1.5x)
 
     Returns:
-        KeywordOptimizationReport
+        KeywordOptimizationReport (a private copy; safe to modify)
     """
+    cache_key = _analysis_cache_key(resume, job, target_density)
+
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            _analysis_cache.move_to_end(cache_key)
+            logger.debug("Keyword analysis cache hit")
+            return copy.deepcopy(cached)
+
     optimizer = KeywordOptimizer()
-    return optimizer.analyze(resume, job, target_density)
+    report = optimizer.analyze(resume, job, target_density)
+
+    # Like the job keyword cache, keep only reports built on LLM keywords,
+    # not on a rule-based fallback after a failed LLM call
+    if not optimizer._job_keywords_are_final(job):
+        return report
+
+    with _analysis_cache_lock:
+        _analysis_cache[cache_key] = report
+        _analysis_cache.move_to_end(cache_key)
+        while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+    return copy.deepcopy(report)
 
 
 def get_keyword_recommendations(
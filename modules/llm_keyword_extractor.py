@@ -6,26 +6,44 @@ and resumes, filtering out noise and focusing on professionally relevant terms.
 """
 
 import os
+import asyncio
+import copy
+import hashlib
+import importlib.util
 import json
-from typing import List, Set, Dict, Optional, Tuple
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, FrozenSet, List, Set, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import Counter
+from collections import Counter, OrderedDict
+from itertools import islice
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# anthropic and sentence-transformers are slow to import, so only check here
+# that they are installed and import them on first use
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+if not ANTHROPIC_AVAILABLE:
+    logger.warning("Anthropic library not available - LLM keyword extraction disabled")
+
 try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    logger.warning("Anthropic library not available - LLM keyword extraction disabled")
+    NUMPY_AVAILABLE = False
 
-from config.settings import ANTHROPIC_API_KEY, DEFAULT_MODEL
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
+from config.settings import ANTHROPIC_API_KEY, DEFAULT_MODEL, SEMANTIC_MATCHING_ENABLED
 
 
 # Comprehensive industry-standard stopword list (400+ words)
-COMPREHENSIVE_STOPWORDS = {
+COMPREHENSIVE_STOPWORDS = frozenset({
     # Articles & Determiners
     'a', 'an', 'the', 'this', 'that', 'these', 'those',
 
@@ -68,134 +86,220 @@ COMPREHENSIVE_STOPWORDS = {
     # Quantifiers & Numbers (generic)
     'all', 'any', 'some', 'many', 'much', 'few', 'little', 'more', 'most',
     'less', 'least', 'several', 'every', 'each', 'both', 'either', 'neither',
-    'none', 'no', 'not', 'nor', 'other', 'another', 'such', 'same', 'different',
+    'none', 'no', 'not', 'other', 'another', 'such', 'same', 'different',
 
     # Generic Adjectives (Too Common)
     'good', 'better', 'best', 'bad', 'worse', 'worst', 'great', 'big', 'small',
-    'large', 'little', 'long', 'short', 'high', 'low', 'new', 'old', 'young',
+    'large', 'long', 'short', 'high', 'low', 'new', 'old', 'young',
     'early', 'late', 'right', 'wrong', 'true', 'false', 'real', 'actual',
     'possible', 'impossible', 'easy', 'hard', 'difficult', 'simple', 'complex',
     'important', 'main', 'major', 'minor', 'primary', 'secondary', 'first',
-    'last', 'next', 'previous', 'following', 'own', 'same', 'similar', 'different',
+    'last', 'next', 'previous', 'following', 'own', 'similar',
     'certain', 'sure', 'clear', 'full', 'complete', 'total', 'whole', 'entire',
-    'single', 'double', 'few', 'several', 'various', 'available', 'current',
+    'single', 'double', 'various', 'available', 'current',
 
     # Generic Nouns (Too Vague for Keyword Matching)
-    'able', 'ability', 'access', 'action', 'active', 'activity', 'actual',
+    'able', 'ability', 'access', 'action', 'active', 'activity',
     'adapt', 'addition', 'address', 'advantage', 'age', 'agent', 'agree',
     'agreement', 'ahead', 'allow', 'amount', 'answer', 'anyone', 'anything',
-    'apply', 'applicant', 'approach', 'area', 'around', 'article', 'ask',
-    'aspect', 'assume', 'attempt', 'attention', 'available', 'average', 'avoid',
-    'away', 'back', 'base', 'basic', 'basis', 'become', 'begin', 'beginning',
-    'behind', 'believe', 'benefit', 'better', 'beyond', 'body', 'book', 'bring',
+    'apply', 'applicant', 'approach', 'area', 'article', 'ask',
+    'aspect', 'assume', 'attempt', 'attention', 'average', 'avoid',
+    'away', 'back', 'base', 'basic', 'basis', 'begin', 'beginning',
+    'believe', 'benefit', 'body', 'book', 'bring',
     'build', 'business', 'call', 'candidate', 'care', 'carry', 'case', 'cause',
-    'center', 'central', 'century', 'certain', 'certainly', 'challenge', 'change',
-    'character', 'check', 'choice', 'choose', 'class', 'clear', 'close', 'cold',
-    'collect', 'come', 'comment', 'common', 'community', 'company', 'compare',
-    'complete', 'concern', 'condition', 'consider', 'contain', 'continue',
-    'control', 'cost', 'count', 'country', 'course', 'cover', 'create', 'current',
+    'center', 'central', 'century', 'certainly', 'challenge', 'change',
+    'character', 'check', 'choice', 'choose', 'class', 'close', 'cold',
+    'collect', 'comment', 'common', 'community', 'company', 'compare',
+    'concern', 'condition', 'consider', 'contain', 'continue',
+    'control', 'cost', 'count', 'country', 'course', 'cover', 'create',
     'customer', 'date', 'deal', 'decide', 'decision', 'deep', 'degree', 'describe',
     'design', 'detail', 'determine', 'develop', 'difference', 'direct', 'discover',
-    'discuss', 'discussion', 'doctor', 'door', 'drive', 'drop', 'during', 'each',
-    'early', 'east', 'easy', 'economic', 'economy', 'edge', 'education', 'effect',
-    'effort', 'eight', 'either', 'else', 'encourage', 'end', 'energy', 'enough',
-    'ensure', 'enter', 'entire', 'environment', 'equal', 'especially', 'establish',
-    'evening', 'event', 'ever', 'every', 'everyone', 'everything', 'evidence',
+    'discuss', 'discussion', 'doctor', 'door', 'drive', 'drop',
+    'east', 'economic', 'economy', 'edge', 'education', 'effect',
+    'effort', 'eight', 'else', 'encourage', 'end', 'energy', 'enough',
+    'ensure', 'enter', 'environment', 'equal', 'establish',
+    'evening', 'event', 'ever', 'everyone', 'everything', 'evidence',
     'exactly', 'example', 'exist', 'expect', 'experience', 'explain', 'face',
     'fact', 'factor', 'fall', 'family', 'fast', 'father', 'feel', 'feeling',
     'field', 'figure', 'fill', 'final', 'finally', 'find', 'fine', 'finger',
     'finish', 'fire', 'firm', 'five', 'floor', 'focus', 'follow', 'food',
     'foot', 'force', 'foreign', 'forget', 'form', 'former', 'forward', 'four',
-    'free', 'friend', 'front', 'full', 'function', 'fund', 'future', 'gain',
-    'general', 'glass', 'goal', 'going', 'gone', 'ground', 'group', 'grow',
+    'free', 'friend', 'front', 'function', 'fund', 'future', 'gain',
+    'general', 'glass', 'goal', 'ground', 'group', 'grow',
     'growth', 'guess', 'guide', 'hand', 'handle', 'hang', 'happen', 'happy',
-    'hard', 'head', 'health', 'hear', 'heart', 'heat', 'heavy', 'help', 'here',
-    'herself', 'high', 'himself', 'history', 'hit', 'hold', 'home', 'hope',
+    'head', 'health', 'hear', 'heart', 'heat', 'heavy', 'help', 'here',
+    'history', 'hit', 'hold', 'home', 'hope',
     'hot', 'hotel', 'hour', 'house', 'however', 'huge', 'human', 'hundred',
     'idea', 'identify', 'image', 'imagine', 'impact', 'include', 'including',
     'increase', 'indeed', 'indicate', 'individual', 'industry', 'information',
-    'inside', 'instead', 'interest', 'international', 'interview', 'involve',
-    'issue', 'item', 'itself', 'join', 'keep', 'kind', 'king', 'kitchen',
-    'know', 'knowledge', 'land', 'language', 'large', 'later', 'laugh', 'law',
-    'lay', 'lead', 'learn', 'least', 'leave', 'left', 'legal', 'less', 'let',
+    'instead', 'interest', 'international', 'interview', 'involve',
+    'issue', 'item', 'join', 'keep', 'kind', 'king', 'kitchen',
+    'know', 'knowledge', 'land', 'language', 'later', 'laugh', 'law',
+    'lay', 'lead', 'learn', 'leave', 'left', 'legal', 'let',
     'letter', 'level', 'life', 'light', 'like', 'likely', 'line', 'list',
-    'listen', 'little', 'live', 'local', 'long', 'lose', 'loss', 'love',
-    'machine', 'magazine', 'main', 'maintain', 'major', 'majority', 'make',
-    'manage', 'manager', 'manner', 'many', 'market', 'marriage', 'material',
+    'listen', 'live', 'local', 'lose', 'loss', 'love',
+    'machine', 'magazine', 'maintain', 'majority',
+    'manage', 'manager', 'manner', 'market', 'marriage', 'material',
     'matter', 'maybe', 'mean', 'meaning', 'measure', 'media', 'medical',
     'meet', 'meeting', 'member', 'memory', 'mention', 'message', 'method',
-    'middle', 'might', 'military', 'million', 'mind', 'minute', 'miss',
-    'mission', 'model', 'modern', 'moment', 'money', 'month', 'more', 'morning',
-    'most', 'mother', 'mouth', 'move', 'movement', 'movie', 'much', 'music',
-    'myself', 'name', 'nation', 'national', 'natural', 'nature', 'near',
-    'nearly', 'necessary', 'neck', 'need', 'network', 'never', 'news',
-    'newspaper', 'next', 'night', 'nine', 'nobody', 'none', 'north', 'note',
+    'middle', 'military', 'million', 'mind', 'minute', 'miss',
+    'mission', 'model', 'modern', 'moment', 'money', 'month', 'morning',
+    'mother', 'mouth', 'move', 'movement', 'movie', 'music',
+    'name', 'nation', 'national', 'natural', 'nature',
+    'necessary', 'neck', 'need', 'network', 'news',
+    'newspaper', 'night', 'nine', 'nobody', 'north', 'note',
     'nothing', 'notice', 'number', 'occur', 'offer', 'office', 'officer',
-    'official', 'often', 'once', 'one', 'only', 'onto', 'open', 'operation',
-    'opportunity', 'option', 'order', 'organization', 'other', 'others',
-    'otherwise', 'ought', 'outside', 'over', 'overall', 'owner', 'page',
+    'official', 'once', 'one', 'onto', 'open', 'operation',
+    'opportunity', 'option', 'order', 'organization', 'others',
+    'otherwise', 'ought', 'overall', 'owner', 'page',
     'pain', 'painting', 'paper', 'parent', 'part', 'participant', 'particular',
-    'particularly', 'partner', 'party', 'pass', 'past', 'patient', 'pattern',
+    'partner', 'party', 'pass', 'past', 'patient', 'pattern',
     'pay', 'peace', 'people', 'per', 'perform', 'performance', 'perhaps',
     'period', 'person', 'personal', 'phone', 'physical', 'pick', 'picture',
     'piece', 'place', 'plan', 'plant', 'play', 'player', 'point', 'police',
     'policy', 'political', 'politics', 'poor', 'popular', 'population',
-    'position', 'positive', 'possible', 'power', 'practice', 'prepare',
+    'position', 'positive', 'power', 'practice', 'prepare',
     'present', 'president', 'pressure', 'pretty', 'prevent', 'price', 'private',
     'probably', 'problem', 'process', 'produce', 'product', 'production',
     'professional', 'professor', 'program', 'project', 'property', 'protect',
     'prove', 'provide', 'public', 'pull', 'purpose', 'push', 'quality',
-    'question', 'quickly', 'quite', 'race', 'radio', 'raise', 'range', 'rate',
-    'rather', 'reach', 'read', 'ready', 'real', 'reality', 'realize', 'really',
+    'question', 'quickly', 'race', 'radio', 'raise', 'range', 'rate',
+    'reach', 'read', 'ready', 'reality', 'realize',
     'reason', 'receive', 'recent', 'recently', 'recognize', 'record', 'reduce',
     'reflect', 'region', 'relate', 'relationship', 'remain', 'remember',
     'remove', 'report', 'represent', 'require', 'required', 'research',
     'resource', 'respond', 'response', 'responsibility', 'rest', 'result',
-    'return', 'reveal', 'rich', 'right', 'rise', 'risk', 'road', 'rock',
-    'role', 'room', 'rule', 'safe', 'same', 'save', 'saying', 'scene',
+    'return', 'reveal', 'rich', 'rise', 'risk', 'road', 'rock',
+    'role', 'room', 'rule', 'safe', 'save', 'saying', 'scene',
     'school', 'science', 'scientist', 'score', 'sea', 'season', 'seat',
-    'second', 'section', 'security', 'seek', 'seem', 'sell', 'send', 'senior',
-    'sense', 'series', 'serious', 'serve', 'service', 'seven', 'several',
-    'shake', 'share', 'sheet', 'shoot', 'short', 'shot', 'shoulder', 'show',
-    'side', 'sign', 'significant', 'similar', 'simple', 'simply', 'since',
-    'sing', 'single', 'sister', 'site', 'situation', 'size', 'skill',
-    'skin', 'small', 'smile', 'social', 'society', 'soldier', 'some',
-    'somebody', 'someone', 'something', 'sometimes', 'song', 'soon', 'sort',
+    'second', 'section', 'security', 'seek', 'sell', 'send', 'senior',
+    'sense', 'series', 'serious', 'serve', 'service', 'seven',
+    'shake', 'share', 'sheet', 'shoot', 'shot', 'shoulder', 'show',
+    'side', 'sign', 'significant', 'simply',
+    'sing', 'sister', 'site', 'situation', 'size', 'skill',
+    'skin', 'smile', 'social', 'society', 'soldier',
+    'somebody', 'someone', 'something', 'song', 'soon', 'sort',
     'sound', 'source', 'south', 'southern', 'space', 'speak', 'special',
     'specific', 'speech', 'spend', 'sport', 'spring', 'staff', 'stage',
     'stand', 'standard', 'star', 'start', 'state', 'statement', 'station',
-    'stay', 'step', 'still', 'stock', 'stop', 'store', 'story', 'strategy',
+    'stay', 'step', 'stock', 'stop', 'store', 'story', 'strategy',
     'street', 'strong', 'structure', 'student', 'study', 'stuff', 'style',
-    'subject', 'success', 'successful', 'such', 'suddenly', 'suffer', 'suggest',
-    'summer', 'support', 'sure', 'surface', 'system', 'table', 'take', 'talk',
+    'subject', 'success', 'successful', 'suddenly', 'suffer', 'suggest',
+    'summer', 'support', 'surface', 'system', 'table', 'talk',
     'task', 'teach', 'teacher', 'team', 'technology', 'television', 'tell',
-    'tend', 'term', 'test', 'text', 'than', 'thank', 'their', 'them',
-    'themselves', 'then', 'theory', 'there', 'these', 'they', 'thing', 'think',
-    'third', 'though', 'thought', 'thousand', 'threat', 'three', 'through',
-    'throughout', 'throw', 'thus', 'time', 'today', 'together', 'tonight',
-    'total', 'tough', 'toward', 'town', 'trade', 'traditional', 'training',
-    'travel', 'treat', 'treatment', 'tree', 'trial', 'trip', 'trouble', 'true',
-    'truth', 'turn', 'type', 'under', 'understand', 'unit', 'until', 'upon',
-    'usual', 'value', 'various', 'very', 'victim', 'view', 'violence', 'visit',
+    'tend', 'term', 'test', 'text', 'thank',
+    'then', 'theory', 'there', 'thing', 'think',
+    'third', 'thought', 'thousand', 'threat', 'three',
+    'throw', 'thus', 'time', 'today', 'together', 'tonight',
+    'tough', 'town', 'trade', 'traditional', 'training',
+    'travel', 'treat', 'treatment', 'tree', 'trial', 'trip', 'trouble',
+    'truth', 'turn', 'type', 'understand', 'unit',
+    'usual', 'value', 'victim', 'view', 'violence', 'visit',
     'voice', 'vote', 'wait', 'walk', 'wall', 'want', 'watch', 'water', 'way',
-    'weapon', 'wear', 'week', 'weight', 'well', 'west', 'western', 'what',
-    'whatever', 'when', 'where', 'whether', 'which', 'while', 'white', 'whole',
-    'whom', 'whose', 'wide', 'wife', 'will', 'wind', 'window', 'wish', 'with',
-    'within', 'without', 'woman', 'wonder', 'word', 'work', 'worker', 'working',
-    'world', 'worry', 'worth', 'would', 'write', 'writer', 'wrong', 'yard',
-    'yeah', 'year', 'yes', 'yesterday', 'young',
+    'weapon', 'wear', 'week', 'weight', 'well', 'west', 'western',
+    'white',
+    'wide', 'wife', 'wind', 'window', 'wish',
+    'woman', 'wonder', 'word', 'work', 'worker', 'working',
+    'world', 'worry', 'worth', 'write', 'writer', 'yard',
+    'yeah', 'year', 'yes', 'yesterday',
 
     # Job Description Specific (Too Generic)
-    'excellent', 'preferred', 'plus', 'candidate', 'applicant', 'apply',
-    'application', 'hiring', 'seeking', 'looking', 'equal', 'employer',
+    'excellent', 'preferred', 'plus',
+    'application', 'hiring', 'seeking', 'employer',
     'employment', 'diverse', 'diversity', 'inclusion', 'location', 'remote',
-    'office', 'hybrid', 'fulltime', 'parttime', 'contract', 'permanent',
+    'hybrid', 'fulltime', 'parttime', 'contract', 'permanent',
     'temporary', 'compensation', 'salary', 'benefits', 'bonus', 'equity',
-    'package', 'perks', 'culture', 'values', 'mission', 'vision',
-}
-
-
-@dataclass
+    'package', 'perks', 'culture', 'values', 'vision',
+})
+
+
+# Technical term patterns matched by rule-based extraction (expanded)
+TECHNICAL_PATTERNS = (
+    # Programming languages
+    r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\btypescript\b',
+    r'\bc\+\+\b', r'\bc#\b', r'\bruby\b', r'\bgo\b', r'\brust\b',
+    r'\bswift\b', r'\bkotlin\b', r'\bphp\b', r'\bscala\b', r'\bc\b',
+    r'\bperl\b', r'\br\b', r'\bmatlab\b', r'\bvba\b', r'\bsql\b',
+
+    # Frameworks & Libraries
+    r'\breact\b', r'\bangular\b', r'\bvue\b', r'\bdjango\b',
+    r'\bflask\b', r'\bspring\b', r'\bexpress\b', r'\bnode\.?js\b',
+    r'\bnext\.?js\b', r'\bnuxt\.?js\b', r'\btensorflow\b', r'\bpytorch\b',
+    r'\bjquery\b', r'\bbootstrap\b', r'\btailwind\b', r'\b\.net\b',
+    r'\basp\.net\b', r'\blaravel\b', r'\brails\b', r'\bfastapi\b',
+
+    # Databases
+    r'\bpostgresql\b', r'\bpostgres\b', r'\bmysql\b', r'\bmongodb\b',
+    r'\bredis\b', r'\belasticsearch\b', r'\bcassandra\b', r'\bnosql\b',
+    r'\bsqlite\b', r'\boracle\b', r'\bdynamodb\b', r'\bmariadb\b',
+    r'\bcouchdb\b', r'\bneo4j\b', r'\bmssql\b',
+
+    # Cloud & Infrastructure
+    r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bgoogle cloud\b',
+    r'\bdocker\b', r'\bkubernetes\b', r'\bk8s\b', r'\bterraform\b',
+    r'\bjenkins\b', r'\bgithub actions\b', r'\bgitlab ci\b', r'\bci/cd\b',
+    r'\bansible\b', r'\bhelm\b', r'\bvagrant\b', r'\bchef\b', r'\bpuppet\b',
+
+    # Tools & Platforms
+    r'\bgit\b', r'\bgithub\b', r'\bgitlab\b', r'\bbitbucket\b',
+    r'\blinux\b', r'\bunix\b', r'\bwindows\b', r'\bmacos\b',
+    r'\bjira\b', r'\bconfluence\b', r'\bslack\b', r'\btrello\b',
+    r'\basana\b', r'\bnotion\b', r'\bmiro\b', r'\bfigma\b',
+
+    # APIs & Protocols
+    r'\brest\b', r'\brestful\b', r'\bgraphql\b', r'\bgrpc\b',
+    r'\bsoap\b', r'\bhttp\b', r'\bhttps\b', r'\bwebsocket\b',
+    r'\bapi\b', r'\bmicroservices\b', r'\bserverless\b',
+
+    # Methodologies
+    r'\bagile\b', r'\bscrum\b', r'\bkanban\b', r'\bdevops\b',
+    r'\btdd\b', r'\bbdd\b', r'\btest-driven\b',
+
+    # Data & ML
+    r'\bmachine learning\b', r'\bdeep learning\b', r'\bnlp\b',
+    r'\bnatural language processing\b', r'\bdata science\b',
+    r'\bpandas\b', r'\bnumpy\b', r'\bscikit-learn\b', r'\bspark\b',
+    r'\bhadoop\b', r'\bairflow\b', r'\btableau\b', r'\bpower bi\b',
+    r'\bkafka\b', r'\bflink\b',
+
+    # Testing
+    r'\bpytest\b', r'\bjest\b', r'\bmocha\b', r'\bjunit\b',
+    r'\bselenium\b', r'\bcypress\b', r'\bunit test\b', r'\bintegration test\b',
+
+    # Web Technologies
+    r'\bhtml\b', r'\bhtml5\b', r'\bcss\b', r'\bcss3\b', r'\bsass\b',
+    r'\bscss\b', r'\bless\b', r'\bwebpack\b', r'\bbabel\b', r'\bnpm\b',
+    r'\byarn\b', r'\bpnpm\b', r'\bvite\b', r'\brollup\b',
+
+    # Certifications
+    r'\baws certified\b', r'\bazure certified\b', r'\bgcp certified\b',
+    r'\bpmp\b', r'\bcism\b', r'\bcissp\b', r'\bccna\b', r'\bceh\b',
+)
+
+
+def _first_char(pattern: str) -> str:
+    """Get the literal character a \\b-anchored technical pattern starts with."""
+    body = pattern[2:]
+    return body[1] if body.startswith('\\') else body[0]
+
+
+# Other meaningful words: 4+ letters
+MEANINGFUL_WORD_PATTERN = r'\b[a-zA-Z]{4,}\b'
+
+# Single scan for rule-based extraction. The "tech" branch is zero-width and
+# marks every position where any technical pattern matches; the patterns that
+# can start there are then confirmed individually, so overlapping terms such
+# as "aws" within "aws certified" are all still reported. Being zero-width,
+# it never consumes text the "word" branch needs.
+_RULES_SCAN_RE = re.compile(
+    '(?P<tech>(?=' + '|'.join(TECHNICAL_PATTERNS) + '))|(?P<word>' + MEANINGFUL_WORD_PATTERN + ')'
+)
+_TECHNICAL_BY_FIRST_CHAR: Dict[str, List[re.Pattern]] = {}
+for _pattern in TECHNICAL_PATTERNS:
+    _TECHNICAL_BY_FIRST_CHAR.setdefault(_first_char(_pattern), []).append(re.compile(_pattern))
+
+
+@dataclass(slots=True)
 class KeywordExtractionResult:
     """Result of keyword extraction."""
     # Core keywords by category
@@ -210,8 +314,47 @@ class KeywordExtractionResult:
     keyword_frequencies: Dict[str, int] = field(default_factory=dict)  # Frequency counts
     is_llm_extracted: bool = False  # Whether LLM was used
 
+    # Set by finalize(); None while the categories may still change
+    _weighted_keywords: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _category_sets: Optional[Tuple[FrozenSet[str], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def finalize(self) -> "KeywordExtractionResult":
+        """
+        Precompute weighted keywords and category sets once all categories are filled in.
+
+        Call again after changing any category of a finalized result.
+        """
+        self._weighted_keywords = self._compute_weighted_keywords()
+        self._category_sets = self._compute_category_sets()
+        return self
+
+    def get_category_sets(self) -> Tuple[FrozenSet[str], ...]:
+        """Get lowercased hard skills, tools, certifications and domain terms as sets."""
+        if self._category_sets is None:
+            return self._compute_category_sets()
+        return self._category_sets
+
+    def _compute_category_sets(self) -> Tuple[FrozenSet[str], ...]:
+        """Lowercase the categories that keyword matching compares."""
+        return (
+            frozenset(map(str.lower, self.hard_skills)),
+            frozenset(map(str.lower, self.tools_technologies)),
+            frozenset(map(str.lower, self.certifications)),
+            frozenset(map(str.lower, self.domain_terms)),
+        )
+
     def get_weighted_keywords(self) -> Dict[str, int]:
         """Get keywords with importance weights."""
+        if self._weighted_keywords is None:
+            return self._compute_weighted_keywords()
+        return dict(self._weighted_keywords)
+
+    def _compute_weighted_keywords(self) -> Dict[str, int]:
+        """Weight every keyword by the categories it appears in."""
         weighted = Counter()
 
         # Hard skills and tools are most important (weight: 3)
@@ -250,19 +393,43 @@ class LLMKeywordExtractor:
     with fallback to rule-based extraction when LLM is unavailable.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Opt-in reuse of Claude results for near-duplicate job descriptions
+    # (requires sentence-transformers)
+    SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+    SEMANTIC_CACHE_THRESHOLD = 0.87  # Cosine similarity for reusing a cached result
+    _embedding_model = None
+    _embedding_model_lock = threading.Lock()
+
+    BATCH_POLL_INTERVAL = 10  # Seconds between Message Batches status checks
+    BATCH_MAX_WAIT = 3600  # Seconds to wait for a batch before cancelling it
+    MAX_CONCURRENT_REQUESTS = 10  # Cap on in-flight async Claude calls per extractor
+
+    def __init__(self, api_key: Optional[str] = None, semantic_cache: Optional[bool] = None):
         """
         Initialize the keyword extractor.
 
         Args:
             api_key: Anthropic API key (optional, will use env var if not provided)
+            semantic_cache: Reuse the Claude result of a near-duplicate job
+                            description (default: SEMANTIC_MATCHING_ENABLED
+                            setting, off unless configured). Resumes are only
+                            ever reused for identical text, because a tailored
+                            resume embeds close to the version it came from.
         """
         self.api_key = api_key or ANTHROPIC_API_KEY or os.getenv('ANTHROPIC_API_KEY')
+        if semantic_cache is None:
+            semantic_cache = SEMANTIC_MATCHING_ENABLED
+        self.semantic_cache = semantic_cache
         self.client = None
+        # Overrides the shared async client when set (see _get_async_client)
+        self.async_client = None
+        # One semaphore per event loop, since a semaphore binds to the loop
+        # that first waits on it
+        self._request_semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
 
         if ANTHROPIC_AVAILABLE and self.api_key:
             try:
-                self.client = Anthropic(api_key=self.api_key)
+                self.client = _get_shared_client(self.api_key)
                 logger.info("LLM Keyword Extractor initialized with Claude API")
             except Exception as e:
                 logger.error(f"Could not initialize Anthropic client: {e}")
@@ -333,44 +500,300 @@ class LLMKeywordExtractor:
             logger.info("Using rule-based extraction (LLM unavailable)")
             return self._extract_with_rules(resume_text, structured_skills, [])
 
+    async def extract_from_job_description_async(
+        self,
+        job_text: str,
+        required_skills: Optional[List[str]] = None,
+        preferred_skills: Optional[List[str]] = None
+    ) -> KeywordExtractionResult:
+        """Async version of extract_from_job_description()."""
+        if self._get_async_client():
+            try:
+                return await self._extract_with_llm_async(
+                    text=job_text,
+                    context="job_description",
+                    structured_skills={
+                        'required': required_skills or [],
+                        'preferred': preferred_skills or []
+                    }
+                )
+            except Exception as e:
+                logger.error(f"LLM extraction failed, falling back to rule-based: {e}")
+                return self._extract_with_rules(job_text, required_skills, preferred_skills)
+        else:
+            logger.info("Using rule-based extraction (LLM unavailable)")
+            return self._extract_with_rules(job_text, required_skills, preferred_skills)
+
+    async def extract_from_resume_async(
+        self,
+        resume_text: str,
+        structured_skills: Optional[List[str]] = None
+    ) -> KeywordExtractionResult:
+        """Async version of extract_from_resume()."""
+        if self._get_async_client():
+            try:
+                return await self._extract_with_llm_async(
+                    text=resume_text,
+                    context="resume",
+                    structured_skills={'existing': structured_skills or []}
+                )
+            except Exception as e:
+                logger.error(f"LLM extraction failed, falling back to rule-based: {e}")
+                return self._extract_with_rules(resume_text, structured_skills, [])
+        else:
+            logger.info("Using rule-based extraction (LLM unavailable)")
+            return self._extract_with_rules(resume_text, structured_skills, [])
+
+    async def extract_pair(
+        self,
+        job_text: str,
+        resume_text: str,
+        required_skills: Optional[List[str]] = None,
+        preferred_skills: Optional[List[str]] = None,
+        resume_skills: Optional[List[str]] = None
+    ) -> Tuple[KeywordExtractionResult, KeywordExtractionResult]:
+        """
+        Extract job and resume keywords concurrently.
+
+        The two Claude calls are independent, so running them together
+        takes about as long as the slower one instead of both in sequence.
+
+        Args:
+            job_text: Raw job description text
+            resume_text: Raw resume text
+            required_skills: Pre-extracted required skills (optional)
+            preferred_skills: Pre-extracted preferred skills (optional)
+            resume_skills: Pre-extracted skills from resume parser (optional)
+
+        Returns:
+            Tuple of (job keywords, resume keywords)
+        """
+        job_result, resume_result = await asyncio.gather(
+            self.extract_from_job_description_async(job_text, required_skills, preferred_skills),
+            self.extract_from_resume_async(resume_text, resume_skills)
+        )
+        return job_result, resume_result
+
     def _extract_with_llm(
         self,
         text: str,
         context: str,
         structured_skills: Dict[str, List[str]]
     ) -> KeywordExtractionResult:
-        """Extract keywords using Claude AI."""
+        """
+        Extract keywords using Claude AI.
+
+        Results are cached per text, context and pre-identified skills.
+        Identical inputs always reuse the cached result. With semantic_cache
+        enabled, job descriptions embedding within SEMANTIC_CACHE_THRESHOLD
+        of an earlier one with the same skills reuse its result too.
+        """
+        cached, cache_entry = self._get_cached_result(text, context, structured_skills)
+        if cached is not None:
+            return cached
+
+        result = self._extract_with_llm_uncached(text, context, structured_skills)
+        self._cache_result(cache_entry, result)
+        return result
+
+    async def _extract_with_llm_async(
+        self,
+        text: str,
+        context: str,
+        structured_skills: Dict[str, List[str]]
+    ) -> KeywordExtractionResult:
+        """Async counterpart of _extract_with_llm(), sharing its result cache."""
+        cached, cache_entry = self._get_cached_result(text, context, structured_skills)
+        if cached is not None:
+            return cached
+
         logger.info(f"Extracting keywords with LLM (context: {context})")
+        async with self._get_request_semaphore():
+            response = await self._get_async_client().messages.create(
+                **self._build_request_params(text, context, structured_skills)
+            )
 
-        # Build prompt based on context
-        if context == "job_description":
-            prompt = self._build_job_extraction_prompt(text, structured_skills)
-        else:  # resume
-            prompt = self._build_resume_extraction_prompt(text, structured_skills)
+        result = self._build_llm_result(text, structured_skills, response.content[0].text)
+        self._cache_result(cache_entry, result)
+        return result
+
+    def _get_async_client(self) -> Optional["AsyncAnthropic"]:
+        """
+        Get the async client for the running event loop, or None without API access.
+
+        Extractors share one client per API key and event loop, created on
+        first use.
+        """
+        if self.async_client is not None:
+            return self.async_client
+        if self.client is None:
+            return None
+        return _get_shared_async_client(self.api_key)
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """Get the cap on this extractor's in-flight calls in the running event loop."""
+        with _per_loop_lock:
+            return _for_running_loop(
+                self._request_semaphores,
+                lambda: asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            )
+
+    def _get_cached_result(
+        self,
+        text: str,
+        context: str,
+        structured_skills: Dict[str, List[str]]
+    ) -> Tuple[Optional[KeywordExtractionResult], Tuple]:
+        """
+        Look up a cached Claude result for these inputs.
+
+        Returns:
+            Tuple of (copy of the cached result or None, cache entry to pass
+            to _cache_result() after a miss)
+        """
+        skills_key = _skills_cache_key(context, structured_skills)
+        cache_key = _llm_result_cache_key(text, skills_key)
+        with _llm_result_cache_lock:
+            cached = _llm_result_cache.get(cache_key)
+            if cached is not None:
+                _llm_result_cache.move_to_end(cache_key)
+                logger.debug("LLM keyword cache hit")
+                return copy.deepcopy(cached[1]), ()
+
+        text_vector = None
+        if (
+            self.semantic_cache
+            and context == "job_description"
+            and SENTENCE_TRANSFORMERS_AVAILABLE
+            and NUMPY_AVAILABLE
+        ):
+            try:
+                text_vector, similar = self._find_similar_result(text, skills_key)
+            except Exception as e:
+                logger.warning(f"Could not embed text for LLM result cache: {e}")
+                similar = None
+            if similar is not None:
+                logger.debug("LLM keyword semantic cache hit")
+                return copy.deepcopy(similar), ()
+
+        return None, (cache_key, skills_key, text_vector)
+
+    @staticmethod
+    def _cache_result(cache_entry: Tuple, result: KeywordExtractionResult):
+        """Store a fresh Claude result under the entry from _get_cached_result()."""
+        # Rule-based fallbacks are cheap to redo and are not cached
+        if not result.is_llm_extracted:
+            return
+
+        cache_key, skills_key, text_vector = cache_entry
+        with _llm_result_cache_lock:
+            _llm_result_cache[cache_key] = (skills_key, copy.deepcopy(result), text_vector)
+            while len(_llm_result_cache) > LLM_RESULT_CACHE_SIZE:
+                _llm_result_cache.popitem(last=False)
+
+    @classmethod
+    def _get_embedding_model(cls):
+        """Load the sentence embedding model once per process."""
+        if cls._embedding_model is None:
+            with cls._embedding_model_lock:
+                if cls._embedding_model is None:
+                    from sentence_transformers import SentenceTransformer
+                    cls._embedding_model = SentenceTransformer(cls.SEMANTIC_MODEL_NAME)
+        return cls._embedding_model
+
+    def _find_similar_result(
+        self,
+        text: str,
+        skills_key: Tuple
+    ) -> Tuple["np.ndarray", Optional[KeywordExtractionResult]]:
+        """
+        Look up the cached result of a near-duplicate text.
+
+        Returns:
+            Tuple of (embedding of text, cached result or None)
+        """
+        text_vector = self._get_embedding_model().encode(
+            [text], normalize_embeddings=True, convert_to_numpy=True
+        )[0]
+
+        with _llm_result_cache_lock:
+            candidates = [
+                (key, result, vector)
+                for key, (entry_skills, result, vector) in _llm_result_cache.items()
+                if vector is not None and entry_skills == skills_key
+            ]
+        if not candidates:
+            return text_vector, None
+
+        similarities = np.vstack([vector for _key, _result, vector in candidates]) @ text_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.SEMANTIC_CACHE_THRESHOLD:
+            return text_vector, None
+
+        best_key, best_result, _vector = candidates[best]
+        with _llm_result_cache_lock:
+            if best_key in _llm_result_cache:
+                _llm_result_cache.move_to_end(best_key)
+        return text_vector, best_result
+
+    def _extract_with_llm_uncached(
+        self,
+        text: str,
+        context: str,
+        structured_skills: Dict[str, List[str]]
+    ) -> KeywordExtractionResult:
+        """Call Claude for _extract_with_llm()."""
+        logger.info(f"Extracting keywords with LLM (context: {context})")
 
         # Call Claude API
         response = self.client.messages.create(
-            model=DEFAULT_MODEL,
-            max_tokens=2000,
-            temperature=0,
-            system=self._get_system_prompt(),
-            messages=[{"role": "user", "content": prompt}]
+            **self._build_request_params(text, context, structured_skills)
         )
 
         # Parse response
         response_text = response.content[0].text
         logger.debug(f"LLM response: {response_text[:200]}...")
 
+        return self._build_llm_result(text, structured_skills, response_text)
+
+    def _build_request_params(
+        self,
+        text: str,
+        context: str,
+        structured_skills: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        """Build the Messages API parameters for one extraction."""
+        # Build prompt based on context
+        if context == "job_description":
+            prompt = self._build_job_extraction_prompt(text, structured_skills)
+        else:  # resume
+            prompt = self._build_resume_extraction_prompt(text, structured_skills)
+
+        return {
+            "model": DEFAULT_MODEL,
+            "max_tokens": 2000,
+            "temperature": 0,
+            "system": [{
+                "type": "text",
+                "text": self._get_system_prompt(),
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+    def _build_llm_result(
+        self,
+        text: str,
+        structured_skills: Dict[str, List[str]],
+        response_text: str
+    ) -> KeywordExtractionResult:
+        """Turn a Claude response into a result, falling back to rules if unparseable."""
         # Extract JSON from response
         result_data = self._parse_json_response(response_text)
 
         if not result_data:
             logger.error("Failed to parse LLM response, falling back to rules")
-            return self._extract_with_rules(
-                text,
-                structured_skills.get('required', []) + structured_skills.get('existing', []),
-                structured_skills.get('preferred', [])
-            )
+            return self._extract_with_rules_for(text, structured_skills)
 
         # Create result object
         result = KeywordExtractionResult(
@@ -392,10 +815,159 @@ class LLMKeywordExtractor:
         )
 
         # Calculate frequencies
-        result.keyword_frequencies = Counter([kw.lower() for kw in result.all_keywords])
+        result.keyword_frequencies = Counter(kw.lower() for kw in result.all_keywords)
 
         logger.info(f"LLM extracted {len(result.all_keywords)} keywords")
-        return result
+        return result.finalize()
+
+    def extract_batch(
+        self,
+        items: List[Tuple[str, str, Dict[str, List[str]]]]
+    ) -> List[KeywordExtractionResult]:
+        """
+        Extract keywords from many texts with one Message Batches API job.
+
+        Batches are billed at half the price of individual calls but may
+        take minutes to complete, so this suits bulk processing rather
+        than interactive use. Items with a cached result are not submitted
+        and identical items are submitted once. Items the batch cannot
+        process fall back to rule-based extraction. A batch still running
+        after BATCH_MAX_WAIT seconds is cancelled and its items are
+        extracted one call at a time instead.
+
+        Args:
+            items: (text, context, structured_skills) tuples, where context is
+                   "job_description" or "resume" and structured_skills uses the
+                   'required'/'preferred' or 'existing' keys
+
+        Returns:
+            One KeywordExtractionResult per item, in input order
+        """
+        if not items:
+            return []
+        if not self.client:
+            logger.info("Using rule-based extraction (LLM unavailable)")
+            return [self._extract_with_rules_for(text, skills) for text, _context, skills in items]
+
+        # Cached results are reused and identical requests submitted once;
+        # pending maps each request's cache key to its first item index
+        results: List[Optional[KeywordExtractionResult]] = [None] * len(items)
+        item_keys: List[Optional[str]] = []
+        pending: Dict[str, Tuple[int, Tuple]] = {}
+        for i, (text, context, skills) in enumerate(items):
+            cached, cache_entry = self._get_cached_result(text, context, skills)
+            if cached is not None:
+                results[i] = cached
+                item_keys.append(None)
+            else:
+                item_keys.append(cache_entry[0])
+                pending.setdefault(cache_entry[0], (i, cache_entry))
+
+        if not pending:
+            return results
+
+        # Older SDKs have no Message Batches API; without this check the
+        # AttributeError would quietly turn every item into a rule-based result
+        batches = getattr(self.client.messages, "batches", None)
+        if batches is None:
+            logger.warning(
+                "Installed anthropic SDK lacks the Message Batches API "
+                "(requires anthropic>=0.42.0); falling back to rule-based extraction"
+            )
+            response_texts = {}
+        else:
+            timed_out = False
+            try:
+                batch = batches.create(requests=[
+                    {
+                        "custom_id": f"item_{i}",
+                        "params": self._build_request_params(*items[i])
+                    }
+                    for i, _cache_entry in pending.values()
+                ])
+                logger.info(
+                    f"Submitted keyword extraction batch {batch.id} "
+                    f"({len(pending)} requests for {len(items)} items)"
+                )
+
+                # Batches may take up to 24 hours; do not block callers that long
+                deadline = time.monotonic() + self.BATCH_MAX_WAIT
+                while batch.processing_status != "ended":
+                    if time.monotonic() >= deadline:
+                        timed_out = True
+                        break
+                    time.sleep(self.BATCH_POLL_INTERVAL)
+                    batch = batches.retrieve(batch.id)
+
+                if timed_out:
+                    logger.warning(
+                        f"Keyword extraction batch {batch.id} did not finish within "
+                        f"{self.BATCH_MAX_WAIT}s; cancelling it and extracting per item"
+                    )
+                    batches.cancel(batch.id)
+                    response_texts = {}
+                else:
+                    response_texts = {
+                        entry.custom_id: entry.result.message.content[0].text
+                        for entry in batches.results(batch.id)
+                        if entry.result.type == "succeeded"
+                    }
+            except Exception as e:
+                logger.error(f"Batch extraction failed, falling back to rule-based: {e}")
+                response_texts = {}
+
+            if timed_out:
+                response_texts = self._extract_items_individually(items, pending)
+
+        extracted: Dict[str, KeywordExtractionResult] = {}
+        for key, (i, cache_entry) in pending.items():
+            text, _context, skills = items[i]
+            response_text = response_texts.get(f"item_{i}")
+            if response_text is None:
+                result = self._extract_with_rules_for(text, skills)
+            else:
+                result = self._build_llm_result(text, skills, response_text)
+            self._cache_result(cache_entry, result)
+            extracted[key] = results[i] = result
+
+        # Repeated items get their own copies of the shared result
+        for i, key in enumerate(item_keys):
+            if results[i] is None:
+                results[i] = copy.deepcopy(extracted[key])
+        return results
+
+    def _extract_items_individually(
+        self,
+        items: List[Tuple[str, str, Dict[str, List[str]]]],
+        pending: Dict[str, Tuple[int, Tuple]]
+    ) -> Dict[str, str]:
+        """
+        Call Claude once per pending item of an abandoned batch.
+
+        Returns response texts keyed by batch custom_id, so extract_batch()
+        handles them like batch results; items whose call fails are left
+        out and fall back to rule-based extraction.
+        """
+        response_texts = {}
+        for i, _cache_entry in pending.values():
+            try:
+                response = self.client.messages.create(**self._build_request_params(*items[i]))
+                response_texts[f"item_{i}"] = response.content[0].text
+            except Exception as e:
+                logger.error(f"LLM extraction failed for batch item {i}, falling back to rule-based: {e}")
+        return response_texts
+
+    def _extract_with_rules_for(
+        self,
+        text: str,
+        structured_skills: Dict[str, List[str]]
+    ) -> KeywordExtractionResult:
+        """Rule-based extraction taking the structured skills of an LLM request."""
+        return self._extract_with_rules(
+            text,
+            structured_skills.get('required', []) + structured_skills.get('existing', []),
+            structured_skills.get('preferred', [])
+        )
 
     def _extract_with_rules(
         self,
@@ -411,96 +983,31 @@ class LLMKeywordExtractor:
         """
         logger.info("Extracting keywords with rule-based approach")
 
-        import re
-
-        # Technical term patterns (expanded)
-        technical_patterns = [
-            # Programming languages
-            r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\btypescript\b',
-            r'\bc\+\+\b', r'\bc#\b', r'\bruby\b', r'\bgo\b', r'\brust\b',
-            r'\bswift\b', r'\bkotlin\b', r'\bphp\b', r'\bscala\b', r'\bc\b',
-            r'\bperl\b', r'\br\b', r'\bmatlab\b', r'\bvba\b', r'\bsql\b',
-
-            # Frameworks & Libraries
-            r'\breact\b', r'\bangular\b', r'\bvue\b', r'\bdjango\b',
-            r'\bflask\b', r'\bspring\b', r'\bexpress\b', r'\bnode\.?js\b',
-            r'\bnext\.?js\b', r'\bnuxt\.?js\b', r'\btensorflow\b', r'\bpytorch\b',
-            r'\bjquery\b', r'\bbootstrap\b', r'\btailwind\b', r'\b\.net\b',
-            r'\basp\.net\b', r'\blaravel\b', r'\brails\b', r'\bfastapi\b',
-
-            # Databases
-            r'\bpostgresql\b', r'\bpostgres\b', r'\bmysql\b', r'\bmongodb\b',
-            r'\bredis\b', r'\belasticsearch\b', r'\bcassandra\b', r'\bnosql\b',
-            r'\bsqlite\b', r'\boracle\b', r'\bdynamodb\b', r'\bmariadb\b',
-            r'\bcouchdb\b', r'\bneo4j\b', r'\bmssql\b',
-
-            # Cloud & Infrastructure
-            r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bgoogle cloud\b',
-            r'\bdocker\b', r'\bkubernetes\b', r'\bk8s\b', r'\bterraform\b',
-            r'\bjenkins\b', r'\bgithub actions\b', r'\bgitlab ci\b', r'\bci/cd\b',
-            r'\bansible\b', r'\bhelm\b', r'\bvagrant\b', r'\bchef\b', r'\bpuppet\b',
-
-            # Tools & Platforms
-            r'\bgit\b', r'\bgithub\b', r'\bgitlab\b', r'\bbitbucket\b',
-            r'\blinux\b', r'\bunix\b', r'\bwindows\b', r'\bmacos\b',
-            r'\bjira\b', r'\bconfluence\b', r'\bslack\b', r'\btrello\b',
-            r'\basana\b', r'\bnotion\b', r'\bmiro\b', r'\bfigma\b',
-
-            # APIs & Protocols
-            r'\brest\b', r'\brestful\b', r'\bgraphql\b', r'\bgrpc\b',
-            r'\bsoap\b', r'\bhttp\b', r'\bhttps\b', r'\bwebsocket\b',
-            r'\bapi\b', r'\bmicroservices\b', r'\bserverless\b',
-
-            # Methodologies
-            r'\bagile\b', r'\bscrum\b', r'\bkanban\b', r'\bdevops\b',
-            r'\btdd\b', r'\bbdd\b', r'\bci/cd\b', r'\btest-driven\b',
-
-            # Data & ML
-            r'\bmachine learning\b', r'\bdeep learning\b', r'\bnlp\b',
-            r'\bnatural language processing\b', r'\bdata science\b',
-            r'\bpandas\b', r'\bnumpy\b', r'\bscikit-learn\b', r'\bspark\b',
-            r'\bhadoop\b', r'\bairflow\b', r'\btableau\b', r'\bpower bi\b',
-            r'\bkafka\b', r'\bflink\b',
-
-            # Testing
-            r'\bpytest\b', r'\bjest\b', r'\bmocha\b', r'\bjunit\b',
-            r'\bselenium\b', r'\bcypress\b', r'\bunit test\b', r'\bintegration test\b',
-
-            # Web Technologies
-            r'\bhtml\b', r'\bhtml5\b', r'\bcss\b', r'\bcss3\b', r'\bsass\b',
-            r'\bscss\b', r'\bless\b', r'\bwebpack\b', r'\bbabel\b', r'\bnpm\b',
-            r'\byarn\b', r'\bpnpm\b', r'\bvite\b', r'\brollup\b',
-
-            # Certifications
-            r'\baws certified\b', r'\bazure certified\b', r'\bgcp certified\b',
-            r'\bpmp\b', r'\bcism\b', r'\bcissp\b', r'\bccna\b', r'\bceh\b',
-        ]
-
-        # Extract technical terms
+        # Extract technical terms and other meaningful words (4+ chars, not
+        # stopwords) in one pass
         text_lower = text.lower()
         technical_terms = set()
+        meaningful_words = set()
 
-        for pattern in technical_patterns:
-            matches = re.findall(pattern, text_lower)
-            technical_terms.update(matches)
+        for found in _RULES_SCAN_RE.finditer(text_lower):
+            if found.lastgroup == 'tech':
+                pos = found.start()
+                for pattern in _TECHNICAL_BY_FIRST_CHAR[text_lower[pos]]:
+                    match = pattern.match(text_lower, pos)
+                    if match:
+                        technical_terms.add(match.group())
+            elif found.group() not in COMPREHENSIVE_STOPWORDS:
+                meaningful_words.add(found.group())
 
-        # Extract other meaningful words (4+ chars, not stopwords)
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text_lower)
-        meaningful_words = {
-            w for w in words
-            if w not in COMPREHENSIVE_STOPWORDS
-        }
-
-        # Combine with structured skills
-        all_keywords = list(technical_terms | meaningful_words)
+        # Combine with structured skills, without duplicates
+        keyword_set = technical_terms | meaningful_words
 
         if required_skills:
-            all_keywords.extend([s.lower() for s in required_skills])
+            keyword_set.update(s.lower() for s in required_skills)
         if preferred_skills:
-            all_keywords.extend([s.lower() for s in preferred_skills])
+            keyword_set.update(s.lower() for s in preferred_skills)
 
-        # Remove duplicates
-        all_keywords = list(set(all_keywords))
+        all_keywords = list(keyword_set)
 
         # Create result (can't categorize without LLM, so put most in tools_technologies)
         result = KeywordExtractionResult(
@@ -508,15 +1015,18 @@ class LLMKeywordExtractor:
             soft_skills=[],
             tools_technologies=list(technical_terms),
             certifications=[],
-            domain_terms=list(meaningful_words - technical_terms)[:50],  # Limit domain terms
+            domain_terms=list(islice(  # Limit domain terms
+                (w for w in meaningful_words if w not in technical_terms), 50
+            )),
             is_llm_extracted=False
         )
 
+        # Keywords are deduplicated, so each is counted once
         result.all_keywords = all_keywords
-        result.keyword_frequencies = Counter(all_keywords)
+        result.keyword_frequencies = dict.fromkeys(all_keywords, 1)
 
         logger.info(f"Rule-based extracted {len(all_keywords)} keywords")
-        return result
+        return result.finalize()
 
     def _get_system_prompt(self) -> str:
         """Get system prompt for LLM extraction."""
@@ -555,35 +1065,50 @@ Be thorough but discriminating. Quality over quantity."""
         self,
         job_text: str,
         structured_skills: Dict[str, List[str]]
-    ) -> str:
-        """Build prompt for job description extraction."""
-        prompt = "Extract meaningful keywords from this job description.\n\n"
+    ) -> List[Dict[str, Any]]:
+        """Build prompt content blocks for job description extraction."""
+        prompt = "Extract meaningful keywords from the job description above.\n\n"
 
-        if structured_skills.get('required'):
-            prompt += f"Pre-identified Required Skills: {', '.join(structured_skills['required'])}\n"
-        if structured_skills.get('preferred'):
-            prompt += f"Pre-identified Preferred Skills: {', '.join(structured_skills['preferred'])}\n"
+        required = _canonical_skills(structured_skills.get('required', []))
+        preferred = _canonical_skills(structured_skills.get('preferred', []))
+        if required:
+            prompt += f"Pre-identified Required Skills: {', '.join(required)}\n"
+        if preferred:
+            prompt += f"Pre-identified Preferred Skills: {', '.join(preferred)}\n"
 
-        prompt += f"\nJob Description:\n{job_text}\n\n"
-        prompt += "Return only the JSON object, no additional text."
+        prompt += "\nReturn only the JSON object, no additional text."
 
-        return prompt
+        return self._build_prompt_blocks(f"Job Description:\n{job_text}", prompt)
 
     def _build_resume_extraction_prompt(
         self,
         resume_text: str,
         structured_skills: Dict[str, List[str]]
-    ) -> str:
-        """Build prompt for resume extraction."""
-        prompt = "Extract meaningful keywords from this resume.\n\n"
+    ) -> List[Dict[str, Any]]:
+        """Build prompt content blocks for resume extraction."""
+        prompt = "Extract meaningful keywords from the resume above.\n\n"
 
-        if structured_skills.get('existing'):
-            prompt += f"Pre-identified Skills: {', '.join(structured_skills['existing'])}\n\n"
+        existing = _canonical_skills(structured_skills.get('existing', []))
+        if existing:
+            prompt += f"Pre-identified Skills: {', '.join(existing)}\n\n"
 
-        prompt += f"Resume:\n{resume_text}\n\n"
         prompt += "Return only the JSON object, no additional text."
 
-        return prompt
+        return self._build_prompt_blocks(f"Resume:\n{resume_text}", prompt)
+
+    @staticmethod
+    def _build_prompt_blocks(document: str, instructions: str) -> List[Dict[str, Any]]:
+        """
+        Put the document ahead of the instructions as a cacheable prefix.
+
+        The system prompt and document form a stable prefix marked for
+        Anthropic prompt caching; instructions that vary with the
+        pre-identified skills follow it uncached.
+        """
+        return [
+            {"type": "text", "text": document, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": instructions}
+        ]
 
     def _parse_json_response(self, response_text: str) -> Optional[Dict]:
         """Parse JSON from LLM response."""
@@ -591,6 +1116,97 @@ Be thorough but discriminating. Quality over quantity."""
         return extract_json_object(response_text)
 
 
+# Anthropic clients shared by all extractors using the same API key, so that
+# repeated extractions reuse one HTTP connection pool
+_shared_clients: Dict[str, "Anthropic"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(api_key: str) -> "Anthropic":
+    """Get the process-wide Anthropic client for an API key."""
+    from anthropic import Anthropic
+
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = _shared_clients[api_key] = Anthropic(api_key=api_key)
+        return client
+
+
+# Async clients by event loop and API key. An async client's connection pool
+# belongs to the loop it was used in, so each loop gets its own clients.
+_shared_async_clients: Dict[asyncio.AbstractEventLoop, Dict[str, "AsyncAnthropic"]] = {}
+_per_loop_lock = threading.Lock()
+
+
+def _for_running_loop(store: Dict[asyncio.AbstractEventLoop, Any], create: Callable[[], Any]) -> Any:
+    """
+    Get the running event loop's value in store, creating it on first use.
+
+    Entries of closed loops are dropped then. Call with _per_loop_lock held.
+    """
+    loop = asyncio.get_running_loop()
+    value = store.get(loop)
+    if value is None:
+        for closed_loop in [other for other in store if other.is_closed()]:
+            del store[closed_loop]
+        value = store[loop] = create()
+    return value
+
+
+def _get_shared_async_client(api_key: str) -> "AsyncAnthropic":
+    """Get the running event loop's AsyncAnthropic client for an API key."""
+    from anthropic import AsyncAnthropic
+
+    with _per_loop_lock:
+        clients = _for_running_loop(_shared_async_clients, dict)
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = AsyncAnthropic(api_key=api_key)
+        return client
+
+
+# Claude extraction results, keyed by a content hash of the extraction inputs.
+# Entries are (context and skills key, result, text embedding or None).
+LLM_RESULT_CACHE_SIZE = 512
+_llm_result_cache: "OrderedDict[str, Tuple[Tuple, KeywordExtractionResult, Optional[np.ndarray]]]" = OrderedDict()
+_llm_result_cache_lock = threading.Lock()
+
+
+def _canonical_skills(skills: List[str]) -> List[str]:
+    """
+    Strip, deduplicate and sort pre-identified skills for a prompt.
+
+    Duplicates are found case-insensitively and keep their first spelling,
+    so equivalent skill lists always produce the same prompt text.
+    """
+    unique: Dict[str, str] = {}
+    for skill in skills:
+        skill = skill.strip()
+        if skill:
+            unique.setdefault(skill.lower(), skill)
+    return [unique[key] for key in sorted(unique)]
+
+
+def _skills_cache_key(context: str, structured_skills: Dict[str, List[str]]) -> Tuple:
+    """Canonical form of the context and pre-identified skills sent with a text."""
+    return (context,) + tuple(
+        (name, tuple(_canonical_skills(skills))) for name, skills in sorted(structured_skills.items())
+    )
+
+
+def _llm_result_cache_key(text: str, skills_key: Tuple) -> str:
+    """Hash the text together with its context and skills key."""
+    payload = json.dumps([text, skills_key])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def clear_llm_result_cache():
+    """Discard all cached Claude keyword extraction results."""
+    with _llm_result_cache_lock:
+        _llm_result_cache.clear()
+
+
 # Convenience functions
 def extract_job_keywords(
     job_text: str,
@@ -632,3 +1248,28 @@ def extract_resume_keywords(
     """
     extractor = LLMKeywordExtractor(api_key=api_key)
     return extractor.extract_from_resume(resume_text, structured_skills)
+
+
+def extract_job_keywords_batch(
+    jobs: List[Tuple[str, Optional[List[str]], Optional[List[str]]]],
+    api_key: Optional[str] = None
+) -> List[KeywordExtractionResult]:
+    """
+    Extract keywords from many job descriptions in one batch.
+
+    Args:
+        jobs: (job_text, required_skills, preferred_skills) tuples
+        api_key: Anthropic API key (optional)
+
+    Returns:
+        One KeywordExtractionResult per job, in input order
+    """
+    extractor = LLMKeywordExtractor(api_key=api_key)
+    return extractor.extract_batch([
+        (
+            job_text,
+            "job_description",
+            {'required': required_skills or [], 'preferred': preferred_skills or []}
+        )
+        for job_text, required_skills, preferred_skills in jobs
+    ])
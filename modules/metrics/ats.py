@@ -6,10 +6,38 @@ IMPROVED VERSION: Uses comprehensive stopwords for accurate keyword extraction.
 """
 
 import re
-from typing import Set
-from .base import MetricCalculator, MetricScore
+from functools import lru_cache
+from typing import FrozenSet
+from .base import MetricCalculator, MetricScore, cached_score, resume_view
 from modules.llm_keyword_extractor import COMPREHENSIVE_STOPWORDS
 
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+# Text between common sentence terminators, from its first non-blank character
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+_TAB_RUN_RE = re.compile(r'\t{2,}')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s\.,\-:;()\'"!?]')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# str.translate table deleting every ASCII character _SPECIAL_CHAR_RE allows
+_ALLOWED_ASCII = {i: None for i in range(128) if not _SPECIAL_CHAR_RE.match(chr(i))}
+
+# Standard sections to look for, one named group per section
+_SECTIONS_RE = re.compile(
+    r'\b(?P<experience>experience|work history|employment)\b'
+    r'|\b(?P<education>education|academic|degrees?)\b'
+    r'|\b(?P<skills>skills|technical skills|competencies)\b'
+    r'|\b(?P<summary>summary|profile|objective)\b'
+)
+
+
+@lru_cache(maxsize=32)
+def _extract_jd_keywords(text: str) -> FrozenSet[str]:
+    """Extract filtered keywords, cached per text so resumes scored against one JD share them."""
+    words = _KEYWORD_RE.findall(text.lower())
+
+    # Use comprehensive stopword list (400+ words)
+    return frozenset(w for w in words if w not in COMPREHENSIVE_STOPWORDS)
+
 
 class ATSScorer(MetricCalculator):
     """Calculates ATS optimization score based on formatting and keywords."""
@@ -17,13 +45,16 @@ class ATSScorer(MetricCalculator):
     def __init__(self, threshold: float = 0.80):
         self.threshold = threshold
 
+    @cached_score
     def calculate(self, original_resume: str, optimized_resume: str, job_description: str) -> MetricScore:
         """Calculate ATS optimization score."""
 
         # Component scores
-        keyword_density_score = self._calculate_keyword_density(optimized_resume, job_description)
+        keyword_density_pct = self._get_keyword_density_pct(optimized_resume, job_description)
+        keyword_density_score = self._calculate_keyword_density(keyword_density_pct)
         format_score = self._calculate_format_score(optimized_resume)
-        structure_score = self._calculate_structure_score(optimized_resume)
+        sections = self._has_standard_sections(optimized_resume)
+        structure_score = self._calculate_structure_score(sections)
         readability_score = self._calculate_readability_score(optimized_resume)
 
         # Weighted overall score
@@ -56,9 +87,9 @@ class ATSScorer(MetricCalculator):
                 "format_score": format_score,
                 "structure_score": structure_score,
                 "readability_score": readability_score,
-                "keyword_density_pct": self._get_keyword_density_pct(optimized_resume, job_description),
+                "keyword_density_pct": round(keyword_density_pct, 2),
                 "avg_sentence_length": self._get_avg_sentence_length(optimized_resume),
-                "has_standard_sections": self._has_standard_sections(optimized_resume)
+                "has_standard_sections": sections
             },
             recommendations=recommendations
         )
@@ -66,28 +97,11 @@ class ATSScorer(MetricCalculator):
     def get_threshold(self) -> float:
         return self.threshold
 
-    def _calculate_keyword_density(self, resume: str, job_description: str) -> float:
+    def _calculate_keyword_density(self, density_pct: float) -> float:
         """
         Calculate keyword density score.
         Optimal range: 2-8% of resume words should be JD keywords.
         """
-        # Extract keywords from job description
-        jd_keywords = self._extract_keywords(job_description)
-
-        # Count keyword occurrences in resume
-        resume_lower = resume.lower()
-        keyword_count = 0
-        for keyword in jd_keywords:
-            keyword_count += len(re.findall(r'\b' + re.escape(keyword) + r'\b', resume_lower))
-
-        # Total words in resume
-        total_words = len(re.findall(r'\b\w+\b', resume))
-
-        if total_words == 0:
-            return 0.0
-
-        density_pct = (keyword_count / total_words) * 100
-
         # Score based on optimal range (2-8%)
         if 2 <= density_pct <= 8:
             return 1.0
@@ -101,18 +115,26 @@ class ATSScorer(MetricCalculator):
             return max(0.0, 1.0 - ((density_pct - 8) / 7.0))
 
     def _get_keyword_density_pct(self, resume: str, job_description: str) -> float:
-        """Get actual keyword density percentage for display."""
+        """Get keyword density as a percentage of resume words."""
+        # Extract keywords from job description
         jd_keywords = self._extract_keywords(job_description)
-        resume_lower = resume.lower()
-        keyword_count = 0
-        for keyword in jd_keywords:
-            keyword_count += len(re.findall(r'\b' + re.escape(keyword) + r'\b', resume_lower))
+        if not jd_keywords:
+            return 0.0
+
+        # Keywords are runs of letters, so every whole-word match is exactly
+        # one word token: count tokens once instead of a regex pass per keyword
+        view = resume_view(resume)
+        token_counts = view.lower_word_counts
+        keyword_count = sum(token_counts[keyword] for keyword in jd_keywords)
+
+        # Total words in resume (counted on the original text, since
+        # lowercasing can split non-ASCII tokens)
+        total_words = view.word_count
 
-        total_words = len(re.findall(r'\b\w+\b', resume))
         if total_words == 0:
             return 0.0
 
-        return round((keyword_count / total_words) * 100, 2)
+        return (keyword_count / total_words) * 100
 
     def _calculate_format_score(self, resume: str) -> float:
         """
@@ -122,15 +144,23 @@ class ATSScorer(MetricCalculator):
         score = 1.0
 
         # Penalize table-like structures (multiple consecutive tabs)
-        table_patterns = len(re.findall(r'\t{2,}', resume))
+        table_patterns = len(_TAB_RUN_RE.findall(resume)) if '\t\t' in resume else 0
         score -= min(0.3, table_patterns * 0.05)
 
-        # Penalize excessive special characters (except common punctuation)
-        special_chars = len(re.findall(r'[^\w\s\.,\-:;()\'"!?]', resume))
+        # Count special characters (except common punctuation) and non-ASCII
+        # characters. For ASCII text, deleting the allowed characters in one
+        # C-level translate leaves exactly the special ones.
+        if resume.isascii():
+            special_chars = len(resume.translate(_ALLOWED_ASCII))
+            non_ascii = 0
+        else:
+            special_chars = len(_SPECIAL_CHAR_RE.findall(resume))
+            non_ascii = len(resume) - len(resume.encode('ascii', 'ignore'))
+
+        # Penalize excessive special characters
         score -= min(0.2, special_chars * 0.001)
 
         # Penalize non-ASCII characters
-        non_ascii = len([c for c in resume if ord(c) > 127])
         score -= min(0.2, non_ascii * 0.001)
 
         # Penalize very long lines (> 100 chars) - may indicate formatting issues
@@ -138,30 +168,17 @@ class ATSScorer(MetricCalculator):
         score -= min(0.15, long_lines * 0.01)
 
         # Penalize multiple consecutive blank lines
-        blank_line_groups = len(re.findall(r'\n\s*\n\s*\n', resume))
+        blank_line_groups = len(_BLANK_LINES_RE.findall(resume))
         score -= min(0.15, blank_line_groups * 0.02)
 
         return max(0.0, score)
 
-    def _calculate_structure_score(self, resume: str) -> float:
+    def _calculate_structure_score(self, sections: dict) -> float:
         """
         Calculate structure score.
         Check for standard resume sections.
         """
-        resume_lower = resume.lower()
-
-        # Standard sections to look for
-        sections = {
-            'experience': r'\b(experience|work history|employment)\b',
-            'education': r'\b(education|academic|degrees?)\b',
-            'skills': r'\b(skills|technical skills|competencies)\b',
-            'summary': r'\b(summary|profile|objective)\b',
-        }
-
-        found_sections = 0
-        for section_name, pattern in sections.items():
-            if re.search(pattern, resume_lower):
-                found_sections += 1
+        found_sections = sum(sections.values())
 
         # At minimum should have: Experience, Education, Skills (3 out of 4)
         # Full score for all 4, partial for 3, lower for 2 or fewer
@@ -178,14 +195,15 @@ class ATSScorer(MetricCalculator):
 
     def _has_standard_sections(self, resume: str) -> dict:
         """Return which standard sections are present."""
-        resume_lower = resume.lower()
+        found = dict.fromkeys(_SECTIONS_RE.groupindex, False)
 
-        return {
-            'experience': bool(re.search(r'\b(experience|work history|employment)\b', resume_lower)),
-            'education': bool(re.search(r'\b(education|academic|degrees?)\b', resume_lower)),
-            'skills': bool(re.search(r'\b(skills|technical skills|competencies)\b', resume_lower)),
-            'summary': bool(re.search(r'\b(summary|profile|objective)\b', resume_lower))
-        }
+        # Section names are whole words, so matches never hide one another
+        for match in _SECTIONS_RE.finditer(resume_view(resume).lower):
+            found[match.lastgroup] = True
+            if all(found.values()):
+                break
+
+        return found
 
     def _calculate_readability_score(self, resume: str) -> float:
         """
@@ -208,26 +226,22 @@ class ATSScorer(MetricCalculator):
 
     def _get_avg_sentence_length(self, resume: str) -> float:
         """Get average sentence length in words."""
-        # Split by common sentence terminators
-        sentences = re.split(r'[.!?]+', resume)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Count non-blank sentences between terminators
+        num_sentences = len(_SENTENCE_RE.findall(resume))
 
-        if not sentences:
+        if not num_sentences:
             return 0.0
 
-        total_words = sum(len(re.findall(r'\b\w+\b', s)) for s in sentences)
-        return round(total_words / len(sentences), 1)
+        # Words never span terminators, so the resume's word count is the
+        # total over all sentences
+        total_words = resume_view(resume).word_count
+        return round(total_words / num_sentences, 1)
 
-    def _extract_keywords(self, text: str) -> Set[str]:
+    def _extract_keywords(self, text: str) -> FrozenSet[str]:
         """
         Extract keywords (4+ character words, filtered).
 
         IMPROVED: Now uses comprehensive stopword list (400+ words)
         instead of the inadequate 30-word list.
         """
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-
-        # Use comprehensive stopword list (400+ words)
-        keywords = {w for w in words if w not in COMPREHENSIVE_STOPWORDS}
-
-        return keywords
+        return _extract_jd_keywords(text)
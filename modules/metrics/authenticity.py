@@ -4,8 +4,56 @@ Ensures optimized resume claims are grounded in original resume.
 """
 
 import re
-from typing import List, Set, Tuple
-from .base import MetricCalculator, MetricScore
+from typing import FrozenSet, List, Set, Tuple
+from .base import WORD_RE, MetricCalculator, MetricScore, cached_score, resume_view
+
+# Bullet points and numbered list items, one per line
+_BULLET_RE = re.compile(r'^[^\S\n]*(?:[-•*]|\d+\.)[^\S\n]+(.+)$', re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_CLAIM_SIGNAL_RE = re.compile(
+    r'\d+[%$]?|\b(increased|decreased|improved|reduced|grew|managed|led)\b',
+    re.IGNORECASE
+)
+_METRIC_RE = re.compile(r'\b\d+(?:\.\d+)?[%$]?\b')
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PERCENT_RE = re.compile(r'\b(\d+(?:\.\d+)?)%')
+# Capitalized words and phrases. Leading with [A-Z] lets the regex engine skip
+# ahead to candidate letters; the lookbehind is the opening \b.
+_CAPITALIZED_RE = re.compile(r'[A-Z](?<!\w[A-Z])[a-z]+\b')
+_CAPITALIZED_PHRASE_RE = re.compile(r'[A-Z](?<!\w[A-Z])[a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+_FACT_TECH_TERMS = (
+    'Python', 'Java', 'JavaScript', 'React', 'AWS', 'Docker', 'Kubernetes', 'SQL',
+    'Machine Learning', 'AI', 'API', 'Cloud', 'Agile', 'Scrum'
+)
+_CLAIM_TECH_TERMS = ('Python', 'Java', 'JavaScript', 'React', 'AWS', 'Docker', 'SQL', 'API')
+_ROLE_TERMS = (
+    'Engineer', 'Developer', 'Manager', 'Lead', 'Director', 'Analyst', 'Architect',
+    'Designer', 'Scientist', 'Specialist', 'Consultant'
+)
+
+
+def _terms_pattern(terms: Tuple[str, ...], flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile a whole-word alternation of terms."""
+    return re.compile(r'\b(?:' + '|'.join(terms) + r')\b', flags)
+
+
+def _single_words(terms: Tuple[str, ...]) -> FrozenSet[str]:
+    """Get the lowercased one-word terms."""
+    return frozenset(term.lower() for term in terms if ' ' not in term)
+
+
+# Case-insensitive scans, used as-is on non-ASCII text. ASCII lowercasing keeps
+# word boundaries, so there single-word terms are found as whole word tokens.
+_FACT_TECH_RE = _terms_pattern(_FACT_TECH_TERMS)
+_CLAIM_TECH_RE = _terms_pattern(_CLAIM_TECH_TERMS)
+_ROLE_RE = _terms_pattern(_ROLE_TERMS)
+_FACT_TECH_WORDS = _single_words(_FACT_TECH_TERMS)
+_CLAIM_TECH_WORDS = _single_words(_CLAIM_TECH_TERMS)
+_ROLE_WORDS = _single_words(_ROLE_TERMS)
+_FACT_TECH_PHRASE_RE = _terms_pattern(
+    tuple(term.lower() for term in _FACT_TECH_TERMS if ' ' in term), flags=0
+)
 
 
 class AuthenticityScorer(MetricCalculator):
@@ -26,21 +74,25 @@ class AuthenticityScorer(MetricCalculator):
         """
         self.threshold = threshold
 
+    @cached_score
     def calculate(self, original_resume: str, optimized_resume: str, job_description: str) -> MetricScore:
         """Calculate authenticity score."""
 
         # Extract claims from optimized resume
         optimized_claims = self._extract_claims(optimized_resume)
 
-        # Extract facts from original resume
-        original_facts = self._extract_facts(original_resume)
+        # Extract facts from original resume, sharing its numbers and
+        # capitalized terms with the red-flag checks
+        original_terms = self._extract_numbers_and_caps(original_resume)
+        original_facts = self._extract_facts(original_resume, original_terms)
+        original_lower = resume_view(original_resume).lower
 
         # Check for unsupported claims
         unsupported_claims = []
         supported_count = 0
 
         for claim in optimized_claims:
-            if self._is_claim_supported(claim, original_facts, original_resume):
+            if self._is_claim_supported(claim, original_facts, original_lower):
                 supported_count += 1
             else:
                 unsupported_claims.append(claim)
@@ -52,7 +104,7 @@ class AuthenticityScorer(MetricCalculator):
             score = 1.0  # No claims to verify
 
         # Detect specific red flags
-        red_flags = self._detect_red_flags(original_resume, optimized_resume)
+        red_flags = self._detect_red_flags(original_resume, optimized_resume, original_terms)
 
         # Penalize for red flags
         if red_flags:
@@ -105,32 +157,30 @@ class AuthenticityScorer(MetricCalculator):
         """
         claims = []
 
-        # Extract bullet points
-        bullet_patterns = [
-            r'^\s*[-•*]\s+(.+)$',  # Standard bullets
-            r'^\s*\d+\.\s+(.+)$',   # Numbered lists
-        ]
-
-        for line in resume.split('\n'):
-            for pattern in bullet_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    claim = match.group(1).strip()
-                    if claim:
-                        claims.append(claim)
+        # Extract bullet points (standard bullets and numbered lists)
+        for match in _BULLET_RE.finditer(resume):
+            claim = match.group(1).strip()
+            if claim:
+                claims.append(claim)
 
         # Also extract sentences with quantifiable metrics
-        sentences = re.split(r'[.!?]+', resume)
+        seen = set(claims)
+        sentences = _SENTENCE_SPLIT_RE.split(resume)
         for sentence in sentences:
             sentence = sentence.strip()
             # Look for numbers, percentages, metrics
-            if re.search(r'\d+[%$]?|\b(increased|decreased|improved|reduced|grew|managed|led)\b', sentence, re.IGNORECASE):
-                if sentence and sentence not in claims:
+            if _CLAIM_SIGNAL_RE.search(sentence):
+                if sentence and sentence not in seen:
+                    seen.add(sentence)
                     claims.append(sentence)
 
         return claims
 
-    def _extract_facts(self, resume: str) -> Set[str]:
+    def _extract_numbers_and_caps(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Get the numbers/percentages and capitalized terms of a text."""
+        return set(_METRIC_RE.findall(text)), set(_CAPITALIZED_PHRASE_RE.findall(text))
+
+    def _extract_facts(self, resume: str, numbers_and_caps: Tuple[Set[str], Set[str]] = None) -> Set[str]:
         """
         Extract facts from original resume.
 
@@ -140,38 +190,37 @@ class AuthenticityScorer(MetricCalculator):
         - Technologies/tools
         - Skills
         - Role titles
+
+        numbers_and_caps may pass in _extract_numbers_and_caps(resume).
         """
-        facts = set()
-
-        # Extract numbers/percentages
-        numbers = re.findall(r'\b\d+(?:\.\d+)?[%$]?\b', resume)
-        facts.update(numbers)
-
-        # Extract capitalized terms (likely proper nouns, technologies, companies)
-        capitalized = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', resume)
-        facts.update(capitalized)
-
-        # Extract technical terms
-        tech_terms = re.findall(
-            r'\b(?:Python|Java|JavaScript|React|AWS|Docker|Kubernetes|SQL|'
-            r'Machine Learning|AI|API|Cloud|Agile|Scrum)\b',
-            resume,
-            re.IGNORECASE
-        )
-        facts.update([t.lower() for t in tech_terms])
-
-        # Extract role-related terms
-        role_terms = re.findall(
-            r'\b(?:Engineer|Developer|Manager|Lead|Director|Analyst|Architect|'
-            r'Designer|Scientist|Specialist|Consultant)\b',
-            resume,
-            re.IGNORECASE
-        )
-        facts.update([r.lower() for r in role_terms])
+        numbers, capitalized = numbers_and_caps or self._extract_numbers_and_caps(resume)
+
+        # Numbers/percentages and capitalized terms (likely proper nouns,
+        # technologies, companies)
+        facts = numbers | capitalized
+
+        if resume.isascii():
+            view = resume_view(resume)
+            words = view.lower_word_counts.keys()
+
+            # Extract technical terms
+            facts.update(words & _FACT_TECH_WORDS)
+            facts.update(_FACT_TECH_PHRASE_RE.findall(view.lower))
+
+            # Extract role-related terms
+            facts.update(words & _ROLE_WORDS)
+        else:
+            # Extract technical terms
+            tech_terms = _FACT_TECH_RE.findall(resume)
+            facts.update([t.lower() for t in tech_terms])
+
+            # Extract role-related terms
+            role_terms = _ROLE_RE.findall(resume)
+            facts.update([r.lower() for r in role_terms])
 
         return facts
 
-    def _is_claim_supported(self, claim: str, facts: Set[str], original_resume: str) -> bool:
+    def _is_claim_supported(self, claim: str, facts: Set[str], original_lower: str) -> bool:
         """
         Check if a claim is supported by facts in original resume.
 
@@ -179,29 +228,30 @@ class AuthenticityScorer(MetricCalculator):
         1. Key numbers/metrics appear in original
         2. Technologies/tools mentioned exist in original
         3. General claim structure is similar to original content
-        """
-        claim_lower = claim.lower()
 
+        original_lower is the lowercased original resume, computed once per
+        resume rather than once per claim.
+        """
         # Extract numbers from claim
-        claim_numbers = set(re.findall(r'\b\d+(?:\.\d+)?[%$]?\b', claim))
+        claim_numbers = _METRIC_RE.findall(claim)
 
         # Check if numbers exist in facts
         if claim_numbers:
-            # At least one number should be in facts
-            if not claim_numbers.intersection(facts):
+            # At least one number should be in facts (probing the facts set
+            # per number, without building an intersection)
+            if facts.isdisjoint(claim_numbers):
                 return False
 
         # Extract key terms from claim
-        claim_terms = set(re.findall(r'\b[A-Z][a-z]+\b', claim))
-        claim_terms.update(re.findall(
-            r'\b(?:Python|Java|JavaScript|React|AWS|Docker|SQL|API)\b',
-            claim,
-            re.IGNORECASE
-        ))
+        claim_terms = set(_CAPITALIZED_RE.findall(claim))
+        if claim.isascii():
+            claim_terms.update(w for w in WORD_RE.findall(claim) if w.lower() in _CLAIM_TECH_WORDS)
+        else:
+            claim_terms.update(_CLAIM_TECH_RE.findall(claim))
 
         # Check if key terms exist in original
         if claim_terms:
-            matching_terms = sum(1 for term in claim_terms if term.lower() in original_resume.lower())
+            matching_terms = sum(1 for term in claim_terms if term.lower() in original_lower)
             if matching_terms / len(claim_terms) < 0.5:
                 # Less than 50% of terms match
                 return False
@@ -209,7 +259,12 @@ class AuthenticityScorer(MetricCalculator):
         # If we got here, claim seems reasonably supported
         return True
 
-    def _detect_red_flags(self, original: str, optimized: str) -> List[str]:
+    def _detect_red_flags(
+        self,
+        original: str,
+        optimized: str,
+        original_numbers_and_caps: Tuple[Set[str], Set[str]] = None
+    ) -> List[str]:
         """
         Detect red flags that might indicate fabrication.
 
@@ -218,12 +273,18 @@ class AuthenticityScorer(MetricCalculator):
         - Inflated percentages (>50% increase)
         - New company names
         - New roles/titles not in original
+
+        original_numbers_and_caps may pass in _extract_numbers_and_caps(original).
         """
         red_flags = []
+        original_metrics, original_caps = (
+            original_numbers_and_caps or self._extract_numbers_and_caps(original)
+        )
 
-        # Extract numbers from both
-        original_numbers = set(re.findall(r'\b\d+(?:\.\d+)?\b', original))
-        optimized_numbers = set(re.findall(r'\b\d+(?:\.\d+)?\b', optimized))
+        # Extract numbers from both (a metric without its %/$ unit is
+        # exactly a plain number match)
+        original_numbers = {metric.rstrip('%$') for metric in original_metrics}
+        optimized_numbers = set(_NUMBER_RE.findall(optimized))
 
         # Check for new numbers
         new_numbers = optimized_numbers - original_numbers
@@ -231,18 +292,15 @@ class AuthenticityScorer(MetricCalculator):
             red_flags.append(f"{len(new_numbers)} new numbers not found in original")
 
         # Check for percentage inflation
-        original_percentages = [float(x) for x in re.findall(r'\b(\d+(?:\.\d+)?)%', original)]
-        optimized_percentages = [float(x) for x in re.findall(r'\b(\d+(?:\.\d+)?)%', optimized)]
+        max_orig = max(map(float, _PERCENT_RE.findall(original)), default=None)
+        max_opt = max(map(float, _PERCENT_RE.findall(optimized)), default=None)
 
-        if optimized_percentages and original_percentages:
-            max_opt = max(optimized_percentages)
-            max_orig = max(original_percentages) if original_percentages else 0
+        if max_opt is not None and max_orig is not None:
             if max_opt > max_orig * 1.5:
                 red_flags.append(f"Percentage inflation detected: {max_opt}% vs {max_orig}%")
 
         # Check for new capitalized terms (potential new companies/technologies)
-        original_caps = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', original))
-        optimized_caps = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', optimized))
+        optimized_caps = set(_CAPITALIZED_PHRASE_RE.findall(optimized))
 
         new_caps = optimized_caps - original_caps
         # Filter out common words
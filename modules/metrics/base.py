@@ -1,11 +1,26 @@
 """Base classes for metric calculation."""
 
+import copy
+import functools
+import re
+import threading
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
+from utils.logging_config import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
+# Scores kept per scorer instance by cached_score
+SCORE_CACHE_SIZE = 16
+_score_cache_lock = threading.Lock()
+
+# Maximal run of word characters, matching how \b delimits words
+WORD_RE = re.compile(r'\w+')
+
+
+@dataclass(slots=True)
 class MetricScore:
     """Generic metric score result."""
     name: str
@@ -27,6 +42,40 @@ class MetricScore:
         }
 
 
+class ResumeView:
+    """
+    Lazily computed derivatives of a resume text, shared by the scorers.
+
+    Get views through resume_view() so every scorer handed the same text
+    reuses one view and each derivative is computed at most once. Treat the
+    derivatives as read-only.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @functools.cached_property
+    def lower(self) -> str:
+        """Lowercased text."""
+        return self.text.lower()
+
+    @functools.cached_property
+    def word_count(self) -> int:
+        """Number of words (\\w+ runs) in the text."""
+        return len(WORD_RE.findall(self.text))
+
+    @functools.cached_property
+    def lower_word_counts(self) -> Counter:
+        """Occurrences of each word in the lowercased text."""
+        return Counter(WORD_RE.findall(self.lower))
+
+
+@functools.lru_cache(maxsize=8)
+def resume_view(text: str) -> ResumeView:
+    """Get the shared view of a text."""
+    return ResumeView(text)
+
+
 class MetricCalculator(ABC):
     """Base class for all metric calculators."""
 
@@ -49,3 +98,55 @@ class MetricCalculator(ABC):
     def get_threshold(self) -> float:
         """Return the minimum acceptable score for this metric."""
         pass
+
+    def _cache_key(self, original_resume: str, optimized_resume: str, job_description: str) -> tuple:
+        """
+        Key for cached scores (see cached_score).
+
+        Scorers whose results depend on settings other than the threshold
+        extend this key with them.
+        """
+        return (original_resume, optimized_resume, job_description, self.get_threshold())
+
+    def _should_cache_score(self, score: MetricScore) -> bool:
+        """
+        Whether cached_score may keep this score.
+
+        Scorers whose results can come from a degraded fallback decline to
+        cache those, so later calls retry.
+        """
+        return True
+
+
+def cached_score(calculate: Callable[..., MetricScore]) -> Callable[..., MetricScore]:
+    """
+    Cache a scorer's calculate() results per instance, keyed by _cache_key.
+
+    Keeps the SCORE_CACHE_SIZE most recently used scores that
+    _should_cache_score accepts. Callers get copies, so they can modify
+    details and recommendations freely.
+    """
+    @functools.wraps(calculate)
+    def wrapper(self, original_resume: str, optimized_resume: str, job_description: str) -> MetricScore:
+        key = self._cache_key(original_resume, optimized_resume, job_description)
+
+        with _score_cache_lock:
+            cache = self.__dict__.setdefault('_score_cache', OrderedDict())
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                logger.info(f"{type(self).__name__} score cache hit")
+                return copy.deepcopy(cached)
+
+        score = calculate(self, original_resume, optimized_resume, job_description)
+        if not self._should_cache_score(score):
+            return score
+
+        with _score_cache_lock:
+            cache[key] = copy.deepcopy(score)
+            while len(cache) > SCORE_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return score
+
+    return wrapper
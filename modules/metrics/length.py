@@ -3,8 +3,8 @@ Length Compliance Metric
 Ensures resume fits within target page count.
 """
 
-import re
-from .base import MetricCalculator, MetricScore
+from typing import Tuple
+from .base import MetricCalculator, MetricScore, cached_score, resume_view
 
 
 class LengthScorer(MetricCalculator):
@@ -21,11 +21,13 @@ class LengthScorer(MetricCalculator):
         self.target_pages = target_pages
         self.threshold = threshold
 
+    @cached_score
     def calculate(self, original_resume: str, optimized_resume: str, job_description: str) -> MetricScore:
         """Calculate length compliance score."""
 
         # Estimate page count
-        estimated_pages = self._estimate_pages(optimized_resume)
+        char_count, word_count, line_count = self._text_stats(optimized_resume)
+        estimated_pages = self._pages_from_stats(char_count, word_count, line_count)
 
         # Calculate compliance score
         if estimated_pages <= self.target_pages:
@@ -67,9 +69,9 @@ class LengthScorer(MetricCalculator):
             details={
                 "target_pages": self.target_pages,
                 "estimated_pages": round(estimated_pages, 2),
-                "total_characters": len(optimized_resume),
-                "total_words": self._count_words(optimized_resume),
-                "total_lines": len(optimized_resume.split('\n')),
+                "total_characters": char_count,
+                "total_words": word_count,
+                "total_lines": line_count,
                 "compliance_status": "Within target" if estimated_pages <= self.target_pages else f"Exceeds by {estimated_pages - self.target_pages:.1f} pages"
             },
             recommendations=recommendations
@@ -78,6 +80,9 @@ class LengthScorer(MetricCalculator):
     def get_threshold(self) -> float:
         return self.threshold
 
+    def _cache_key(self, original_resume: str, optimized_resume: str, job_description: str) -> tuple:
+        return super()._cache_key(original_resume, optimized_resume, job_description) + (self.target_pages,)
+
     def _estimate_pages(self, resume: str) -> float:
         """
         Estimate number of pages for the resume.
@@ -89,10 +94,14 @@ class LengthScorer(MetricCalculator):
 
         Returns weighted average.
         """
-        char_count = len(resume)
-        word_count = self._count_words(resume)
-        line_count = len(resume.split('\n'))
+        return self._pages_from_stats(*self._text_stats(resume))
+
+    def _text_stats(self, text: str) -> Tuple[int, int, int]:
+        """Get character, word and line counts of text."""
+        return len(text), self._count_words(text), text.count('\n') + 1
 
+    def _pages_from_stats(self, char_count: int, word_count: int, line_count: int) -> float:
+        """Estimate pages from character, word and line counts."""
         # Estimation formulas
         # Standard page: ~3000 chars, ~500 words, ~45 lines (single-spaced with spacing)
         pages_by_chars = char_count / 3000.0
@@ -106,4 +115,4 @@ class LengthScorer(MetricCalculator):
 
     def _count_words(self, text: str) -> int:
         """Count words in text."""
-        return len(re.findall(r'\b\w+\b', text))
+        return resume_view(text).word_count
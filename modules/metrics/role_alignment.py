@@ -5,17 +5,74 @@ Measures how well the resume matches job requirements.
 IMPROVED VERSION: Uses LLM-based keyword extraction and comprehensive stopwords.
 """
 
+import heapq
 import re
-from typing import List, Set, Dict
-from .base import MetricCalculator, MetricScore
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Dict
+from .base import MetricCalculator, MetricScore, cached_score
 from modules.llm_keyword_extractor import (
     LLMKeywordExtractor,
+    KeywordExtractionResult,
     COMPREHENSIVE_STOPWORDS
 )
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Common technical terms (expand this list)
+TECHNICAL_TERM_PATTERNS = (
+    # Programming languages
+    r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\btypescript\b',
+    r'\bc\+\+\b', r'\bc#\b', r'\bruby\b', r'\bgo\b', r'\brust\b',
+    r'\bswift\b', r'\bkotlin\b', r'\bphp\b', r'\bscala\b', r'\bc\b',
+
+    # Frameworks
+    r'\breact\b', r'\bangular\b', r'\bvue\b', r'\bdjango\b',
+    r'\bflask\b', r'\bspring\b', r'\bexpress\b', r'\bnode\.?js\b',
+    r'\bnext\.?js\b', r'\btensorflow\b', r'\bpytorch\b', r'\bjquery\b',
+    r'\bbootstrap\b', r'\btailwind\b', r'\b\.net\b', r'\basp\.net\b',
+
+    # Databases
+    r'\bpostgresql\b', r'\bpostgres\b', r'\bmysql\b', r'\bmongodb\b',
+    r'\bredis\b', r'\belasticsearch\b', r'\bcassandra\b', r'\bsql\b',
+    r'\bnosql\b', r'\bsqlite\b', r'\boracle\b', r'\bdynamodb\b',
+
+    # Cloud/DevOps
+    r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bdocker\b',
+    r'\bkubernetes\b', r'\bk8s\b', r'\bterraform\b', r'\bjenkins\b',
+    r'\bgithub actions\b', r'\bci/cd\b', r'\bansible\b', r'\bhelm\b',
+
+    # Tools & Methodologies
+    r'\bgit\b', r'\blinux\b', r'\bapi\b', r'\brest\b', r'\bgraphql\b',
+    r'\bmicroservices\b', r'\bagile\b', r'\bscrum\b', r'\bkanban\b',
+    r'\bjira\b', r'\bconfluence\b', r'\bslack\b', r'\btrello\b',
+
+    # Data & ML
+    r'\bmachine learning\b', r'\bdeep learning\b', r'\bnlp\b',
+    r'\bdata science\b', r'\bpandas\b', r'\bnumpy\b', r'\bscikit-learn\b',
+    r'\bspark\b', r'\bhadoop\b', r'\bairflow\b', r'\btableauб\b',
+
+    # Testing
+    r'\bpytest\b', r'\bjest\b', r'\bmocha\b', r'\bjunit\b',
+    r'\bselenium\b', r'\bcypress\b', r'\bunit test\b',
+
+    # Other
+    r'\bhtml\b', r'\bcss\b', r'\bsass\b', r'\bwebpack\b',
+    r'\bbabel\b', r'\bnpm\b', r'\byarn\b', r'\bvscode\b'
+)
+
+# Zero-width scan marking every position where any technical pattern matches,
+# so overlapping terms (".net" within "asp.net", "c" within "c++") are all
+# still found
+_TECHNICAL_SCAN_RE = re.compile('(?=' + '|'.join(TECHNICAL_TERM_PATTERNS) + ')')
+_TECHNICAL_BY_FIRST_CHAR: Dict[str, List[re.Pattern]] = {}
+for _pattern in TECHNICAL_TERM_PATTERNS:
+    # Literal first character after the leading \b, unescaped
+    _first = _pattern[3] if _pattern[2] == '\\' else _pattern[2]
+    _TECHNICAL_BY_FIRST_CHAR.setdefault(_first, []).append(re.compile(_pattern))
+
 
 class RoleAlignmentScorer(MetricCalculator):
     """
@@ -38,6 +95,7 @@ class RoleAlignmentScorer(MetricCalculator):
         self.llm_extractor = LLMKeywordExtractor(api_key=api_key)
         logger.info(f"RoleAlignmentScorer initialized (threshold={threshold})")
 
+    @cached_score
     def calculate(self, original_resume: str, optimized_resume: str, job_description: str) -> MetricScore:
         """
         Calculate role alignment score using intelligent LLM-based extraction.
@@ -47,7 +105,55 @@ class RoleAlignmentScorer(MetricCalculator):
         """
         logger.info("Calculating role alignment score with LLM extraction")
 
-        # Extract keywords from job description using LLM
+        # The two extractions are independent Claude calls, so the job
+        # description is extracted in a worker thread while the resume is
+        # extracted here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            jd_future = executor.submit(self._extract_job_keywords, job_description)
+            resume_extraction = self._extract_resume_keywords(optimized_resume)
+            jd_extraction = jd_future.result()
+
+        return self._score_extractions(job_description, jd_extraction, optimized_resume, resume_extraction)
+
+    def calculate_batch(
+        self,
+        optimized_resumes: List[str],
+        job_description: str,
+        max_workers: Optional[int] = None
+    ) -> List[MetricScore]:
+        """
+        Calculate role alignment scores for many resumes against one job.
+
+        The job description is extracted once, and the resumes are extracted
+        concurrently alongside it.
+
+        Args:
+            optimized_resumes: Resume texts to score
+            job_description: Target job description
+            max_workers: Concurrent extractions (default:
+                         LLMKeywordExtractor.MAX_CONCURRENT_REQUESTS)
+
+        Returns:
+            One MetricScore per resume, in input order
+        """
+        if not optimized_resumes:
+            return []
+
+        logger.info(f"Calculating role alignment scores for {len(optimized_resumes)} resumes")
+        workers = min(max_workers or LLMKeywordExtractor.MAX_CONCURRENT_REQUESTS, len(optimized_resumes))
+
+        with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+            jd_future = executor.submit(self._extract_job_keywords, job_description)
+            resume_extractions = list(executor.map(self._extract_resume_keywords, optimized_resumes))
+            jd_extraction = jd_future.result()
+
+        return [
+            self._score_extractions(job_description, jd_extraction, resume, resume_extraction)
+            for resume, resume_extraction in zip(optimized_resumes, resume_extractions)
+        ]
+
+    def _extract_job_keywords(self, job_description: str) -> Optional[KeywordExtractionResult]:
+        """Extract job description keywords, or None if extraction fails."""
         try:
             jd_extraction = self.llm_extractor.extract_from_job_description(
                 job_text=job_description,
@@ -55,25 +161,32 @@ class RoleAlignmentScorer(MetricCalculator):
                 preferred_skills=[]
             )
             logger.info(f"Extracted {len(jd_extraction.all_keywords)} keywords from job description")
+            return jd_extraction
         except Exception as e:
             logger.error(f"LLM extraction failed for job description: {e}")
-            # Fallback to technical terms only
-            jd_technical = self._extract_technical_terms(job_description)
-            jd_extraction = None
+            return None
 
-        # Extract keywords from optimized resume using LLM
+    def _extract_resume_keywords(self, optimized_resume: str) -> Optional[KeywordExtractionResult]:
+        """Extract resume keywords, or None if extraction fails."""
         try:
             resume_extraction = self.llm_extractor.extract_from_resume(
                 resume_text=optimized_resume,
                 structured_skills=[]
             )
             logger.info(f"Extracted {len(resume_extraction.all_keywords)} keywords from resume")
+            return resume_extraction
         except Exception as e:
             logger.error(f"LLM extraction failed for resume: {e}")
-            # Fallback to technical terms only
-            resume_technical = self._extract_technical_terms(optimized_resume)
-            resume_extraction = None
+            return None
 
+    def _score_extractions(
+        self,
+        job_description: str,
+        jd_extraction: Optional[KeywordExtractionResult],
+        optimized_resume: str,
+        resume_extraction: Optional[KeywordExtractionResult]
+    ) -> MetricScore:
+        """Score a resume from its and the job description's extractions."""
         # If LLM extraction succeeded, use categorized keyword matching
         if jd_extraction and resume_extraction:
             matched, missing, overall_score = self._calculate_llm_based_score(
@@ -86,23 +199,26 @@ class RoleAlignmentScorer(MetricCalculator):
             if not jd_extraction:
                 jd_technical = self._extract_technical_terms(job_description)
             else:
-                jd_technical = set([k.lower() for k in jd_extraction.tools_technologies])
+                jd_technical = jd_extraction.get_category_sets()[1]
 
             if not resume_extraction:
                 resume_technical = self._extract_technical_terms(optimized_resume)
             else:
-                resume_technical = set([k.lower() for k in resume_extraction.tools_technologies])
+                resume_technical = resume_extraction.get_category_sets()[1]
 
             matched = jd_technical.intersection(resume_technical)
             missing = jd_technical - resume_technical
             overall_score = len(matched) / len(jd_technical) if jd_technical else 1.0
 
+        # Only the first few keywords in sorted order are reported
+        missing_list = heapq.nsmallest(10, missing)
+
         # Generate recommendations
         recommendations = []
         if overall_score < self.threshold:
             if missing:
                 # Show most important missing keywords (limit to 5)
-                top_missing = sorted(list(missing))[:5]
+                top_missing = missing_list[:5]
                 recommendations.append(f"Add these missing keywords: {', '.join(top_missing)}")
             if overall_score < 0.5:
                 recommendations.append("Focus on incorporating more technical terms from the job description")
@@ -113,11 +229,11 @@ class RoleAlignmentScorer(MetricCalculator):
             passed=overall_score >= self.threshold,
             threshold=self.threshold,
             details={
-                "total_jd_keywords": len(jd_extraction.all_keywords) if jd_extraction else len(jd_technical) if 'jd_technical' in locals() else 0,
+                "total_jd_keywords": len(jd_extraction.all_keywords) if jd_extraction else len(jd_technical),
                 "matched_keywords": len(matched),
                 "missing_keywords": len(missing),
-                "matched_list": sorted(list(matched))[:20],  # Top 20 matched
-                "missing_list": sorted(list(missing))[:10],  # Top 10 missing
+                "matched_list": heapq.nsmallest(20, matched),  # Top 20 matched
+                "missing_list": missing_list,  # Top 10 missing
                 "extraction_method": "LLM" if (jd_extraction and resume_extraction) else "Technical-Only"
             },
             recommendations=recommendations
@@ -137,16 +253,10 @@ class RoleAlignmentScorer(MetricCalculator):
         - Certifications: 15%
         - Domain terms: 5%
         """
-        # Convert to sets for comparison (case-insensitive)
-        jd_hard = set([k.lower() for k in jd_extraction.hard_skills])
-        jd_tools = set([k.lower() for k in jd_extraction.tools_technologies])
-        jd_certs = set([k.lower() for k in jd_extraction.certifications])
-        jd_domain = set([k.lower() for k in jd_extraction.domain_terms])
-
-        resume_hard = set([k.lower() for k in resume_extraction.hard_skills])
-        resume_tools = set([k.lower() for k in resume_extraction.tools_technologies])
-        resume_certs = set([k.lower() for k in resume_extraction.certifications])
-        resume_domain = set([k.lower() for k in resume_extraction.domain_terms])
+        # Lowercased sets for comparison (case-insensitive), precomputed by
+        # finalized extractions
+        jd_hard, jd_tools, jd_certs, jd_domain = jd_extraction.get_category_sets()
+        resume_hard, resume_tools, resume_certs, resume_domain = resume_extraction.get_category_sets()
 
         # Calculate match rates for each category
         hard_match_rate = len(jd_hard & resume_hard) / len(jd_hard) if jd_hard else 1.0
@@ -175,6 +285,14 @@ class RoleAlignmentScorer(MetricCalculator):
     def get_threshold(self) -> float:
         return self.threshold
 
+    def _cache_key(self, original_resume: str, optimized_resume: str, job_description: str) -> tuple:
+        # The score does not depend on the original resume
+        return super()._cache_key(None, optimized_resume, job_description)
+
+    def _should_cache_score(self, score: MetricScore) -> bool:
+        # Technical-only scores follow a failed extraction, so retry those
+        return score.details["extraction_method"] == "LLM"
+
     def _extract_keywords(self, text: str) -> Set[str]:
         """
         Extract general keywords (DEPRECATED - use LLM extraction instead).
@@ -182,7 +300,7 @@ class RoleAlignmentScorer(MetricCalculator):
         This fallback method now uses comprehensive stopwords.
         """
         # Extract words 4+ characters, lowercase, alphanumeric
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
+        words = _KEYWORD_RE.findall(text.lower())
 
         # Use comprehensive stopword list (400+ words)
         keywords = {w for w in words if w not in COMPREHENSIVE_STOPWORDS}
@@ -192,54 +310,16 @@ class RoleAlignmentScorer(MetricCalculator):
 
     def _extract_technical_terms(self, text: str) -> Set[str]:
         """Extract technical terms (programming languages, frameworks, tools)."""
-
-        # Common technical terms (expand this list)
-        technical_patterns = [
-            # Programming languages
-            r'\bpython\b', r'\bjava\b', r'\bjavascript\b', r'\btypescript\b',
-            r'\bc\+\+\b', r'\bc#\b', r'\bruby\b', r'\bgo\b', r'\brust\b',
-            r'\bswift\b', r'\bkotlin\b', r'\bphp\b', r'\bscala\b', r'\bc\b',
-
-            # Frameworks
-            r'\breact\b', r'\bangular\b', r'\bvue\b', r'\bdjango\b',
-            r'\bflask\b', r'\bspring\b', r'\bexpress\b', r'\bnode\.?js\b',
-            r'\bnext\.?js\b', r'\btensorflow\b', r'\bpytorch\b', r'\bjquery\b',
-            r'\bbootstrap\b', r'\btailwind\b', r'\b\.net\b', r'\basp\.net\b',
-
-            # Databases
-            r'\bpostgresql\b', r'\bpostgres\b', r'\bmysql\b', r'\bmongodb\b',
-            r'\bredis\b', r'\belasticsearch\b', r'\bcassandra\b', r'\bsql\b',
-            r'\bnosql\b', r'\bsqlite\b', r'\boracle\b', r'\bdynamodb\b',
-
-            # Cloud/DevOps
-            r'\baws\b', r'\bazure\b', r'\bgcp\b', r'\bdocker\b',
-            r'\bkubernetes\b', r'\bk8s\b', r'\bterraform\b', r'\bjenkins\b',
-            r'\bgithub actions\b', r'\bci/cd\b', r'\bansible\b', r'\bhelm\b',
-
-            # Tools & Methodologies
-            r'\bgit\b', r'\blinux\b', r'\bapi\b', r'\brest\b', r'\bgraphql\b',
-            r'\bmicroservices\b', r'\bagile\b', r'\bscrum\b', r'\bkanban\b',
-            r'\bjira\b', r'\bconfluence\b', r'\bslack\b', r'\btrello\b',
-
-            # Data & ML
-            r'\bmachine learning\b', r'\bdeep learning\b', r'\bnlp\b',
-            r'\bdata science\b', r'\bpandas\b', r'\bnumpy\b', r'\bscikit-learn\b',
-            r'\bspark\b', r'\bhadoop\b', r'\bairflow\b', r'\btableauб\b',
-
-            # Testing
-            r'\bpytest\b', r'\bjest\b', r'\bmocha\b', r'\bjunit\b',
-            r'\bselenium\b', r'\bcypress\b', r'\bunit test\b',
-
-            # Other
-            r'\bhtml\b', r'\bcss\b', r'\bsass\b', r'\bwebpack\b',
-            r'\bbabel\b', r'\bnpm\b', r'\byarn\b', r'\bvscode\b'
-        ]
-
         technical_terms = set()
         text_lower = text.lower()
 
-        for pattern in technical_patterns:
-            matches = re.findall(pattern, text_lower)
-            technical_terms.update(matches)
+        # One scan finds every position where some pattern matches; only the
+        # patterns starting with that character are then tried there
+        for found in _TECHNICAL_SCAN_RE.finditer(text_lower):
+            pos = found.start()
+            for pattern in _TECHNICAL_BY_FIRST_CHAR[text_lower[pos]]:
+                match = pattern.match(text_lower, pos)
+                if match:
+                    technical_terms.add(match.group())
 
         return technical_terms
@@ -7,7 +7,7 @@ from enum import Enum
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceItem:
     """Represents a single work experience entry."""
     title: str
@@ -33,7 +33,7 @@ class ExperienceItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EducationItem:
     """Represents a single education entry."""
     degree: str
@@ -57,7 +57,7 @@ class EducationItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeModel:
     """Structured representation of a resume."""
     # Contact Information
@@ -283,7 +283,7 @@ class ResumeModel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRequirement:
     """Represents a single job requirement."""
     description: str
@@ -301,7 +301,7 @@ class JobRequirement:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class JobModel:
     """Structured representation of a job posting."""
     title: str
@@ -376,7 +376,7 @@ class JobModel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMatch:
     """Represents how well a skill matches between job and resume."""
     skill: str
@@ -396,7 +396,7 @@ class SkillMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GapAnalysis:
     """Analysis of gaps between job requirements and resume."""
     # Skill Analysis
@@ -495,7 +495,7 @@ class ChangeStatus(str, Enum):
     EDITED = "edited"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeChange:
     """Represents a single change made to a resume during optimization."""
     id: str
@@ -560,7 +560,7 @@ class ResumeChange:
         return self.status == ChangeStatus.PENDING
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeOptimizationResult:
     """Result of resume optimization process."""
     original_resume: ResumeModel
@@ -3,6 +3,7 @@ Metrics Service
 Orchestrates all metric calculations for resume optimization quality evaluation.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from modules.metrics import (
@@ -91,19 +92,23 @@ class MetricsService:
         Returns:
             MetricsResult with comprehensive scoring
         """
-        # Calculate individual metrics
-        authenticity = self.authenticity_scorer.calculate(
-            original_resume, optimized_resume, job_description
-        )
-        role_alignment = self.role_alignment_scorer.calculate(
-            original_resume, optimized_resume, job_description
-        )
-        ats_optimization = self.ats_scorer.calculate(
-            original_resume, optimized_resume, job_description
-        )
-        length_compliance = self.length_scorer.calculate(
-            original_resume, optimized_resume, job_description
-        )
+        # Calculate individual metrics. Role alignment mostly waits on Claude,
+        # so it runs in a worker thread while the local scorers run here.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            role_alignment_future = executor.submit(
+                self.role_alignment_scorer.calculate,
+                original_resume, optimized_resume, job_description
+            )
+            authenticity = self.authenticity_scorer.calculate(
+                original_resume, optimized_resume, job_description
+            )
+            ats_optimization = self.ats_scorer.calculate(
+                original_resume, optimized_resume, job_description
+            )
+            length_compliance = self.length_scorer.calculate(
+                original_resume, optimized_resume, job_description
+            )
+            role_alignment = role_alignment_future.result()
 
         # Calculate overall metrics
         all_metrics = [authenticity, role_alignment, ats_optimization, length_compliance]
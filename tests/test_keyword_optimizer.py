@@ -0,0 +1,511 @@
+"""Unit tests for keyword optimizer."""
+
+import dataclasses
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+from modules.models import ResumeModel, JobModel, ExperienceItem
+import modules.keyword_optimizer as keyword_optimizer
+from modules.keyword_optimizer import (
+    KeywordOptimizer,
+    KeywordAnalysis,
+    KeywordAnalysisArray,
+    KeywordOptimizationReport,
+    FLAG_REQUIRED,
+    KEYWORD_STATUSES,
+    NUMPY_AVAILABLE,
+    RAPIDFUZZ_AVAILABLE,
+    analyze_keywords,
+    clear_analysis_cache,
+    clear_job_keywords_cache,
+)
+from modules.llm_keyword_extractor import KeywordExtractionResult, LLMKeywordExtractor
+
+
+def make_resume():
+    """Create a small resume for keyword tests."""
+    return ResumeModel(
+        name="Test User",
+        headline="Senior Python Developer",
+        summary="Backend engineer building Python services on AWS.",
+        experiences=[
+            ExperienceItem(
+                title="Software Engineer",
+                company="Acme",
+                bullets=[
+                    "Built REST APIs in Python and Django",
+                    "Deployed services with Docker on AWS",
+                    "Created dashboards for the sales team",
+                ]
+            )
+        ],
+        skills=["Python", "Django", "Docker", "AWS"]
+    )
+
+
+def make_job():
+    """Create a job without raw text so the structured-skills path is used."""
+    return JobModel(
+        title="Backend Engineer",
+        required_skills=["Python", "Kubernetes"],
+        preferred_skills=["React", "Docker"]
+    )
+
+
+def make_keywords(count):
+    """Create a deterministic spread of keyword analyses."""
+    keywords = []
+    for i in range(count):
+        keywords.append(KeywordAnalysis(
+            keyword=f"kw{i}",
+            frequency_in_job=1 + i % 3,
+            frequency_in_resume=i % 7,
+            target_density=(1 + i % 2, 3 + i % 4),
+            current_density=i % 7,
+            is_required=i % 5 == 0,
+            appears_in_summary=i % 2 == 0,
+            appears_in_experience=i % 3 == 0,
+            appears_in_skills=i % 4 == 0,
+            importance_weight=(2.0, 1.0, 0.5)[i % 3]
+        ))
+    return keywords
+
+
+class TestKeywordOptimizer:
+    """Tests for KeywordOptimizer class."""
+
+    def test_analyze_structured_skills(self):
+        """Test analysis of structured job skills."""
+        report = KeywordOptimizer().analyze(make_resume(), make_job())
+
+        by_keyword = {kw.keyword: kw for kw in report.keywords}
+        assert by_keyword["python"].current_density > 0
+        assert by_keyword["python"].is_required
+        assert by_keyword["kubernetes"].status == "missing"
+        assert "kubernetes" in report.critical_missing_keywords
+        assert report.total_keywords_analyzed == len(report.keywords)
+
+    def test_word_boundaries(self):
+        """Test that 'react' is not matched inside 'created'."""
+        report = KeywordOptimizer().analyze(make_resume(), make_job())
+
+        react = next(kw for kw in report.keywords if kw.keyword == "react")
+        assert react.current_density == 0
+
+    def test_compiled_job_matches_analyze(self):
+        """Test that a compiled job gives the same report as analyze()."""
+        optimizer = KeywordOptimizer()
+        compiled_job = optimizer.compile_for_job(make_job())
+
+        assert [kw.keyword for kw in compiled_job.keywords] == ["python", "kubernetes", "react", "docker"]
+
+        direct = optimizer.analyze(make_resume(), make_job())
+        for _ in range(2):
+            report = optimizer.analyze_resume(compiled_job, make_resume())
+            assert report.overall_keyword_score == direct.overall_keyword_score
+            assert [kw.current_density for kw in report.keywords] == \
+                [kw.current_density for kw in direct.keywords]
+
+    def test_analyze_batch(self, monkeypatch):
+        """Test batch analysis compiles the job once and matches analyze()."""
+        optimizer = KeywordOptimizer()
+        other = make_resume()
+        other.skills = ["Kubernetes", "React"]
+
+        extractions = []
+        extract = optimizer._extract_job_keywords
+        monkeypatch.setattr(
+            optimizer, "_extract_job_keywords",
+            lambda job: extractions.append(job) or extract(job)
+        )
+        reports = optimizer.analyze_batch([make_resume(), other], make_job())
+
+        assert len(extractions) == 1
+        for resume, report in zip([make_resume(), other], reports):
+            direct = optimizer.analyze(resume, make_job())
+            assert report.overall_keyword_score == direct.overall_keyword_score
+
+    def test_analyze_many_matches_analyze(self):
+        """Test multi-process analysis returns the same reports in order."""
+        optimizer = KeywordOptimizer()
+        resumes = [make_resume() for _ in range(4)]
+        resumes[1].skills = ["Kubernetes", "React"]
+        resumes[3].summary = "Docker and Kubernetes everywhere."
+
+        reports = optimizer.analyze_many(resumes, make_job(), max_workers=2)
+
+        assert len(reports) == len(resumes)
+        for resume, report in zip(resumes, reports):
+            direct = optimizer.analyze(resume, make_job())
+            assert report.keywords == direct.keywords
+            assert report.overall_keyword_score == pytest.approx(direct.overall_keyword_score)
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_batch_statistics_match_single_analysis(self):
+        """Test matrix-scored batches agree with one-by-one analysis."""
+        optimizer = KeywordOptimizer()
+        optimizer.VECTORIZE_MIN_KEYWORDS = 1
+        resumes = [make_resume() for _ in range(3)]
+        resumes[1].skills = ["Kubernetes", "React"]
+        resumes[2].summary = "Docker and Kubernetes everywhere. Docker, Docker, Docker."
+
+        reports = optimizer.analyze_batch(resumes, make_job())
+
+        for resume, report in zip(resumes, reports):
+            direct = KeywordOptimizer().analyze(resume, make_job())
+            assert report.missing_keywords == direct.missing_keywords
+            assert report.optimal_keywords == direct.optimal_keywords
+            assert report.overstuffed_keywords == direct.overstuffed_keywords
+            assert report.overall_keyword_score == pytest.approx(direct.overall_keyword_score)
+            assert report.critical_missing_keywords == direct.critical_missing_keywords
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_keyword_analysis_array_matches_analyses(self):
+        """Test vectorized status and placement agree with KeywordAnalysis."""
+        analyses = [
+            KeywordAnalysis("a", 1, 0, (1, 2), 0, is_required=True),
+            KeywordAnalysis("b", 1, 1, (2, 3), 1, appears_in_summary=True),
+            KeywordAnalysis("c", 1, 2, (2, 3), 2, appears_in_experience=True, appears_in_skills=True),
+            KeywordAnalysis("d", 1, 5, (2, 3), 5, is_preferred=True, appears_in_summary=True,
+                            appears_in_experience=True, appears_in_skills=True),
+            KeywordAnalysis("e", 1, 2, (3, 1), 2),
+        ]
+
+        arrays = KeywordAnalysisArray.from_analyses(analyses)
+
+        assert [KEYWORD_STATUSES[i] for i in arrays.status_ids] == [kw.status for kw in analyses]
+        assert list(arrays.placement_quality) == [kw.placement_quality for kw in analyses]
+        assert list(arrays.has_flag(FLAG_REQUIRED)) == [True, False, False, False, False]
+        assert list(arrays.keywords) == ["a", "b", "c", "d", "e"]
+
+    @pytest.mark.skipif(not RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+    def test_fuzzy_variation_match(self):
+        """Test that misspelled keywords are counted as variations."""
+        resume = ResumeModel(
+            summary="Operated kubernates clusters in production",
+            skills=["Kubernates"]
+        )
+        job = JobModel(title="SRE", required_skills=["Kubernetes"])
+
+        report = KeywordOptimizer().analyze(resume, job)
+
+        kubernetes = report.keywords[0]
+        assert kubernetes.current_density == 2
+        assert kubernetes.variations_in_resume == ["kubernates"]
+        assert kubernetes.appears_in_summary
+        assert kubernetes.appears_in_skills
+
+    def test_semantic_variation_match(self, monkeypatch):
+        """Test that paraphrased keywords are credited via embeddings."""
+        class FakeModel:
+            def encode(self, texts, normalize_embeddings, convert_to_numpy):
+                topics = [("docker", "container"), ("terraform",)]
+                return np.array([
+                    [float(any(word in t.lower() for word in topic)) for topic in topics] + [0.5]
+                    for t in texts
+                ]) / np.sqrt(1.25)
+
+        monkeypatch.setattr(keyword_optimizer, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(KeywordOptimizer, "_embedding_model", FakeModel())
+        monkeypatch.setattr(KeywordOptimizer, "_term_embeddings", OrderedDict())
+
+        resume = ResumeModel(
+            summary="Platform engineer.",
+            skills=["Container orchestration", "Go"]
+        )
+        job = JobModel(title="SRE", required_skills=["Docker", "Terraform"])
+        report = KeywordOptimizer(semantic_matching=True).analyze(resume, job)
+
+        docker, terraform = report.keywords
+        assert docker.current_density == 1
+        assert docker.variations_in_resume == ["container orchestration"]
+        assert docker.appears_in_skills and not docker.appears_in_summary
+        assert docker.status == "underutilized"
+        assert terraform.status == "missing"
+        assert "docker" in KeywordOptimizer._term_embeddings
+
+    def test_semantic_matching_is_off_by_default(self, monkeypatch):
+        """Test installed sentence-transformers alone never loads a model."""
+        monkeypatch.setattr(keyword_optimizer, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(KeywordOptimizer, "_get_embedding_model", None)
+
+        optimizer = KeywordOptimizer()
+        report = optimizer.analyze(
+            ResumeModel(skills=["Container orchestration"]),
+            JobModel(title="SRE", required_skills=["Docker"])
+        )
+
+        assert not optimizer.semantic_matching
+        assert not optimizer.llm_extractor.semantic_cache
+        assert report.keywords[0].status == "missing"
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_vectorized_statistics_match_loop(self):
+        """Test that NumPy statistics agree with the pure-Python loop."""
+        optimizer = KeywordOptimizer()
+        count = optimizer.VECTORIZE_MIN_KEYWORDS + 10
+
+        loop_report = KeywordOptimizationReport(keywords=make_keywords(count))
+        optimizer.VECTORIZE_MIN_KEYWORDS = count + 1
+        optimizer._calculate_statistics(loop_report)
+
+        vector_report = KeywordOptimizationReport(keywords=make_keywords(count))
+        optimizer.VECTORIZE_MIN_KEYWORDS = count
+        optimizer._calculate_statistics(vector_report)
+
+        assert vector_report.missing_keywords == loop_report.missing_keywords
+        assert vector_report.underutilized_keywords == loop_report.underutilized_keywords
+        assert vector_report.optimal_keywords == loop_report.optimal_keywords
+        assert vector_report.overstuffed_keywords == loop_report.overstuffed_keywords
+        assert vector_report.keyword_coverage_score == pytest.approx(loop_report.keyword_coverage_score)
+        assert vector_report.keyword_density_score == pytest.approx(loop_report.keyword_density_score)
+        assert vector_report.keyword_placement_score == pytest.approx(loop_report.keyword_placement_score)
+        assert vector_report.overall_keyword_score == pytest.approx(loop_report.overall_keyword_score)
+
+    def test_resume_text_cache(self):
+        """Test flattened text is reused until the resume changes."""
+        optimizer = KeywordOptimizer()
+        resume = make_resume()
+
+        text = optimizer._get_resume_text(resume, lower=True)
+        assert optimizer._get_resume_text(resume, lower=True) is text
+        assert optimizer._get_resume_text(resume) != text
+
+        resume.summary = "Kubernetes platform engineer."
+        assert "kubernetes" in optimizer._get_resume_text(resume, lower=True)
+
+        optimizer.OBJECT_CACHE_SIZE = 2
+        for _ in range(3):
+            optimizer._get_resume_text(make_resume())
+        assert len(optimizer._object_cache) == 2
+
+    def test_job_keywords_reused_until_job_changes(self, monkeypatch):
+        """Test analyze() and the heatmap share one keyword extraction per job."""
+        optimizer = KeywordOptimizer()
+        job = make_job()
+
+        extractions = []
+        extract = optimizer._extract_job_keywords_uncached
+        monkeypatch.setattr(
+            optimizer, "_extract_job_keywords_uncached",
+            lambda job: extractions.append(job) or extract(job)
+        )
+
+        optimizer.analyze(make_resume(), job)
+        optimizer.get_keyword_heatmap(make_resume(), job)
+        assert len(extractions) == 1
+
+        job.required_skills = job.required_skills + ["Terraform"]
+        report = optimizer.analyze(make_resume(), job)
+        assert len(extractions) == 2
+        assert "terraform" in [kw.keyword for kw in report.keywords]
+
+    def test_keyword_heatmap(self):
+        """Test heatmap counts in ASCII and non-ASCII sections."""
+        resume = make_resume()
+        resume.summary = "Python engineer at a café; Python everywhere."
+        heatmap = KeywordOptimizer().get_keyword_heatmap(resume, make_job())
+
+        assert heatmap['summary']['python'] == 3
+        assert heatmap['experience']['docker'] == 1
+        assert heatmap['skills']['kubernetes'] == 0
+        assert set(heatmap) == {'summary', 'experience', 'skills', 'education'}
+
+
+class TestKeywordAnalysis:
+    """Tests for KeywordAnalysis dataclass."""
+
+    @pytest.mark.parametrize("density,expected", [
+        (0, "missing"),
+        (1, "underutilized"),
+        (3, "optimal"),
+        (9, "overstuffed"),
+    ])
+    def test_status(self, density, expected):
+        """Test status classification against the target range."""
+        kw = KeywordAnalysis(
+            keyword="python",
+            frequency_in_job=1,
+            frequency_in_resume=density,
+            target_density=(2, 5),
+            current_density=density
+        )
+        assert kw.status == expected
+
+    def test_placement_quality(self):
+        """Test placement quality is derived from section flags."""
+        kw = KeywordAnalysis(
+            keyword="python",
+            frequency_in_job=1,
+            frequency_in_resume=1,
+            target_density=(1, 3),
+            current_density=1,
+            appears_in_summary=True,
+            appears_in_skills=True
+        )
+        assert kw.placement_quality == pytest.approx(0.6)
+
+    def test_derived_fields_follow_replace(self):
+        """Test analyses are immutable and replace() recomputes derived fields."""
+        kw = KeywordAnalysis("python", 1, 0, (1, 3), 0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            kw.current_density = 2
+        updated = dataclasses.replace(kw, current_density=2, appears_in_experience=True)
+
+        assert (kw.status, kw.placement_quality) == ("missing", 0.0)
+        assert updated.status == "optimal"
+        assert updated.placement_quality == pytest.approx(0.4)
+
+
+class TestKeywordMerging:
+    """Tests for keyword deduplication before analysis."""
+
+    def test_merge_duplicate_keywords(self):
+        """Test case and whitespace duplicates are merged with summed weights."""
+        merged = KeywordOptimizer._merge_duplicate_keywords(
+            {"Python": 3, "python ": 1, "AWS": 2, " ": 1}
+        )
+        assert merged == {"python": 4, "aws": 2}
+
+    def test_analyze_job_without_keywords(self):
+        """Test a job with no text or skills yields an empty report."""
+        report = KeywordOptimizer().analyze(make_resume(), JobModel(title="Empty"))
+
+        assert report.keywords == []
+        assert report.total_keywords_analyzed == 0
+        assert report.grade == "F"
+
+    def test_grade_boundaries(self):
+        """Test scores just below a threshold keep the lower grade."""
+        grades = [
+            KeywordOptimizationReport(overall_keyword_score=score).grade
+            for score in (0.8999999999999999, 0.9, 0.7999999999999999, 0.8, 0.6, 0.5999999999999999, 1.0)
+        ]
+
+        assert grades == ["B", "A", "C", "B", "D", "F", "A"]
+
+
+class TestAnalysisCache:
+    """Tests for analyze_keywords() memoization."""
+
+    def test_repeated_analysis_is_cached(self, monkeypatch):
+        """Test unchanged inputs are analyzed only once."""
+        clear_analysis_cache()
+        calls = []
+        original_analyze = KeywordOptimizer.analyze
+
+        def counting_analyze(self, *args, **kwargs):
+            calls.append(args)
+            return original_analyze(self, *args, **kwargs)
+
+        monkeypatch.setattr(KeywordOptimizer, "analyze", counting_analyze)
+
+        first = analyze_keywords(make_resume(), make_job())
+        second = analyze_keywords(make_resume(), make_job())
+        assert len(calls) == 1
+        assert second.overall_keyword_score == first.overall_keyword_score
+
+        # Callers get independent copies
+        second.keywords.clear()
+        assert analyze_keywords(make_resume(), make_job()).keywords
+
+        # Any input change misses the cache
+        analyze_keywords(make_resume(), make_job(), target_density=2.0)
+        assert len(calls) == 2
+        clear_analysis_cache()
+
+    def test_fallback_analysis_is_not_cached(self, monkeypatch):
+        """Test reports from rule-based job keywords are redone next time."""
+        clear_analysis_cache()
+        calls = []
+        original_analyze = KeywordOptimizer.analyze
+
+        def counting_analyze(self, *args, **kwargs):
+            calls.append(args)
+            return original_analyze(self, *args, **kwargs)
+
+        monkeypatch.setattr(KeywordOptimizer, "analyze", counting_analyze)
+        monkeypatch.setattr(
+            LLMKeywordExtractor, "extract_from_job_description",
+            lambda self, job_text, required_skills, preferred_skills:
+                KeywordExtractionResult(hard_skills=["Python"], is_llm_extracted=False)
+        )
+        job = make_job()
+        job.raw_text = "We need Python engineers."
+
+        analyze_keywords(make_resume(), job)
+        analyze_keywords(make_resume(), job)
+
+        assert len(calls) == 2
+        clear_analysis_cache()
+
+    def test_llm_job_keywords_cached_by_content(self, monkeypatch):
+        """Test identical job postings share one LLM extraction."""
+        clear_job_keywords_cache()
+        optimizer = KeywordOptimizer()
+        calls = []
+
+        def fake_extract(job_text, required_skills, preferred_skills):
+            calls.append(job_text)
+            return KeywordExtractionResult(hard_skills=["Python"], is_llm_extracted=True)
+
+        monkeypatch.setattr(optimizer.llm_extractor, "extract_from_job_description", fake_extract)
+
+        job = make_job()
+        job.raw_text = "We need Python engineers."
+        same_job = make_job()
+        same_job.raw_text = "We need Python engineers."
+
+        assert optimizer._extract_job_keywords(job) == {"python": 3}
+        assert optimizer._extract_job_keywords(same_job) == {"python": 3}
+        assert len(calls) == 1
+
+        same_job.raw_text = "We need Go engineers."
+        optimizer._extract_job_keywords(same_job)
+        assert len(calls) == 2
+        clear_job_keywords_cache()
+
+    def test_near_duplicate_job_reuses_keywords(self, monkeypatch):
+        """Test reworded postings with the same skills skip the LLM."""
+        class FakeModel:
+            def encode(self, texts, normalize_embeddings, convert_to_numpy):
+                return np.array([[1.0, 0.0] if "python" in t.lower() else [0.0, 1.0] for t in texts])
+
+        clear_job_keywords_cache()
+        monkeypatch.setattr(keyword_optimizer, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(KeywordOptimizer, "_embedding_model", FakeModel())
+        optimizer = KeywordOptimizer(semantic_matching=True)
+        calls = []
+
+        def fake_extract(job_text, required_skills, preferred_skills):
+            calls.append(job_text)
+            return KeywordExtractionResult(hard_skills=["Python"], is_llm_extracted=True)
+
+        monkeypatch.setattr(optimizer.llm_extractor, "extract_from_job_description", fake_extract)
+
+        job = make_job()
+        job.raw_text = "We need Python engineers."
+        optimizer._extract_job_keywords(job)
+
+        reworded = make_job()
+        reworded.raw_text = "Python engineers needed!"
+        assert optimizer._extract_job_keywords(reworded) == {"python": 3}
+        assert len(calls) == 1
+
+        # Different skill lists never share keywords
+        reworded.required_skills = ["Python"]
+        optimizer._extract_job_keywords(reworded)
+        assert len(calls) == 2
+
+        # Nor do postings without skills, or any posting unless enabled
+        unskilled = JobModel(title="Backend Engineer", raw_text="Hiring Python engineers.")
+        optimizer._extract_job_keywords(unskilled)
+        unskilled.raw_text = "Hiring Python engineers now."
+        optimizer._extract_job_keywords(unskilled)
+        optimizer.semantic_matching = False
+        reworded.raw_text = "Python engineers wanted."
+        optimizer._extract_job_keywords(reworded)
+        assert len(calls) == 5
+        clear_job_keywords_cache()
@@ -0,0 +1,386 @@
+"""Unit tests for LLM keyword extractor."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import modules.llm_keyword_extractor as llm_keyword_extractor
+from modules.llm_keyword_extractor import (
+    KeywordExtractionResult,
+    LLMKeywordExtractor,
+    clear_llm_result_cache,
+)
+
+
+class FakeClient:
+    """Anthropic client stand-in that records calls and returns fixed keywords."""
+
+    def __init__(self):
+        self.calls = []
+        self.batch_requests = []
+        self.cancelled = []
+        self.messages = SimpleNamespace(
+            create=self.create,
+            batches=SimpleNamespace(
+                create=self.create_batch,
+                retrieve=lambda batch_id: SimpleNamespace(id=batch_id, processing_status="ended"),
+                results=self.batch_results,
+                cancel=self.cancelled.append
+            )
+        )
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        payload = {"hard_skills": ["Kubernetes"], "tools_technologies": ["Docker"]}
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(payload))])
+
+    def create_batch(self, requests):
+        self.batch_requests = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    def batch_results(self, batch_id):
+        # Results arrive out of order; the second item errored
+        for request in reversed(self.batch_requests):
+            if request["custom_id"] == "item_1":
+                yield SimpleNamespace(custom_id="item_1", result=SimpleNamespace(type="errored"))
+                continue
+            text = request["params"]["messages"][0]["content"][0]["text"]
+            payload = {"hard_skills": [text.split()[-1].rstrip(".")]}
+            message = SimpleNamespace(content=[SimpleNamespace(text=json.dumps(payload))])
+            yield SimpleNamespace(
+                custom_id=request["custom_id"],
+                result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+
+class FakeAsyncClient:
+    """Async Anthropic client stand-in that tracks concurrent calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.messages = SimpleNamespace(create=self.create)
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        text = kwargs["messages"][0]["content"][0]["text"]
+        payload = {"hard_skills": [text.split()[-1].rstrip(".")]}
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(payload))])
+
+
+def make_llm_extractor():
+    """Create an extractor that talks to FakeClient."""
+    extractor = LLMKeywordExtractor()
+    extractor.client = FakeClient()
+    return extractor
+
+
+@pytest.fixture(autouse=True)
+def empty_llm_result_cache():
+    """Isolate tests from each other's cached Claude results."""
+    clear_llm_result_cache()
+    yield
+    clear_llm_result_cache()
+
+
+class TestRuleBasedExtraction:
+    """Tests for the rule-based fallback extraction."""
+
+    def test_technical_terms(self):
+        """Test technical terms are found with word boundaries."""
+        extractor = LLMKeywordExtractor()
+        result = extractor._extract_with_rules(
+            "Built Python services with Django and Node.js on AWS.", None, None
+        )
+
+        assert {"python", "django", "node.js", "aws"} <= set(result.tools_technologies)
+        assert "java" not in result.tools_technologies
+        assert not result.is_llm_extracted
+
+    def test_overlapping_technical_terms(self):
+        """Test terms inside longer matching terms are still reported."""
+        extractor = LLMKeywordExtractor()
+        result = extractor._extract_with_rules(
+            "AWS Certified engineer shipping ASP.NET and GitHub Actions.", None, None
+        )
+
+        assert {"aws certified", "aws", "asp.net", ".net", "github actions", "github"} <= set(
+            result.tools_technologies
+        )
+
+    def test_structured_skills_and_stopwords(self):
+        """Test structured skills are merged and stopwords dropped."""
+        extractor = LLMKeywordExtractor()
+        result = extractor._extract_with_rules(
+            "Candidate with excellent leadership and terraform pipelines.",
+            ["GraphQL"],
+            ["Rust"]
+        )
+
+        assert {"graphql", "rust", "terraform", "leadership"} <= set(result.all_keywords)
+        assert "excellent" not in result.all_keywords
+        assert result.hard_skills == ["GraphQL"]
+
+
+class TestKeywordExtractionResult:
+    """Tests for the extraction result container."""
+
+    def test_weighted_keywords(self):
+        """Test category weights add up per lowercased keyword."""
+        result = KeywordExtractionResult(
+            hard_skills=["Python"],
+            tools_technologies=["python", "Docker"],
+            certifications=["CKA"],
+            soft_skills=["Leadership"]
+        )
+
+        expected = {"python": 6, "docker": 3, "cka": 2, "leadership": 1}
+        assert result.get_weighted_keywords() == expected
+        assert result.finalize().get_weighted_keywords() == expected
+
+    def test_finalized_weights_are_copies(self):
+        """Test callers cannot alter the precomputed weights."""
+        result = KeywordExtractionResult(hard_skills=["Python"]).finalize()
+
+        result.get_weighted_keywords()["python"] = 100
+
+        assert result.get_weighted_keywords() == {"python": 3}
+
+    def test_category_sets(self):
+        """Test categories are lowercased into sets, before and after finalize."""
+        result = KeywordExtractionResult(
+            hard_skills=["Python", "python"],
+            tools_technologies=["Docker"],
+            soft_skills=["Leadership"]
+        )
+        expected = ({"python"}, {"docker"}, set(), set())
+
+        assert result.get_category_sets() == expected
+        finalized = result.finalize()
+        assert finalized.get_category_sets() == expected
+        assert finalized.get_category_sets() is finalized.get_category_sets()
+
+
+class TestLLMResultCache:
+    """Tests for reuse of Claude extraction results."""
+
+    def test_near_duplicate_text_reuses_result(self, monkeypatch):
+        """Test a reworded text with the same skills skips the Claude call."""
+        class FakeModel:
+            def encode(self, texts, normalize_embeddings, convert_to_numpy):
+                return np.array([
+                    [1.0, 0.0] if "kubernetes" in text.lower() else [0.0, 1.0]
+                    for text in texts
+                ])
+
+        monkeypatch.setattr(llm_keyword_extractor, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(LLMKeywordExtractor, "_embedding_model", FakeModel())
+        extractor = make_llm_extractor()
+        extractor.semantic_cache = True
+
+        first = extractor.extract_from_job_description("Run Kubernetes clusters.", ["Docker"])
+        second = extractor.extract_from_job_description("Operate Kubernetes clusters!", ["Docker"])
+        extractor.extract_from_job_description("Operate Kubernetes clusters!", ["Helm"])
+        extractor.extract_from_job_description("Write React apps.", ["Docker"])
+
+        assert len(extractor.client.calls) == 3
+        assert second.all_keywords == first.all_keywords
+        assert second.is_llm_extracted
+        second.all_keywords.append("mutated")
+        third = extractor.extract_from_job_description("Kubernetes clusters", ["Docker"])
+        assert "mutated" not in third.all_keywords
+
+    def test_semantic_reuse_is_opt_in_and_job_only(self, monkeypatch):
+        """Test near-duplicate resumes, or any text by default, call Claude again."""
+        class FailingModel:
+            def encode(self, texts, normalize_embeddings, convert_to_numpy):
+                raise AssertionError("embedding model used")
+
+        monkeypatch.setattr(llm_keyword_extractor, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(LLMKeywordExtractor, "_embedding_model", FailingModel())
+        extractor = make_llm_extractor()
+
+        extractor.extract_from_job_description("Run Kubernetes clusters.", ["Docker"])
+        extractor.extract_from_job_description("Operate Kubernetes clusters!", ["Docker"])
+        extractor.semantic_cache = True
+        extractor.extract_from_resume("Ran Kubernetes clusters.", ["Docker"])
+        extractor.extract_from_resume("Operated Kubernetes clusters!", ["Docker"])
+
+        assert len(extractor.client.calls) == 4
+
+    def test_identical_text_reuses_result(self):
+        """Test repeated identical inputs call Claude once."""
+        extractor = make_llm_extractor()
+
+        first = extractor.extract_from_resume("Kubernetes and Docker", ["Docker"])
+        second = extractor.extract_from_resume("Kubernetes and Docker", ["Docker"])
+        extractor.extract_from_resume("Kubernetes and Docker", ["Helm"])
+        extractor.extract_from_job_description("Kubernetes and Docker", ["Docker"])
+
+        assert len(extractor.client.calls) == 3
+        assert second.to_dict() == first.to_dict()
+        assert second is not first
+
+
+class TestLLMPrompts:
+    """Tests for the requests sent to Claude."""
+
+    def test_prompt_marks_stable_prefix_for_caching(self):
+        """Test the system prompt and document text are cacheable blocks."""
+        extractor = make_llm_extractor()
+
+        extractor.extract_from_job_description("Run Kubernetes clusters.", ["Docker"])
+
+        call = extractor.client.calls[0]
+        assert call["system"][0]["cache_control"] == {"type": "ephemeral"}
+        document, instructions = call["messages"][0]["content"]
+        assert document["text"] == "Job Description:\nRun Kubernetes clusters."
+        assert document["cache_control"] == {"type": "ephemeral"}
+        assert "Docker" in instructions["text"]
+        assert "cache_control" not in instructions
+
+    def test_prompt_skills_are_canonical(self):
+        """Test duplicate and reordered skills produce one prompt and one call."""
+        extractor = make_llm_extractor()
+
+        extractor.extract_from_job_description("Run clusters.", ["Kubernetes", " docker", "Docker", ""])
+        extractor.extract_from_job_description("Run clusters.", ["docker", "Kubernetes"])
+
+        assert len(extractor.client.calls) == 1
+        instructions = extractor.client.calls[0]["messages"][0]["content"][1]["text"]
+        assert "Pre-identified Required Skills: docker, Kubernetes\n" in instructions
+
+
+class TestBatchExtraction:
+    """Tests for Message Batches API extraction."""
+
+    def test_extract_batch_preserves_order(self, monkeypatch):
+        """Test batch results map back to their items, with rule fallback."""
+        monkeypatch.setattr(LLMKeywordExtractor, "BATCH_POLL_INTERVAL", 0)
+        extractor = make_llm_extractor()
+
+        results = extractor.extract_batch([
+            ("Must know Terraform.", "job_description", {'required': [], 'preferred': []}),
+            ("Wrote Python and Django.", "resume", {'existing': ["Django"]}),
+            ("Expert in Rust.", "resume", {'existing': []}),
+        ])
+
+        assert len(extractor.client.batch_requests) == 3
+        assert [r.hard_skills for r in results] == [["Terraform"], ["Django"], ["Rust"]]
+        assert [r.is_llm_extracted for r in results] == [True, False, True]
+        assert "python" in results[1].tools_technologies
+
+
+    def test_extract_batch_without_batches_api_warns(self, caplog):
+        """Test an SDK without Message Batches falls back with a warning."""
+        extractor = make_llm_extractor()
+        extractor.client.messages = SimpleNamespace(create=extractor.client.create)
+
+        with caplog.at_level("WARNING"):
+            results = extractor.extract_batch([("Wrote Python.", "resume", {'existing': []})])
+
+        assert not results[0].is_llm_extracted
+        assert "Message Batches API" in caplog.text
+
+    def test_extract_batch_cancels_batch_after_max_wait(self, monkeypatch):
+        """Test a batch that outlives BATCH_MAX_WAIT is cancelled and items extracted singly."""
+        monkeypatch.setattr(LLMKeywordExtractor, "BATCH_POLL_INTERVAL", 0)
+        monkeypatch.setattr(LLMKeywordExtractor, "BATCH_MAX_WAIT", 0)
+        extractor = make_llm_extractor()
+
+        results = extractor.extract_batch([
+            ("Must know Terraform.", "job_description", {'required': [], 'preferred': []}),
+            ("Expert in Rust.", "resume", {'existing': []}),
+        ])
+
+        assert extractor.client.cancelled == ["batch_1"]
+        assert len(extractor.client.calls) == 2
+        assert [r.hard_skills for r in results] == [["Kubernetes"], ["Kubernetes"]]
+        assert all(r.is_llm_extracted for r in results)
+
+    def test_extract_batch_submits_unique_uncached_items(self, monkeypatch):
+        """Test duplicates and cached items are not sent in the batch."""
+        monkeypatch.setattr(LLMKeywordExtractor, "BATCH_POLL_INTERVAL", 0)
+        extractor = make_llm_extractor()
+        extractor.extract_from_resume("Expert in Go.", [])
+        job = ("Must know Terraform.", "job_description", {'required': ["AWS"]})
+
+        results = extractor.extract_batch([
+            job,
+            ("Expert in Go.", "resume", {'existing': []}),
+            job,
+            ("Must know Terraform.", "job_description", {'required': ["GCP"]}),
+        ])
+
+        assert [r["custom_id"] for r in extractor.client.batch_requests] == ["item_0", "item_3"]
+        assert [r.hard_skills for r in results] == [["Terraform"], ["Kubernetes"], ["Terraform"], ["Terraform"]]
+        assert results[2] is not results[0]
+        assert extractor.extract_batch([job])[0].hard_skills == ["Terraform"]
+        assert len(extractor.client.batch_requests) == 2
+
+
+class TestAsyncExtraction:
+    """Tests for concurrent extraction with the async client."""
+
+    def test_extract_pair_runs_concurrently(self):
+        """Test job and resume extraction overlap and return in order."""
+        extractor = make_llm_extractor()
+        extractor.async_client = FakeAsyncClient()
+
+        job_result, resume_result = asyncio.run(extractor.extract_pair(
+            "Must know Terraform.", "Built services in Rust.", ["Terraform"]
+        ))
+
+        assert job_result.hard_skills == ["Terraform"]
+        assert resume_result.hard_skills == ["Rust"]
+        assert extractor.async_client.max_active == 2
+        assert extractor.client.calls == []
+
+    def test_async_requests_are_capped(self, monkeypatch):
+        """Test in-flight async calls never exceed MAX_CONCURRENT_REQUESTS."""
+        monkeypatch.setattr(LLMKeywordExtractor, "MAX_CONCURRENT_REQUESTS", 2)
+        extractor = make_llm_extractor()
+        extractor.async_client = FakeAsyncClient()
+
+        async def extract_all():
+            return await asyncio.gather(*[
+                extractor.extract_from_resume_async(f"Resume number {i}.") for i in range(6)
+            ])
+
+        results = asyncio.run(extract_all())
+        clear_llm_result_cache()
+        rerun = asyncio.run(extract_all())
+
+        assert [r.hard_skills for r in results] == [[str(i)] for i in range(6)]
+        assert [r.hard_skills for r in rerun] == [[str(i)] for i in range(6)]
+        assert extractor.async_client.max_active == 2
+
+
+
+class TestClientSharing:
+    """Tests for reuse of Anthropic clients across extractors."""
+
+    @pytest.mark.skipif(not llm_keyword_extractor.ANTHROPIC_AVAILABLE, reason="anthropic not installed")
+    def test_extractors_share_client_per_api_key(self):
+        """Test extractors with one API key share a client, other keys do not."""
+        first = LLMKeywordExtractor(api_key="test-key-1")
+        second = LLMKeywordExtractor(api_key="test-key-1")
+        other = LLMKeywordExtractor(api_key="test-key-2")
+
+        assert first.client is second.client
+        assert other.client is not first.client
+
+        async def async_clients():
+            return first._get_async_client(), second._get_async_client(), other._get_async_client()
+
+        first_async, second_async, other_async = asyncio.run(async_clients())
+        assert first_async is second_async
+        assert other_async is not first_async
+        assert asyncio.run(async_clients())[0] is not first_async
@@ -4,6 +4,9 @@ Tests for metrics framework.
 Tests the quantitative metrics system for evaluating resume optimization quality.
 """
 
+import threading
+from types import SimpleNamespace
+
 import pytest
 from modules.metrics import (
     MetricScore,
@@ -12,6 +15,8 @@ from modules.metrics import (
     ATSScorer,
     LengthScorer
 )
+from modules.metrics.base import resume_view
+from modules.llm_keyword_extractor import KeywordExtractionResult
 from services.metrics_service import MetricsService, MetricsResult
 
 
@@ -102,6 +107,96 @@ class TestMetricScore:
         assert result['passed'] is True
 
 
+class TestResumeView:
+    """Test the shared resume text view."""
+
+    def test_view_is_shared_per_text(self):
+        """Test scorers handed the same text get one view."""
+        text = "Led \u0130stanbul team, led engineers"
+        view = resume_view(text)
+
+        assert resume_view(text) is view
+        assert view.word_count == 5
+        assert view.lower_word_counts['led'] == 2
+        assert view.lower == text.lower()
+
+
+class TestScoreCache:
+    """Test caching of scorer results."""
+
+    def test_repeated_calculation_returns_cached_copy(self, monkeypatch):
+        """Test a repeated calculation reuses the score without sharing it."""
+        scorer = ATSScorer()
+        calls = []
+        monkeypatch.setattr(scorer, "_calculate_format_score", lambda resume: calls.append(resume) or 1.0)
+
+        first = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+        first.details['format_score'] = 0.0
+        second = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+
+        assert len(calls) == 1
+        assert second.details['format_score'] == 1.0
+        assert second is not first
+
+    def test_cache_key_includes_settings(self):
+        """Test changed settings are not served stale scores."""
+        scorer = LengthScorer(target_pages=2)
+        long_resume = "word " * 700
+
+        within = scorer.calculate(SAMPLE_ORIGINAL_RESUME, long_resume, SAMPLE_JOB_DESCRIPTION)
+        scorer.target_pages = 1
+        exceeds = scorer.calculate(SAMPLE_ORIGINAL_RESUME, long_resume, SAMPLE_JOB_DESCRIPTION)
+
+        assert within.score == 1.0
+        assert exceeds.score < 1.0
+
+    def test_role_alignment_reuses_extractions(self):
+        """Test repeated role alignment skips extraction, whatever the original resume."""
+        scorer = RoleAlignmentScorer()
+        calls = []
+
+        def extract(**kwargs):
+            calls.append(kwargs)
+            return KeywordExtractionResult(hard_skills=["Python"])
+
+        scorer.llm_extractor = SimpleNamespace(
+            extract_from_job_description=extract,
+            extract_from_resume=extract
+        )
+
+        first = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+        second = scorer.calculate("", SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+        scorer.threshold = 0.99
+        scorer.calculate("", SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+
+        assert len(calls) == 4
+        assert second.to_dict() == first.to_dict()
+
+    def test_role_alignment_retries_failed_extraction(self):
+        """Test technical-only fallback scores are not cached."""
+        scorer = RoleAlignmentScorer()
+        calls = []
+
+        def extract(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise RuntimeError("transient failure")
+            return KeywordExtractionResult(hard_skills=["Python"])
+
+        scorer.llm_extractor = SimpleNamespace(
+            extract_from_job_description=extract,
+            extract_from_resume=extract
+        )
+
+        first = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+        second = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+        scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+
+        assert first.details["extraction_method"] == "Technical-Only"
+        assert second.details["extraction_method"] == "LLM"
+        assert len(calls) == 4
+
+
 class TestAuthenticityScorer:
     """Test AuthenticityScorer."""
 
@@ -143,6 +238,37 @@ class TestAuthenticityScorer:
         # Should detect red flags
         assert result.details.get('red_flags_count', 0) > 0
 
+    def test_authenticity_fact_terms(self):
+        """Test tech and role terms are found case-insensitively in any text."""
+        scorer = AuthenticityScorer()
+        text = "Lead ENGINEER using python, Machine Learning and APIs"
+
+        facts = scorer._extract_facts(text)
+        accented = scorer._extract_facts(text + " at Caf\u00e9")
+
+        assert {'lead', 'engineer', 'python', 'machine learning'} <= facts
+        assert 'api' not in facts
+        assert facts <= accented
+
+    def test_authenticity_claims_dedupe_sentences(self):
+        """Test repeated metric sentences are claimed once, bullets as listed."""
+        scorer = AuthenticityScorer()
+
+        claims = scorer._extract_claims("Led 5 engineers. Led 5 engineers!\n- Grew sales\n- Grew sales")
+
+        assert claims == ['Grew sales', 'Grew sales', 'Led 5 engineers', '- Grew sales\n- Grew sales']
+
+    def test_authenticity_red_flags_reuse_original_terms(self):
+        """Test red flags match whether or not original terms are passed in."""
+        scorer = AuthenticityScorer()
+        optimized = SAMPLE_OPTIMIZED_RESUME + "\n- Grew revenue 3 4 5 6 7 8 9 times, 90% faster"
+        terms = scorer._extract_numbers_and_caps(SAMPLE_ORIGINAL_RESUME)
+
+        red_flags = scorer._detect_red_flags(SAMPLE_ORIGINAL_RESUME, optimized)
+
+        assert any("new numbers" in flag for flag in red_flags)
+        assert scorer._detect_red_flags(SAMPLE_ORIGINAL_RESUME, optimized, terms) == red_flags
+
 
 class TestRoleAlignmentScorer:
     """Test RoleAlignmentScorer."""
@@ -189,6 +315,59 @@ class TestRoleAlignmentScorer:
         # Optimized should score higher
         assert result_optimized.score > result_original.score
 
+    def test_role_alignment_extracts_concurrently(self):
+        """Test job and resume extraction run at the same time."""
+        scorer = RoleAlignmentScorer()
+        jd_started, resume_started = threading.Event(), threading.Event()
+
+        def extract_job(job_text, required_skills, preferred_skills):
+            jd_started.set()
+            assert resume_started.wait(timeout=5)
+            return KeywordExtractionResult(hard_skills=["Python", "Go"])
+
+        def extract_resume(resume_text, structured_skills):
+            resume_started.set()
+            assert jd_started.wait(timeout=5)
+            return KeywordExtractionResult(hard_skills=["python"])
+
+        scorer.llm_extractor = SimpleNamespace(
+            extract_from_job_description=extract_job,
+            extract_from_resume=extract_resume
+        )
+
+        result = scorer.calculate(SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION)
+
+        assert result.details["matched_list"] == ["python"]
+        assert result.details["missing_list"] == ["go"]
+
+    def test_role_alignment_batch_extracts_job_once(self):
+        """Test batch scoring extracts the job once and keeps resume order."""
+        scorer = RoleAlignmentScorer()
+        job_calls = []
+
+        def extract_job(job_text, required_skills, preferred_skills):
+            job_calls.append(job_text)
+            return KeywordExtractionResult(hard_skills=["Python", "Go"])
+
+        def extract_resume(resume_text, structured_skills):
+            if resume_text == "broken":
+                raise RuntimeError("extraction failed")
+            return KeywordExtractionResult(hard_skills=resume_text.split())
+
+        scorer.llm_extractor = SimpleNamespace(
+            extract_from_job_description=extract_job,
+            extract_from_resume=extract_resume
+        )
+
+        results = scorer.calculate_batch(["Python", "Go python", "Rust", "broken"], SAMPLE_JOB_DESCRIPTION)
+
+        assert job_calls == [SAMPLE_JOB_DESCRIPTION]
+        assert [r.score for r in results[:3]] == [
+            pytest.approx(0.8), pytest.approx(1.0), pytest.approx(0.6)
+        ]
+        assert results[3].details["extraction_method"] == "Technical-Only"
+        assert scorer.calculate_batch([], SAMPLE_JOB_DESCRIPTION) == []
+
     def test_role_alignment_keyword_extraction(self):
         """Test keyword extraction from job description."""
         scorer = RoleAlignmentScorer()
@@ -203,6 +382,14 @@ class TestRoleAlignmentScorer:
         assert 'python' in tech_terms
         assert 'aws' in tech_terms or 'docker' in tech_terms
 
+    def test_role_alignment_overlapping_technical_terms(self):
+        """Test terms inside longer matching terms are still reported."""
+        scorer = RoleAlignmentScorer()
+
+        tech_terms = scorer._extract_technical_terms("Shipped ASP.NET, C++ and NodeJS; no Golang.")
+
+        assert tech_terms == {'asp.net', '.net', 'c', 'nodejs'}
+
 
 class TestATSScorer:
     """Test ATSScorer."""
@@ -242,6 +429,19 @@ class TestATSScorer:
         assert 'keyword_density_pct' in result.details
         assert isinstance(result.details['keyword_density_pct'], (int, float))
 
+    def test_ats_keyword_density_counts_whole_words(self):
+        """Test keyword density only counts whole-word keyword matches."""
+        scorer = ATSScorer()
+
+        pct = scorer._get_keyword_density_pct(
+            "Python, python3 and PYTHON pythonic work", "Python developer"
+        )
+
+        # 2 of 6 words are the keyword "python"
+        assert pct == pytest.approx(100 * 2 / 6)
+        assert scorer._get_keyword_density_pct("Python developer", "") == 0.0
+        assert scorer._get_keyword_density_pct("", "Python developer") == 0.0
+
     def test_ats_structure_score(self):
         """Test structure scoring."""
         scorer = ATSScorer()
@@ -256,6 +456,39 @@ class TestATSScorer:
         assert 'structure_score' in result.details
         assert 'has_standard_sections' in result.details
 
+    def test_ats_keywords_shared_per_job_description(self):
+        """Test JD keywords are extracted once and shared across scorers."""
+        keywords = ATSScorer()._extract_keywords(SAMPLE_JOB_DESCRIPTION)
+
+        assert {'python', 'docker', 'kubernetes'} <= keywords
+        assert 'with' not in keywords
+        assert ATSScorer()._extract_keywords(SAMPLE_JOB_DESCRIPTION) is keywords
+
+    def test_ats_format_score_penalties(self):
+        """Test special and non-ASCII characters are penalized in any text."""
+        scorer = ATSScorer()
+
+        assert scorer._calculate_format_score("Python, Go (APIs): done!") == 1.0
+        assert scorer._calculate_format_score("Python | Go") == pytest.approx(0.999)
+        assert scorer._calculate_format_score("Python \u2192 Go") == pytest.approx(0.998)
+        assert scorer._calculate_format_score("Name\t\tRole") == pytest.approx(0.95)
+
+    def test_ats_avg_sentence_length(self):
+        """Test blank text between terminators is not counted as a sentence."""
+        scorer = ATSScorer()
+
+        assert scorer._get_avg_sentence_length("One two three. Four five!  ?\n Six") == 2.0
+        assert scorer._get_avg_sentence_length(" ... !") == 0.0
+
+    def test_ats_standard_sections(self):
+        """Test section detection and the structure score built on it."""
+        scorer = ATSScorer()
+
+        sections = scorer._has_standard_sections("WORK HISTORY\n...\nTechnical Skills: Python")
+
+        assert sections == {'experience': True, 'education': False, 'skills': True, 'summary': False}
+        assert scorer._calculate_structure_score(sections) == 0.60
+
 
 class TestLengthScorer:
     """Test LengthScorer."""
@@ -306,6 +539,14 @@ class TestLengthScorer:
         assert 'total_words' in result.details
         assert 'total_characters' in result.details
 
+    def test_length_text_stats(self):
+        """Test character, word and line counts feed the page estimate."""
+        scorer = LengthScorer()
+        text = "Senior Engineer\n- Led 5 engineers\n"
+
+        assert scorer._text_stats(text) == (len(text), 5, 3)
+        assert scorer._estimate_pages(text) == scorer._pages_from_stats(len(text), 5, 3)
+
 
 class TestMetricsService:
     """Test MetricsService."""
@@ -355,6 +596,30 @@ class TestMetricsService:
         assert isinstance(result.failed_metrics, list)
         assert isinstance(result.recommendations, list)
 
+    def test_role_alignment_overlaps_local_scorers(self, monkeypatch):
+        """Test role alignment runs alongside the other scorers."""
+        service = MetricsService()
+        started = threading.Event()
+        calculate = service.role_alignment_scorer.calculate
+
+        def slow_role_alignment(*args):
+            started.set()
+            return calculate(*args)
+
+        def ats_after_role_alignment_started(*args):
+            assert started.wait(timeout=5)
+            return MetricScore("ATS Optimization", 1.0, True, 0.8, {}, [])
+
+        monkeypatch.setattr(service.role_alignment_scorer, "calculate", slow_role_alignment)
+        monkeypatch.setattr(service.ats_scorer, "calculate", ats_after_role_alignment_started)
+
+        result = service.calculate_all_metrics(
+            SAMPLE_ORIGINAL_RESUME, SAMPLE_OPTIMIZED_RESUME, SAMPLE_JOB_DESCRIPTION
+        )
+
+        assert result.role_alignment.name == "Role Alignment"
+        assert result.ats_optimization.score == 1.0
+
     def test_metrics_result_to_dict(self):
         """Test converting MetricsResult to dict."""
         service = MetricsService()
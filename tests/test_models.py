@@ -124,6 +124,14 @@ class TestResumeModel:
         assert len(resume2.experiences) == 1
         assert resume2.experiences[0].title == "Dev"
 
+    def test_slotted(self):
+        """Test resumes use slots instead of a per-instance __dict__."""
+        resume = ResumeModel(name="Jane Smith")
+
+        assert not hasattr(resume, "__dict__")
+        with pytest.raises(AttributeError):
+            resume.nickname = "Jay"
+
 
 class TestJobModel:
     """Tests for JobModel."""